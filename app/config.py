@@ -2,6 +2,9 @@
 
 import os
 import logging
+import pickle
+import tempfile
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +13,12 @@ from dotenv import load_dotenv
 
 from app.exceptions import ConfigurationError
 
-# ロギング設定
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# libyamlのCバインディングがあれば使用（純Python実装より高速）
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - libyaml未インストール環境
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +28,7 @@ class Config:
     # 基本パス
     BASE_DIR = Path(__file__).parent.parent
     CONFIG_DIR = BASE_DIR / "config"
+    CACHE_DIR = CONFIG_DIR / ".cache"
 
     # 環境変数（必須）
     REQUIRED_ENV_VARS = [
@@ -36,6 +41,17 @@ class Config:
         "GOOGLE_SHEETS_ID",
     ]
 
+    # 環境変数由来のキャッシュ済みプロパティ（refresh()で破棄）
+    ENV_CACHED_PROPERTIES = (
+        "flask_env",
+        "secret_key",
+        "anthropic_api_key",
+        "google_sheets_credentials",
+        "google_sheets_id",
+        "google_sheets_name",
+        "browser_cdp_endpoint",
+    )
+
     def __init__(self) -> None:
         # .envファイル読み込み
         load_dotenv()
@@ -43,19 +59,102 @@ class Config:
         # 設定ファイル読み込み
         self._default_config = self._load_yaml("default.yaml")
         self._exclusion_config = self._load_yaml("exclusion_keywords.yaml")
+        self._extract_default_settings()
+        self._extract_exclusion_settings()
 
         # 環境変数検証
         self._validate_env_vars()
 
     def _load_yaml(self, filename: str) -> dict[str, Any]:
-        """YAML設定ファイルを読み込む"""
+        """YAML設定ファイルを読み込む（パース結果はpickleでキャッシュ）"""
         filepath = self.CONFIG_DIR / filename
         if not filepath.exists():
-            logger.warning(f"Config file not found: {filepath}")
+            logger.warning("Config file not found: %s", filepath)
             return {}
 
+        # 元ファイルのmtime+サイズが一致すればYAMLパースを省略
+        st = filepath.stat()
+        cache_key = (st.st_mtime_ns, st.st_size)
+        cache_path = self._cache_path(filename)
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, cached_data = pickle.load(f)
+            if cached_key == cache_key:
+                return cached_data
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+            pass
+
         with open(filepath, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        self._write_cache(cache_path, cache_key, data)
+        return data
+
+    def _extract_default_settings(self) -> None:
+        """default.yamlの値を属性に展開（プロパティアクセス毎のdict走査を回避）"""
+        default = self._default_config
+        scraping = default.get("scraping") or {}
+        claude = default.get("claude") or {}
+
+        self._project_name: str = default.get("project_name", "AGA営業リスト")
+        self._search_suffix: str = default.get("search_suffix", "AGA")
+        self._max_results_per_query: int = scraping.get("max_results_per_query", 50)
+        self._max_regions_per_batch: int = scraping.get("max_regions_per_batch", 20)
+        self._region_concurrency: int = scraping.get("region_concurrency", 2)
+        self._search_cache_ttl_seconds: int = scraping.get("search_cache_ttl_seconds", 3600)
+        self._extract_tabs: int = scraping.get("extract_tabs", 3)
+        self._http_fast_path: bool = scraping.get("http_fast_path", False)
+        self._browser_idle_timeout_seconds: float = scraping.get("browser_idle_timeout_seconds", 600)
+        self._browser_max_uses: int = scraping.get("browser_max_uses", 50)
+        self._claude_model: str = claude.get("model", "claude-sonnet-4-20250514")
+        self._claude_batch_size: int = claude.get("batch_size", 10)
+        self._claude_easy_model: str = claude.get("easy_model", "")
+        self._claude_major_chain_domains: list[str] = claude.get("major_chain_domains", [])
+        self._claude_portal_domains: list[str] = claude.get("portal_domains", [])
+        self._claude_concurrency: int = claude.get("concurrency", 4)
+        self._claude_use_batch_api: bool = claude.get("use_batch_api", False)
+        self._claude_batch_poll_seconds: float = claude.get("batch_poll_seconds", 5)
+        self._claude_batch_max_wait_seconds: float = claude.get("batch_max_wait_seconds", 600)
+        self._output_columns: list[str] = default.get("output_columns", [])
+        sheets = default.get("google_sheets") or {}
+        self._sheets_flush_rows: int = sheets.get("flush_rows", 50)
+        self._sheets_flush_mode: str = sheets.get("flush_mode", "batched")
+
+    def _extract_exclusion_settings(self) -> None:
+        """exclusion_keywords.yamlの値を属性に展開"""
+        self._exclusion_keywords: list[str] = self._exclusion_config.get(
+            "exclusion_keywords", []
+        )
+
+    def _cache_path(self, filename: str) -> Path:
+        """YAMLキャッシュファイルのパス"""
+        return self.CACHE_DIR / f"{Path(filename).stem}.pkl"
+
+    def _write_cache(
+        self, cache_path: Path, cache_key: tuple[int, int], data: dict[str, Any]
+    ) -> None:
+        """キャッシュをアトミックに書き込む（失敗しても無視）"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Failed to write config cache %s: %s", cache_path, e)
+
+    def _invalidate_cache(self, filename: str) -> None:
+        """YAMLキャッシュを削除"""
+        try:
+            self._cache_path(filename).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Failed to remove config cache for %s: %s", filename, e)
 
     def _validate_env_vars(self) -> None:
         """必須環境変数の存在確認"""
@@ -66,8 +165,9 @@ class Config:
 
         if missing:
             logger.warning(
-                f"Missing required environment variables: {missing}. "
-                "Some features may not work properly."
+                "Missing required environment variables: %s. "
+                "Some features may not work properly.",
+                missing,
             )
 
     def validate_sheets_config(self) -> None:
@@ -83,77 +183,141 @@ class Config:
                 details={"missing_vars": missing},
             )
 
-    # プロパティ: 環境変数
-    @property
+    # プロパティ: 環境変数（プロセス起動後は変化しないため初回アクセス時にキャッシュ）
+    def refresh(self) -> None:
+        """キャッシュした環境変数を破棄（テスト・設定変更用）"""
+        for name in self.ENV_CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
     def flask_env(self) -> str:
         return os.environ.get("FLASK_ENV", "production")
 
-    @property
+    @cached_property
     def secret_key(self) -> str:
         return os.environ.get("SECRET_KEY", "dev-secret-key-change-in-production")
 
-    @property
+    @cached_property
     def anthropic_api_key(self) -> str:
         return os.environ.get("ANTHROPIC_API_KEY", "")
 
-    @property
+    @cached_property
     def google_sheets_credentials(self) -> str:
         return os.environ.get("GOOGLE_SHEETS_CREDENTIALS", "")
 
-    @property
+    @cached_property
     def google_sheets_id(self) -> str:
         return os.environ.get("GOOGLE_SHEETS_ID", "")
 
-    @property
+    @cached_property
     def google_sheets_name(self) -> str:
         return os.environ.get(
             "GOOGLE_SHEETS_NAME",
             self._default_config.get("google_sheets", {}).get("sheet_name", "営業リスト"),
         )
 
+    @cached_property
+    def browser_cdp_endpoint(self) -> str:
+        return os.environ.get("BROWSER_CDP_ENDPOINT", "")
+
     # プロパティ: YAML設定
     @property
     def project_name(self) -> str:
-        return self._default_config.get("project_name", "AGA営業リスト")
+        return self._project_name
 
     @property
     def search_suffix(self) -> str:
-        return self._default_config.get("search_suffix", "AGA")
+        return self._search_suffix
 
     @property
     def max_results_per_query(self) -> int:
-        return self._default_config.get("scraping", {}).get("max_results_per_query", 50)
+        return self._max_results_per_query
 
     @property
     def max_regions_per_batch(self) -> int:
-        return self._default_config.get("scraping", {}).get("max_regions_per_batch", 20)
+        return self._max_regions_per_batch
+
+    @property
+    def region_concurrency(self) -> int:
+        return self._region_concurrency
+
+    @property
+    def search_cache_ttl_seconds(self) -> int:
+        return self._search_cache_ttl_seconds
+
+    @property
+    def extract_tabs(self) -> int:
+        return self._extract_tabs
+
+    @property
+    def http_fast_path(self) -> bool:
+        return self._http_fast_path
+
+    @property
+    def browser_idle_timeout_seconds(self) -> float:
+        return self._browser_idle_timeout_seconds
+
+    @property
+    def browser_max_uses(self) -> int:
+        return self._browser_max_uses
 
     @property
     def claude_model(self) -> str:
-        return self._default_config.get("claude", {}).get(
-            "model", "claude-sonnet-4-20250514"
-        )
+        return self._claude_model
 
     @property
     def claude_batch_size(self) -> int:
-        return self._default_config.get("claude", {}).get("batch_size", 10)
+        return self._claude_batch_size
+
+    @property
+    def claude_easy_model(self) -> str:
+        return self._claude_easy_model
+
+    @property
+    def claude_major_chain_domains(self) -> list[str]:
+        return self._claude_major_chain_domains
+
+    @property
+    def claude_portal_domains(self) -> list[str]:
+        return self._claude_portal_domains
+
+    @property
+    def claude_concurrency(self) -> int:
+        return self._claude_concurrency
+
+    @property
+    def claude_use_batch_api(self) -> bool:
+        return self._claude_use_batch_api
+
+    @property
+    def claude_batch_poll_seconds(self) -> float:
+        return self._claude_batch_poll_seconds
+
+    @property
+    def claude_batch_max_wait_seconds(self) -> float:
+        return self._claude_batch_max_wait_seconds
 
     @property
     def exclusion_keywords(self) -> list[str]:
-        return self._exclusion_config.get("exclusion_keywords", [])
+        return self._exclusion_keywords
 
     @property
     def output_columns(self) -> list[str]:
-        return self._default_config.get("output_columns", [])
+        return self._output_columns
+
+    @property
+    def sheets_flush_rows(self) -> int:
+        return self._sheets_flush_rows
+
+    @property
+    def sheets_flush_mode(self) -> str:
+        return self._sheets_flush_mode
 
     def update_exclusion_keywords(self, keywords: list[str]) -> None:
         """除外キーワードを更新してファイルに保存"""
         self._exclusion_config["exclusion_keywords"] = keywords
-        filepath = self.CONFIG_DIR / "exclusion_keywords.yaml"
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(
-                self._exclusion_config, f, allow_unicode=True, default_flow_style=False
-            )
+        self._extract_exclusion_settings()
+        self._write_yaml("exclusion_keywords.yaml", self._exclusion_config)
 
     def update_default_config(
         self,
@@ -170,12 +334,34 @@ class Config:
             self._default_config.setdefault("google_sheets", {})["sheet_name"] = (
                 sheet_name
             )
+            self.__dict__.pop("google_sheets_name", None)
+        self._extract_default_settings()
 
-        filepath = self.CONFIG_DIR / "default.yaml"
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.dump(
-                self._default_config, f, allow_unicode=True, default_flow_style=False
-            )
+        self._write_yaml("default.yaml", self._default_config)
+
+    def _write_yaml(self, filename: str, data: dict[str, Any]) -> None:
+        """YAML設定ファイルをアトミックに書き込む（一時ファイル→os.replace）"""
+        filepath = self.CONFIG_DIR / filename
+        self._invalidate_cache(filename)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.CONFIG_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", buffering=1 << 16) as f:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_YamlDumper,
+                    allow_unicode=True,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            # mkstempは0600で作成するため元ファイルの権限を引き継ぐ
+            if filepath.exists():
+                os.chmod(tmp_path, filepath.stat().st_mode & 0o777)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
 
 # グローバル設定インスタンス
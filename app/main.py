@@ -47,7 +47,7 @@ def create_app() -> Flask:
         logger.exception("Internal server error")
         return {"error": "Internal server error"}, 500
 
-    logger.info(f"Flask app created (env: {config.flask_env})")
+    logger.info("Flask app created (env: %s)", config.flask_env)
     return app
 
 
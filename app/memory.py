@@ -0,0 +1,39 @@
+"""プロセスのメモリ使用量の取得（/debugとスクレイピングのログで共通）"""
+
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+# プラットフォーム判定は起動時に1回だけ
+IS_LINUX = sys.platform.startswith("linux")
+# ru_maxrssの単位はmacOSがbytes、Linuxがkilobytes
+MAXRSS_DIVISOR = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+_STATM_PATH = "/proc/self/statm"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if IS_LINUX else 0
+
+
+def read_rss_mb() -> float | None:
+    """現在のRSSを/proc/self/statmからMB単位で取得（Linux以外・読み込み失敗時はNone）"""
+    if not IS_LINUX:
+        return None
+    try:
+        # 2番目のフィールドが常駐ページ数
+        with open(_STATM_PATH, "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_memory_mb() -> float:
+    """ログ用のメモリ使用量をMB単位で取得（Linuxは現在のRSS、それ以外はgetrusageの最大RSS）"""
+    rss_mb = read_rss_mb()
+    if rss_mb is not None:
+        return rss_mb
+    if resource is None:
+        return 0.0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / MAXRSS_DIVISOR
@@ -1,5 +1,17 @@
 """データモデル"""
 
-from app.models.clinic import Clinic, ClinicValidation, ScrapeRequest, ScrapeResponse
+from app.models.clinic import (
+    Clinic,
+    ClinicValidation,
+    InternalClinic,
+    ScrapeRequest,
+    ScrapeResponse,
+)
 
-__all__ = ["Clinic", "ClinicValidation", "ScrapeRequest", "ScrapeResponse"]
+__all__ = [
+    "Clinic",
+    "ClinicValidation",
+    "InternalClinic",
+    "ScrapeRequest",
+    "ScrapeResponse",
+]
@@ -1,8 +1,50 @@
-"""クリニックデータモデル（Pydantic）"""
+"""クリニックデータモデル"""
 
+import re
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+# 電話番号から数字とハイフン以外を除去するパターン（非ASCII入力用）
+_PHONE_STRIP_RE = re.compile(r"[^\d\-]")
+
+# ASCII入力用: 数字とハイフン以外のASCII文字を削除する変換テーブル
+_PHONE_ASCII_DELETE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isdigit() or c == "-"))
+)
+
+# 公式サイトURLとして許可するスキーム
+_URL_PREFIXES = ("http://", "https://")
+
+
+def _normalize_name(v: str) -> str:
+    """クリニック名をトリム（空ならエラー）"""
+    if not v or not v.strip():
+        raise ValueError("クリニック名は必須です")
+    return v.strip()
+
+
+def _normalize_url(v: Optional[str]) -> Optional[str]:
+    """http(s)以外のURLは破棄"""
+    if v is None:
+        return None
+    v = v.strip()
+    if v and not v.startswith(_URL_PREFIXES):
+        return None
+    return v
+
+
+def _normalize_phone(v: Optional[str]) -> Optional[str]:
+    """電話番号から数字とハイフンのみ抽出"""
+    if v is None:
+        return None
+    # 大半はASCIIなので正規表現を使わずtranslateで処理（全角数字は正規表現で保持）
+    if v.isascii():
+        normalized = v.translate(_PHONE_ASCII_DELETE)
+    else:
+        normalized = _PHONE_STRIP_RE.sub("", v)
+    return normalized if normalized else None
 
 
 class Clinic(BaseModel):
@@ -19,30 +61,48 @@ class Clinic(BaseModel):
     @field_validator("name")
     @classmethod
     def name_must_not_be_empty(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError("クリニック名は必須です")
-        return v.strip()
+        return _normalize_name(v)
 
     @field_validator("url")
     @classmethod
     def validate_url(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return None
-        v = v.strip()
-        if v and not v.startswith(("http://", "https://")):
-            return None
-        return v
+        return _normalize_url(v)
 
     @field_validator("phone")
     @classmethod
     def normalize_phone(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return None
-        # 数字とハイフンのみ抽出
-        import re
+        return _normalize_phone(v)
+
+
+@dataclass(slots=True)
+class InternalClinic:
+    """
+    内部処理用クリニック情報（スクレイパー→除外フィルター→Claude検証）
+
+    信頼境界を越えないため、Pydanticモデルの代わりに軽量なslots付き
+    dataclassを使う。正規化・範囲チェックはClinicと同じ。
+    """
 
-        normalized = re.sub(r"[^\d\-]", "", v)
-        return normalized if normalized else None
+    name: str
+    url: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    rating: Optional[float] = None
+    reviews: Optional[int] = None
+    area: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.name = _normalize_name(self.name)
+        self.url = _normalize_url(self.url)
+        self.phone = _normalize_phone(self.phone)
+        if self.rating is not None and not 0 <= self.rating <= 5:
+            raise ValueError(f"評価は0-5の範囲で指定してください: {self.rating}")
+        if self.reviews is not None and self.reviews < 0:
+            raise ValueError(f"口コミ数は0以上で指定してください: {self.reviews}")
+
+
+# クリニックリストの一括シリアライズ用（pydantic-coreでまとめて処理）
+CLINIC_LIST_ADAPTER: TypeAdapter[list[InternalClinic]] = TypeAdapter(list[InternalClinic])
 
 
 class ClinicValidation(BaseModel):
@@ -78,6 +138,10 @@ class ScrapeRequest(BaseModel):
 
     regions: list[str] = Field(..., min_length=1, description="検索地域リスト")
     search_suffix: str = Field("AGA", description="検索サフィックス")
+    include_results: bool = Field(
+        True,
+        description="保存した有効クリニックをSSEのchunkで送信するか（completeには件数のみ含まれる）",
+    )
 
     @field_validator("regions")
     @classmethod
@@ -97,5 +161,5 @@ class ScrapeResponse(BaseModel):
     valid_count: int = 0
     excluded_count: int = 0
     new_count: int = 0
-    clinics: list[dict] = Field(default_factory=list)
+    clinics: list[ValidatedClinic] = Field(default_factory=list)
     error: Optional[str] = None
@@ -3,25 +3,49 @@
 import os
 import platform
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 
 from flask import Blueprint, jsonify
 from flask.typing import ResponseReturnValue
 
+from app.memory import IS_LINUX, MAXRSS_DIVISOR, read_rss_mb
+
 bp = Blueprint("health", __name__)
 
+# /debug応答のうちプロセス起動後に変化しない部分（モジュール読み込み時に一度だけ構築）
+_STATIC_DEBUG_INFO = {
+    "system": {
+        "platform": platform.system(),
+        "platform_release": platform.release(),
+        "python_version": sys.version,
+        "pid": os.getpid(),
+    },
+    "environment": {
+        "FLASK_ENV": os.environ.get("FLASK_ENV", "not set"),
+        "PLAYWRIGHT_BROWSERS_PATH": os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "not set"),
+    },
+}
+
 
 def _get_memory_info() -> dict:
-    """メモリ情報を取得"""
+    """メモリ情報を取得（キーはプラットフォームによらず共通。取得できない値はNone）"""
     try:
+        if IS_LINUX:
+            # /proc/self/statmとos.times()から取得（getrusageは呼ばない）
+            rss_mb = read_rss_mb()
+            times = os.times()
+            return {
+                "max_rss_mb": None,
+                "rss_mb": round(rss_mb, 1) if rss_mb is not None else None,
+                "user_time_sec": round(times.user, 2),
+                "system_time_sec": round(times.system, 2),
+            }
+
         import resource
         rusage = resource.getrusage(resource.RUSAGE_SELF)
-        if os.uname().sysname == "Darwin":
-            max_rss_mb = rusage.ru_maxrss / (1024 * 1024)
-        else:
-            max_rss_mb = rusage.ru_maxrss / 1024
         return {
-            "max_rss_mb": round(max_rss_mb, 1),
+            "max_rss_mb": round(rusage.ru_maxrss / MAXRSS_DIVISOR, 1),
+            "rss_mb": None,
             "user_time_sec": round(rusage.ru_utime, 2),
             "system_time_sec": round(rusage.ru_stime, 2),
         }
@@ -48,16 +72,7 @@ def debug_info() -> ResponseReturnValue:
 
     return jsonify({
         "status": "ok",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "memory": memory,
-        "system": {
-            "platform": platform.system(),
-            "platform_release": platform.release(),
-            "python_version": sys.version,
-            "pid": os.getpid(),
-        },
-        "environment": {
-            "FLASK_ENV": os.environ.get("FLASK_ENV", "not set"),
-            "PLAYWRIGHT_BROWSERS_PATH": os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "not set"),
-        }
+        **_STATIC_DEBUG_INFO,
     })
@@ -1,22 +1,20 @@
 """スクレイピングAPI"""
 
-import json
 import logging
-import os
 import time
-import traceback
-from typing import Generator
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from queue import SimpleQueue
+from typing import Any, Generator
 
+import orjson
 from flask import Blueprint, request, jsonify, Response
 from flask.typing import ResponseReturnValue
 from pydantic import ValidationError as PydanticValidationError
 
 from app.config import config
-from app.models.clinic import ScrapeRequest
-from app.services.google_maps import GoogleMapsScraper
-from app.services.exclusion_filter import ExclusionFilter
-from app.services.claude_validator import ClaudeValidator
-from app.services.sheets_writer import SheetsWriter
+from app.memory import get_memory_mb
+from app.models.clinic import InternalClinic, ScrapeRequest
 from app.exceptions import ScrapingError, SheetsError
 
 logger = logging.getLogger(__name__)
@@ -25,29 +23,58 @@ logger = logging.getLogger(__name__)
 MAX_REGIONS_PER_BATCH = config.max_regions_per_batch
 bp = Blueprint("scrape", __name__, url_prefix="/api")
 
+# 結果のクリニックを1メッセージで送る件数（completeに全件を載せず分割して送信）
+SSE_RESULT_CHUNK_SIZE = 100
+
+# この秒数出力がなければSSEキープアライブを送信
+KEEPALIVE_INTERVAL_SECONDS = 15
+
+# 検証中の1件ごとの進捗を送信する間隔
+PROGRESS_POLL_SECONDS = 0.5
+
+# 同時に実行中にできるSheets書き込みの上限（超えたら最も古い書き込みの完了を待つ）
+SHEETS_MAX_INFLIGHT = 2
+
+
+# 電話番号から区切り文字を除去する変換テーブル
+_PHONE_SEPARATORS = str.maketrans("", "", "-")
+
+
+def _clinic_dedupe_key(clinic: InternalClinic) -> tuple[str, str]:
+    """地域間の重複判定キー（正規化した名前, 電話番号の数字）"""
+    return (
+        clinic.name.strip().lower(),
+        (clinic.phone or "").translate(_PHONE_SEPARATORS),
+    )
+
+
+def _create_sse_message(type_: str, **data) -> bytes:
+    """SSEメッセージを作成（orjsonはUTF-8のbytesを直接出力）"""
+    return b"data: " + orjson.dumps({"type": type_, **data}) + b"\n\n"
+
+
+def _sse_log(message: str) -> bytes:
+    """logメッセージを作成（固定部分は定数、可変部分のみシリアライズ）"""
+    return b'data: {"type":"log","message":' + orjson.dumps(message) + b"}\n\n"
+
+
+def _sse_complete(**payload) -> bytes:
+    """completeメッセージを作成（payloadのJSONオブジェクトに型フィールドを前置）"""
+    return b'data: {"type":"complete",' + orjson.dumps(payload)[1:] + b"\n\n"
 
-def _get_memory_mb() -> float:
-    """現在のメモリ使用量をMB単位で取得"""
-    try:
-        import resource
-        rusage = resource.getrusage(resource.RUSAGE_SELF)
-        if os.uname().sysname == "Darwin":
-            return rusage.ru_maxrss / (1024 * 1024)
-        else:
-            return rusage.ru_maxrss / 1024
-    except Exception:
-        return 0.0
 
+def _sse_chunk(clinics: list[dict]) -> bytes:
+    """結果のクリニックを分割送信するchunkメッセージを作成"""
+    return b'data: {"type":"chunk","clinics":' + orjson.dumps(clinics) + b"}\n\n"
 
-def _create_sse_message(type_: str, **data) -> str:
-    """SSEメッセージを作成"""
-    message = {"type": type_, **data}
-    return f"data: {json.dumps(message, ensure_ascii=False)}\n\n"
 
+# SSEキープアライブコメント（接続維持用）
+_SSE_KEEPALIVE = b": keepalive\n\n"
 
-def _create_keepalive() -> str:
+
+def _create_keepalive() -> bytes:
     """SSEキープアライブコメントを作成（接続維持用）"""
-    return ": keepalive\n\n"
+    return _SSE_KEEPALIVE
 
 
 @bp.route("/scrape", methods=["POST"])
@@ -83,193 +110,347 @@ def scrape() -> ResponseReturnValue:
             "requested_regions": len(scrape_request.regions),
         }), 400
 
-    def generate() -> Generator[str, None, None]:
+    def generate() -> Generator[bytes, None, None]:
         session_start = time.time()
-        last_keepalive = time.time()
-        keepalive_interval = 15  # 15秒ごとにキープアライブ送信
+        keepalive_interval = KEEPALIVE_INTERVAL_SECONDS
+        region_count = len(scrape_request.regions)
 
-        logger.info(f"[SESSION] ========== スクレイピングセッション開始 ==========")
-        logger.info(f"[SESSION] 地域数: {len(scrape_request.regions)}")
-        logger.info(f"[SESSION] 地域リスト: {scrape_request.regions}")
-        logger.info(f"[SESSION] 検索キーワード: {scrape_request.search_suffix}")
-        logger.info(f"[SESSION] 開始時メモリ: {_get_memory_mb():.1f} MB")
+        logger.info("[SESSION] ========== スクレイピングセッション開始 ==========")
+        logger.info("[SESSION] 地域数: %s", region_count)
+        logger.info("[SESSION] 地域リスト: %s", scrape_request.regions)
+        logger.info("[SESSION] 検索キーワード: %s", scrape_request.search_suffix)
 
         # 開始メッセージを即座に送信（接続確認）
-        yield _create_sse_message(
-            "log",
-            message=f"セッション開始 (地域数: {len(scrape_request.regions)})"
-        )
+        yield _sse_log(f"セッション開始 (地域数: {region_count})")
+
+        total_valid = 0
+        total_found = 0
+        total_excluded = 0
+        total_new = 0
+        total_duplicates = 0
+        total_existing = 0
+        # 重複・保存済みを除いてClaude検証に送った件数
+        total_validated = 0
+
+        # シートに保存済みのURL（検索開始後に1回だけ読み込み、以降はSheetsWriterが書き込み分を追加）
+        existing_urls: set[str] = set()
+        # 地域間で重複するクリニックを検証前に除外するための既出キー
+        seen_clinics: set[tuple[str, str]] = set()
+        # Claude検証待ちのクリニック（複数地域分をまとめて1回のAPI呼び出しで検証）
+        validation_buffer: list = []
+        # (クリニック名, URL) → 取得元の地域番号（地域ごとのログ用）
+        clinic_regions: dict[tuple[str, str | None], int] = {}
+        # 書き込み中のSheets書き込み（Future, 書き込んだクリニック）。Claude検証と並行して書き込む
+        inflight_writes: deque[tuple[Future, list[dict]]] = deque()
+
+        def wait_with_keepalive(
+            future: Future, progress: SimpleQueue | None = None
+        ) -> Generator[bytes, None, Any]:
+            """
+            Futureの完了を待つ（出力がないまま一定時間経過するごとにキープアライブを送信）
+
+            progressを指定した場合は、待っている間にキューへ届いたメッセージも随時送信する。
+            """
+            poll_interval: float = keepalive_interval
+            if progress is not None:
+                poll_interval = min(keepalive_interval, PROGRESS_POLL_SECONDS)
+            idle = 0.0
+            while True:
+                done = bool(wait([future], timeout=poll_interval).done)
+                sent = False
+                while progress is not None and not progress.empty():
+                    yield progress.get()
+                    sent = True
+                if done:
+                    return future.result()
+                idle = 0.0 if sent else idle + poll_interval
+                if idle >= keepalive_interval:
+                    logger.debug("[SESSION] キープアライブ送信")
+                    yield _create_keepalive()
+                    idle = 0.0
+
+        def run_validation(batch: list[InternalClinic], progress: SimpleQueue) -> list[dict]:
+            """検証スレッドでの検証（Message Batches APIは処理完了まで待つ。キープアライブはwait_with_keepaliveが送る）"""
+            if not config.claude_use_batch_api:
+                def report(clinic: InternalClinic, is_valid: bool) -> None:
+                    progress.put(_sse_log(f"  {clinic.name}: {'有効' if is_valid else '無効'}"))
+
+                return validator.validate_batch(batch, on_result=report)
+            return validator.validate_batch_via_batch_api(batch)
+
+        def process_region(
+            i: int, query: str, search_future: Future
+        ) -> Generator[bytes, None, None]:
+            """検索完了した地域の後続処理（除外→検証待ちバッファへ追加）"""
+            nonlocal total_found, total_excluded, total_duplicates, total_existing
+
+            clinics = search_future.result()
+            logger.info("[REGION %s] Google Maps検索完了: %s件", i+1, len(clinics))
+
+            yield _sse_log(f"[{i+1}/{region_count}] {query} 検索結果: {len(clinics)}件取得")
+
+            if not clinics:
+                logger.info("[REGION %s] 結果0件、次の地域へ", i+1)
+                yield _sse_log("→ スキップ（0件）")
+                return
+
+            total_found += len(clinics)
+
+            # キーワード除外
+            logger.info("[REGION %s] キーワード除外フィルター適用中...", i+1)
+            filtered = exclusion_filter.filter(clinics)
+            excluded_count = len(clinics) - len(filtered)
+            total_excluded += excluded_count
+
+            if excluded_count > 0:
+                logger.info("[REGION %s] キーワード除外: %s件 (残り: %s件)", i+1, excluded_count, len(filtered))
+                yield _sse_log(f"キーワード除外: {excluded_count}件")
+
+            if not filtered:
+                logger.info("[REGION %s] フィルタ後0件、次の地域へ", i+1)
+                yield _sse_log("→ スキップ（フィルタ後0件）")
+                return
+
+            # 他の地域で取得済み・シートに保存済みのクリニックを除外（Claudeトークン・Sheets書き込みを節約）
+            unique = []
+            existing_count = 0
+            for clinic in filtered:
+                key = _clinic_dedupe_key(clinic)
+                if key in seen_clinics:
+                    continue
+                seen_clinics.add(key)
+                if clinic.url and clinic.url in existing_urls:
+                    existing_count += 1
+                    continue
+                unique.append(clinic)
+            duplicate_count = len(filtered) - len(unique) - existing_count
+            total_duplicates += duplicate_count
+            total_existing += existing_count
+
+            if duplicate_count > 0:
+                logger.info("[REGION %s] 地域間重複: %s件 (残り: %s件)", i+1, duplicate_count, len(unique))
+                yield _sse_log(f"重複除外: {duplicate_count}件")
+            if existing_count > 0:
+                logger.info("[REGION %s] シート保存済み: %s件 (残り: %s件)", i+1, existing_count, len(unique))
+                yield _sse_log(f"保存済み除外: {existing_count}件")
+
+            if not unique:
+                logger.info("[REGION %s] 重複除外後0件、次の地域へ", i+1)
+                yield _sse_log("→ スキップ（重複除外後0件）")
+                return
+
+            for clinic in unique:
+                clinic_regions.setdefault((clinic.name, clinic.url), i)
+            validation_buffer.extend(unique)
+            logger.info("[REGION %s] 検証待ちに追加: %s件 (待ち合計: %s件)", i+1, len(unique), len(validation_buffer))
+
+        def flush_validation() -> Generator[bytes, None, None]:
+            """検証待ちのクリニックをまとめてClaude APIで検証し、Sheets書き込み待ちに追加"""
+            nonlocal total_validated
+
+            batch = validation_buffer[:]
+            validation_buffer.clear()
+            if not batch:
+                return
+            total_validated += len(batch)
+
+            # Claude API検証（複数地域をまとめて）
+            batch_regions = sorted({clinic_regions[(c.name, c.url)] for c in batch})
+            logger.info("[VALIDATE] Claude API検証開始: %s件 (地域: %s)", len(batch), [r + 1 for r in batch_regions])
+            yield _sse_log(f"Claude APIで検証中... ({len(batch)}件, {len(batch_regions)}地域)")
+
+            # 検証は別スレッドで実行し、完了待ちの間は1件ごとの結果とキープアライブを送信
+            progress: SimpleQueue[bytes] = SimpleQueue()
+            validated = yield from wait_with_keepalive(
+                validate_executor.submit(run_validation, batch, progress), progress
+            )
+            valid_clinics = [c for c in validated if c.get("is_valid", False)]
+
+            # 地域ごとの有効件数をログ出力
+            valid_by_region: dict[int, int] = {}
+            for c in valid_clinics:
+                region_idx = clinic_regions.get((c.get("name"), c.get("url")))
+                if region_idx is not None:
+                    valid_by_region[region_idx] = valid_by_region.get(region_idx, 0) + 1
+            for region_idx in batch_regions:
+                logger.info("[REGION %s] Claude API検証完了: 有効=%s件", region_idx+1, valid_by_region.get(region_idx, 0))
+
+            logger.info("[VALIDATE] Claude API検証完了: 有効=%s件, 無効=%s件", len(valid_clinics), len(validated)-len(valid_clinics))
+            yield _sse_log(f"検証完了: 有効 {len(valid_clinics)}件")
+
+            if not valid_clinics:
+                logger.info("[VALIDATE] 有効クリニック0件")
+                yield _sse_log("→ スキップ（有効0件）")
+                return
+
+            pending_count = sheets_writer.append_batched(valid_clinics)
+            logger.info("[SHEETS] 書き込み待ちに追加: %s件 (待ち合計: %s件)", len(valid_clinics), pending_count)
+            yield _sse_log(f"→ Sheets書き込み待ち: {pending_count}件")
+
+            if (
+                config.sheets_flush_mode == "per_region"
+                or pending_count >= config.sheets_flush_rows
+            ):
+                yield from flush_sheets()
+
+        def flush_sheets() -> Generator[bytes, None, None]:
+            """書き込み待ちのクリニックをSheets書き込みスレッドに渡す（完了を待たずに次の検証へ進む）"""
+            rows = sheets_writer.take_pending()
+            if not rows:
+                return
+
+            # 書き込み中の件数が上限なら、最も古い書き込みの完了を待つ
+            while len(inflight_writes) >= SHEETS_MAX_INFLIGHT:
+                yield from collect_sheets(block=True)
+
+            # 書き込みスレッドは1本のため、Sheets APIへの書き込みは直列
+            logger.info("[SHEETS] Google Sheets書き込み開始: %s件", len(rows))
+            inflight_writes.append((sheets_executor.submit(sheets_writer.append, rows), rows))
+
+        def collect_sheets(block: bool = False) -> Generator[bytes, None, None]:
+            """完了したSheets書き込みの結果を反映（block=Trueなら最も古い書き込みの完了を待つ）"""
+            nonlocal total_new, total_valid
+
+            while inflight_writes and (block or inflight_writes[0][0].done()):
+                block = False
+                write_future, rows = inflight_writes.popleft()
+                try:
+                    new_count = yield from wait_with_keepalive(write_future)
+                    total_new += new_count
+                    logger.info("[SHEETS] Sheets書き込み完了: 新規=%s件 (累計: %s件)", new_count, total_new)
+                    yield _sse_log(f"→ Sheets保存: 新規{new_count}件 (累計: {total_new}件)")
+                    # 保存した有効クリニックは保持せず、要求された場合のみその場で送信
+                    total_valid += len(rows)
+                    if scrape_request.include_results:
+                        for start in range(0, len(rows), SSE_RESULT_CHUNK_SIZE):
+                            yield _sse_chunk(rows[start : start + SSE_RESULT_CHUNK_SIZE])
+                except SheetsError as e:
+                    logger.error("[SHEETS] Sheets書き込みエラー: %s", e.message)
+                    yield _sse_log(f"[WARN] Sheets書き込みエラー: {e.message}")
+                except Exception as e:
+                    logger.error(
+                        "[SHEETS] Sheets書き込みエラー: %s: %s", type(e).__name__, e, exc_info=True
+                    )
+                    yield _sse_log(f"[WARN] Sheets書き込みエラー: {str(e)}")
 
         try:
             logger.info("[SESSION] サービス初期化中...")
-            scraper = GoogleMapsScraper()
+            # 重い依存（Playwright/anthropic/gspread）は実行時に遅延インポート
+            # スクレイパー・バリデーターはリクエスト間で共有し、
+            # 除外フィルター・Sheetsライターはセッションごとの状態を持つため毎回作成
+            from app.services import get_scraper, get_validator
+            from app.services.exclusion_filter import ExclusionFilter
+            from app.services.sheets_writer import SheetsWriter
+
+            scraper = get_scraper()
             exclusion_filter = ExclusionFilter()
-            validator = ClaudeValidator()
+            validator = get_validator()
             sheets_writer = SheetsWriter()
             logger.info("[SESSION] サービス初期化完了")
 
-            all_valid_clinics = []
-            total_found = 0
-            total_excluded = 0
-            total_new = 0
-
-            # 各地域を検索（地域ごとに即時Sheets書き込み）
-            for i, region in enumerate(scrape_request.regions):
-                region_start = time.time()
-                query = f"{region} {scrape_request.search_suffix}"
-
-                logger.info(f"[REGION {i+1}/{len(scrape_request.regions)}] ========== 開始: {query} ==========")
-                yield _create_sse_message(
-                    "log",
-                    message=f"[{i+1}/{len(scrape_request.regions)}] {query} で検索開始...",
-                )
-
+            # Google Maps検索（ネットワーク待ちが支配的）を地域間で並列実行し、
+            # 完了した地域から順に除外し、検証バッチサイズに達したら検証、
+            # 書き込み待ちが一定件数に達したらSheetsへまとめて書き込む
+            concurrency = max(1, min(region_count, config.region_concurrency))
+            logger.info("[SESSION] 並列検索数: %s", concurrency)
+            executor = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="scrape-region"
+            )
+            validate_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="claude-validate-batch"
+            )
+            sheets_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sheets-write"
+            )
+            try:
+                futures: dict[Future, tuple[int, str, float, bool]] = {}
+                for i, region in enumerate(scrape_request.regions):
+                    query = f"{region} {scrape_request.search_suffix}"
+                    cached = scraper.is_cached(query)
+                    logger.info("[REGION %s/%s] ========== 開始: %s%s ==========", i+1, region_count, query, " (キャッシュ)" if cached else "")
+                    futures[executor.submit(scraper.search, query)] = (i, query, time.time(), cached)
+
+                yield _sse_log(f"{region_count}地域の検索を開始 (並列数: {concurrency})")
+
+                # 検索と並行してシートの保存済みURLを読み込む（保存済みは検証しない）
+                # SheetsWriterの状態は書き込みスレッドのみで扱う
                 try:
-                    # キープアライブチェック
-                    if time.time() - last_keepalive > keepalive_interval:
-                        yield _create_keepalive()
-                        last_keepalive = time.time()
-                        logger.debug("[SESSION] キープアライブ送信")
-
-                    logger.info(f"[REGION {i+1}] Google Maps検索開始...")
-                    clinics = scraper.search(query)
-                    logger.info(f"[REGION {i+1}] Google Maps検索完了: {len(clinics)}件")
-
-                    yield _create_sse_message(
-                        "log", message=f"検索結果: {len(clinics)}件取得"
+                    existing_urls = yield from wait_with_keepalive(
+                        sheets_executor.submit(sheets_writer.load_existing_urls)
                     )
+                    logger.info("[SHEETS] 保存済みURL: %s件", len(existing_urls))
+                except Exception as e:
+                    logger.warning("[SHEETS] 保存済みURLの読み込み失敗: %s: %s", type(e).__name__, e)
 
-                    if not clinics:
-                        logger.info(f"[REGION {i+1}] 結果0件、次の地域へ")
-                        yield _create_sse_message(
-                            "log", message="→ スキップ（0件）"
-                        )
-                        continue
-
-                    total_found += len(clinics)
-
-                    # キープアライブチェック
-                    if time.time() - last_keepalive > keepalive_interval:
-                        yield _create_keepalive()
-                        last_keepalive = time.time()
-
-                    # キーワード除外
-                    logger.info(f"[REGION {i+1}] キーワード除外フィルター適用中...")
-                    filtered = exclusion_filter.filter(clinics)
-                    excluded_count = len(clinics) - len(filtered)
-                    total_excluded += excluded_count
-
-                    if excluded_count > 0:
-                        logger.info(f"[REGION {i+1}] キーワード除外: {excluded_count}件 (残り: {len(filtered)}件)")
-                        yield _create_sse_message(
-                            "log", message=f"キーワード除外: {excluded_count}件"
-                        )
-
-                    if not filtered:
-                        logger.info(f"[REGION {i+1}] フィルタ後0件、次の地域へ")
-                        yield _create_sse_message(
-                            "log", message="→ スキップ（フィルタ後0件）"
-                        )
-                        continue
-
-                    # キープアライブチェック
-                    if time.time() - last_keepalive > keepalive_interval:
-                        yield _create_keepalive()
-                        last_keepalive = time.time()
-
-                    # Claude API検証（地域ごと）
-                    logger.info(f"[REGION {i+1}] Claude API検証開始: {len(filtered)}件")
-                    yield _create_sse_message(
-                        "log", message=f"Claude APIで検証中... ({len(filtered)}件)"
-                    )
-
-                    validated = validator.validate_batch(filtered)
-                    valid_clinics = [c for c in validated if c.get("is_valid", False)]
-
-                    logger.info(f"[REGION {i+1}] Claude API検証完了: 有効={len(valid_clinics)}件, 無効={len(validated)-len(valid_clinics)}件")
-                    yield _create_sse_message(
-                        "log", message=f"検証完了: 有効 {len(valid_clinics)}件"
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=keepalive_interval, return_when=FIRST_COMPLETED
                     )
-
-                    if not valid_clinics:
-                        logger.info(f"[REGION {i+1}] 有効クリニック0件、次の地域へ")
-                        yield _create_sse_message(
-                            "log", message="→ スキップ（有効0件）"
-                        )
+                    if not done:
+                        logger.debug("[SESSION] キープアライブ送信")
+                        yield _create_keepalive()
                         continue
 
-                    # キープアライブチェック
-                    if time.time() - last_keepalive > keepalive_interval:
-                        yield _create_keepalive()
-                        last_keepalive = time.time()
-
-                    # Google Sheets書き込み（地域ごとに即時保存）
-                    logger.info(f"[REGION {i+1}] Google Sheets書き込み開始...")
-                    try:
-                        new_count = sheets_writer.append(valid_clinics)
-                        total_new += new_count
-                        logger.info(f"[REGION {i+1}] Sheets書き込み完了: 新規={new_count}件 (累計: {total_new}件)")
-                        yield _create_sse_message(
-                            "log",
-                            message=f"→ Sheets保存: 新規{new_count}件 (累計: {total_new}件)",
-                        )
-                        all_valid_clinics.extend(valid_clinics)
-                    except SheetsError as e:
-                        logger.error(f"[REGION {i+1}] Sheets書き込みエラー: {e.message}")
-                        yield _create_sse_message(
-                            "log", message=f"[WARN] Sheets書き込みエラー: {e.message}"
-                        )
-                    except Exception as e:
-                        logger.error(f"[REGION {i+1}] Sheets書き込みエラー: {type(e).__name__}: {e}")
-                        logger.error(f"[REGION {i+1}] スタックトレース:\n{traceback.format_exc()}")
-                        yield _create_sse_message(
-                            "log", message=f"[WARN] Sheets書き込みエラー: {str(e)}"
-                        )
-
-                except ScrapingError as e:
-                    logger.error(f"[REGION {i+1}] スクレイピングエラー: {e.message}")
-                    yield _create_sse_message(
-                        "log", message=f"[WARN] 検索エラー: {e.message}"
-                    )
-                    continue
-                except Exception as e:
-                    logger.error(f"[REGION {i+1}] 予期せぬエラー: {type(e).__name__}: {e}")
-                    logger.error(f"[REGION {i+1}] スタックトレース:\n{traceback.format_exc()}")
-                    yield _create_sse_message(
-                        "log", message=f"[ERROR] 予期せぬエラー: {type(e).__name__}: {e}"
-                    )
-                    continue
-                finally:
-                    region_elapsed = time.time() - region_start
-                    mem_mb = _get_memory_mb()
-                    logger.info(f"[REGION {i+1}] ========== 完了: {region_elapsed:.1f}秒, メモリ: {mem_mb:.1f} MB ==========")
-                    yield _create_sse_message(
-                        "log", message=f"地域完了: {region_elapsed:.1f}秒"
-                    )
+                    for future in done:
+                        i, query, region_start, cached = futures[future]
+                        try:
+                            yield from process_region(i, query, future)
+                        except ScrapingError as e:
+                            logger.error("[REGION %s] スクレイピングエラー: %s", i+1, e.message)
+                            yield _sse_log(f"[WARN] {query} 検索エラー: {e.message}")
+                        except Exception as e:
+                            logger.error(
+                                "[REGION %s] 予期せぬエラー: %s: %s", i+1, type(e).__name__, e, exc_info=True
+                            )
+                            yield _sse_log(f"[ERROR] 予期せぬエラー: {type(e).__name__}: {e}")
+                        finally:
+                            region_elapsed = time.time() - region_start
+                            logger.info("[REGION %s] ========== 完了: %.1f秒 ==========", i+1, region_elapsed)
+                            cache_note = ", キャッシュ" if cached else ""
+                            yield _sse_log(f"地域完了: {query} ({region_elapsed:.1f}秒{cache_note})")
+
+                    if len(validation_buffer) >= config.claude_batch_size:
+                        yield from flush_validation()
+                    yield from collect_sheets()
+
+                # 残りの検証待ち・書き込み待ちを処理
+                yield from flush_validation()
+                yield from flush_sheets()
+                while inflight_writes:
+                    yield from collect_sheets(block=True)
+            finally:
+                # クライアント切断時も未開始の検索は破棄する（受け付け済みのSheets書き込みは継続）
+                executor.shutdown(wait=False, cancel_futures=True)
+                validate_executor.shutdown(wait=False, cancel_futures=True)
+                sheets_executor.shutdown(wait=False)
 
             session_elapsed = time.time() - session_start
-            mem_mb = _get_memory_mb()
-            logger.info(f"[SESSION] ========== セッション完了 ==========")
-            logger.info(f"[SESSION] 総時間: {session_elapsed:.1f}秒")
-            logger.info(f"[SESSION] 検索結果: {total_found}件")
-            logger.info(f"[SESSION] 除外: {total_excluded}件")
-            logger.info(f"[SESSION] 有効: {len(all_valid_clinics)}件")
-            logger.info(f"[SESSION] 新規保存: {total_new}件")
-            logger.info(f"[SESSION] 最終メモリ: {mem_mb:.1f} MB")
-
-            yield _create_sse_message(
-                "complete",
-                clinics=all_valid_clinics,
+            mem_mb = get_memory_mb()
+            logger.info("[SESSION] ========== セッション完了 ==========")
+            logger.info("[SESSION] 総時間: %.1f秒", session_elapsed)
+            logger.info("[SESSION] 検索結果: %s件", total_found)
+            logger.info("[SESSION] 除外: %s件", total_excluded)
+            logger.info("[SESSION] 地域間重複: %s件", total_duplicates)
+            logger.info("[SESSION] シート保存済み: %s件", total_existing)
+            logger.info("[SESSION] 検証対象: %s件", total_validated)
+            logger.info("[SESSION] 有効: %s件", total_valid)
+            logger.info("[SESSION] 新規保存: %s件", total_new)
+            logger.info("[SESSION] 最終メモリ: %.1f MB", mem_mb)
+
+            yield _sse_complete(
                 total_found=total_found,
-                valid_count=len(all_valid_clinics),
+                valid_count=total_valid,
                 excluded_count=total_excluded,
+                duplicate_count=total_duplicates,
+                existing_count=total_existing,
+                validated_count=total_validated,
                 new_count=total_new,
             )
 
         except Exception as e:
-            logger.exception(f"[SESSION] 致命的エラー: {type(e).__name__}: {e}")
-            logger.error(f"[SESSION] スタックトレース:\n{traceback.format_exc()}")
-            logger.error(f"[SESSION] メモリ使用量: {_get_memory_mb():.1f} MB")
+            logger.exception("[SESSION] 致命的エラー: %s: %s", type(e).__name__, e)
+            logger.error("[SESSION] メモリ使用量: %.1f MB", get_memory_mb())
             yield _create_sse_message("error", message=f"致命的エラー: {type(e).__name__}: {e}")
 
     return Response(
@@ -300,17 +481,33 @@ def scrape_preview() -> ResponseReturnValue:
         return jsonify({"success": False, "error": str(e)}), 400
 
     try:
-        scraper = GoogleMapsScraper()
-        exclusion_filter = ExclusionFilter()
-        validator = ClaudeValidator()
+        from app.services import get_scraper, get_validator
+        from app.services.exclusion_filter import ExclusionFilter
 
-        all_clinics = []
-
-        for region in scrape_request.regions:
-            query = f"{region} {scrape_request.search_suffix}"
-            clinics = scraper.search(query)
-            filtered = exclusion_filter.filter(clinics)
-            all_clinics.extend(filtered)
+        scraper = get_scraper()
+        exclusion_filter = ExclusionFilter()
+        validator = get_validator()
+
+        # 地域ごとの検索を並列実行（1地域につき1ブラウザコンテキストのため並列数は設定値まで）
+        queries = [
+            f"{region} {scrape_request.search_suffix}"
+            for region in scrape_request.regions
+        ]
+        concurrency = max(1, min(len(queries), config.region_concurrency))
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="preview-region"
+        ) as executor:
+            found = [clinic for clinics in executor.map(scraper.search, queries) for clinic in clinics]
+
+        # 地域間の重複を除いてから、除外フィルターを全地域分まとめて1回で適用
+        seen_clinics: set[tuple[str, str]] = set()
+        unique = []
+        for clinic in found:
+            key = _clinic_dedupe_key(clinic)
+            if key not in seen_clinics:
+                seen_clinics.add(key)
+                unique.append(clinic)
+        all_clinics = exclusion_filter.filter(unique)
 
         if not all_clinics:
             return jsonify(
@@ -5,8 +5,6 @@ from flask import Blueprint, request, jsonify
 from flask.typing import ResponseReturnValue
 
 from app.config import config
-from app.services.sheets_writer import SheetsWriter
-from app.services.exclusion_filter import ExclusionFilter
 
 logger = logging.getLogger(__name__)
 bp = Blueprint("settings", __name__, url_prefix="/api/settings")
@@ -52,19 +50,22 @@ def update_settings() -> ResponseReturnValue:
         return jsonify({"success": True})
 
     except Exception as e:
-        logger.error(f"Failed to update settings: {e}")
+        logger.error("Failed to update settings: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
 @bp.route("/test-sheets", methods=["POST"])
 def test_sheets_connection() -> ResponseReturnValue:
     """Google Sheets接続テスト"""
+    # gspread・google-authは起動時に読み込まないよう使用時にインポート
+    from app.services.sheets_writer import SheetsWriter
+
     try:
         writer = SheetsWriter()
         result = writer.test_connection()
         return jsonify(result)
     except Exception as e:
-        logger.error(f"Sheets connection test failed: {e}")
+        logger.error("Sheets connection test failed: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -85,6 +86,8 @@ def add_exclusion_keyword() -> ResponseReturnValue:
     if not keyword:
         return jsonify({"success": False, "error": "Keyword is required"}), 400
 
+    from app.services.exclusion_filter import ExclusionFilter
+
     exclusion_filter = ExclusionFilter()
     exclusion_filter.add_keyword(keyword)
     exclusion_filter.save()
@@ -103,6 +106,8 @@ def remove_exclusion_keyword() -> ResponseReturnValue:
     if not keyword:
         return jsonify({"success": False, "error": "Keyword is required"}), 400
 
+    from app.services.exclusion_filter import ExclusionFilter
+
     exclusion_filter = ExclusionFilter()
     exclusion_filter.remove_keyword(keyword)
     exclusion_filter.save()
@@ -1,8 +1,56 @@
-"""サービス層"""
+"""サービス層
 
-from app.services.exclusion_filter import ExclusionFilter
-from app.services.google_maps import GoogleMapsScraper
-from app.services.claude_validator import ClaudeValidator
-from app.services.sheets_writer import SheetsWriter
+各サービスはPlaywright・anthropic・gspreadなど重い依存を持つため、
+属性アクセス時に遅延インポートする（PEP 562）。
+"""
 
-__all__ = ["ExclusionFilter", "GoogleMapsScraper", "ClaudeValidator", "SheetsWriter"]
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.services.exclusion_filter import ExclusionFilter
+    from app.services.google_maps import GoogleMapsScraper
+    from app.services.claude_validator import ClaudeValidator
+    from app.services.sheets_writer import SheetsWriter
+
+_LAZY_EXPORTS = {
+    "ExclusionFilter": "app.services.exclusion_filter",
+    "GoogleMapsScraper": "app.services.google_maps",
+    "ClaudeValidator": "app.services.claude_validator",
+    "SheetsWriter": "app.services.sheets_writer",
+}
+
+__all__ = [
+    "ExclusionFilter",
+    "GoogleMapsScraper",
+    "ClaudeValidator",
+    "SheetsWriter",
+    "get_scraper",
+    "get_validator",
+]
+
+
+@lru_cache(maxsize=1)
+def get_scraper() -> "GoogleMapsScraper":
+    """リクエスト間で共有するスクレイパー（状態を持たないため使い回す）"""
+    from app.services.google_maps import GoogleMapsScraper
+
+    return GoogleMapsScraper()
+
+
+@lru_cache(maxsize=1)
+def get_validator() -> "ClaudeValidator":
+    """リクエスト間で共有するバリデーター（anthropicクライアントの接続プールを使い回す）"""
+    from app.services.claude_validator import ClaudeValidator
+
+    return ClaudeValidator()
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
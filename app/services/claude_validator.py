@@ -2,9 +2,17 @@
 
 import json
 import logging
-from typing import TYPE_CHECKING
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import urlsplit
 
 import anthropic
+from anthropic.types import TextBlockParam
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -14,19 +22,70 @@ from tenacity import (
 
 from app.config import config
 from app.exceptions import ValidationError
+from app.models.clinic import CLINIC_LIST_ADAPTER
+
+try:
+    import h2  # noqa: F401  HTTP/2対応（未インストールならHTTP/1.1で接続）
+except ImportError:
+    h2 = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
-    from app.models.clinic import Clinic
+    from app.models.clinic import InternalClinic
 
 logger = logging.getLogger(__name__)
 
+# コードブロックの中身（開始行の言語指定は無視、閉じられていなければ末尾まで）
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)(?:\n```|$)", re.DOTALL)
+
+# サブバッチ（使用モデル, クリニックのリスト）
+SubBatch = tuple[str, list["InternalClinic"]]
+
+# 1件の検証結果が確定するごとに呼ばれるコールバック（クリニック, 有効かどうか）
+ValidationCallback = Callable[["InternalClinic", bool], None]
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> anthropic.DefaultHttpxClient:
+    """全バリデーターで共有するHTTPクライアント（サブバッチの並列リクエストで接続を再利用）"""
+    return anthropic.DefaultHttpxClient(http2=h2 is not None)
+
+
+class _StreamingArrayParser:
+    """ストリーミング応答のJSON配列から、閉じた要素を順に取り出す"""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = -1  # 配列の開始位置が見つかるまでは-1
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> list[dict]:
+        """受信したテキストを追加し、新たに完結した要素を返す"""
+        self._buffer += text
+        if self._pos < 0:
+            start = self._buffer.find("[")
+            if start < 0:
+                return []
+            self._pos = start + 1
+
+        items: list[dict] = []
+        while True:
+            pos = self._pos
+            while pos < len(self._buffer) and self._buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(self._buffer) or self._buffer[pos] != "{":
+                return items
+            try:
+                item, self._pos = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                return items  # 要素の途中まで受信済み
+            items.append(item)
+
 
 class ClaudeValidator:
     """Claude APIによるクリニック情報の検証"""
 
-    VALIDATION_PROMPT = """以下のクリニック情報を検証してください。
-
-{clinics_json}
+    # 固定の指示部分（systemに置きプロンプトキャッシュ対象にする）
+    VALIDATION_PROMPT = """ユーザーメッセージのJSONで渡されるクリニック情報を検証してください。
 
 各クリニックについて、以下の3点を判定してください：
 
@@ -60,91 +119,361 @@ class ClaudeValidator:
 
 JSON配列形式で回答してください（コードブロック不要）：
 [
-  {{
+  {
     "index": 0,
     "is_official_site": true,
     "is_major_chain": false,
     "normalized_name": "クリニック名",
     "reason": "判定理由（簡潔に）"
-  }},
+  },
   ...
 ]"""
 
+    # systemブロック（2回目以降のリクエストはキャッシュから読み込まれる）
+    SYSTEM_BLOCKS: list[TextBlockParam] = [
+        {
+            "type": "text",
+            "text": VALIDATION_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
     def __init__(self) -> None:
         api_key = config.anthropic_api_key
         if not api_key:
             logger.warning("ANTHROPIC_API_KEY is not set")
 
-        self.client = anthropic.Anthropic(api_key=api_key) if api_key else None
+        # リトライはtenacityで行うため、SDK側のリトライは無効にする
+        self.client = (
+            anthropic.Anthropic(
+                api_key=api_key, http_client=_get_http_client(), max_retries=0
+            )
+            if api_key
+            else None
+        )
         self.model = config.claude_model
+        self.easy_model = config.claude_easy_model
+        self.major_chain_domains = tuple(config.claude_major_chain_domains)
+        self.portal_domains = tuple(config.claude_portal_domains)
         self.batch_size = config.claude_batch_size
-
-    def validate_batch(self, clinics: list["Clinic"]) -> list[dict]:
+        self.concurrency = config.claude_concurrency
+        self.batch_poll_seconds = config.claude_batch_poll_seconds
+        self.batch_max_wait_seconds = config.claude_batch_max_wait_seconds
+
+    def validate_batch(
+        self,
+        clinics: list["InternalClinic"],
+        on_result: ValidationCallback | None = None,
+    ) -> list[dict]:
         """
         複数クリニックをバッチで検証
 
         Args:
             clinics: クリニック情報のリスト
+            on_result: 1件ごとの検証結果を受け取るコールバック（指定時は応答をストリーミングで受信。リトライ時も1件につき1回）
 
         Returns:
             検証結果を含むクリニック情報のリスト（dict形式）
         """
-        import time
         start_time = time.time()
-        logger.info(f"[CLAUDE] 検証開始: {len(clinics)}件, モデル={self.model}, バッチサイズ={self.batch_size}")
+        logger.info("[CLAUDE] 検証開始: %s件, モデル=%s, バッチサイズ=%s", len(clinics), self.model, self.batch_size)
+
+        # ポータルサイトのURLはClaudeに送らずに無効と判定
+        prefiltered, clinics_for_llm = self._prefilter(clinics)
 
         if not self.client:
             logger.warning("[CLAUDE] API client未初期化、検証スキップ")
-            return [
-                {**clinic.model_dump(), "is_valid": True, "validation_reason": "API未設定"}
-                for clinic in clinics
-            ]
+            return self._restore_order(
+                clinics, prefiltered + self._unvalidated_results(clinics_for_llm, "API未設定")
+            )
+
+        sub_batches = self._split_batches(clinics_for_llm)
+        total_batches = len(sub_batches)
+        workers = min(total_batches, self.concurrency)
+
+        # サブバッチを並列に検証（各リクエストは独立したHTTP呼び出し、結果は元の順序で結合）
+        results: list[dict] = prefiltered
+        if workers <= 1:
+            for batch_num, sub_batch in enumerate(sub_batches, 1):
+                results.extend(
+                    self._validate_sub_batch(sub_batch, batch_num, total_batches, on_result)
+                )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="claude-validate"
+            ) as executor:
+                for batch_results in executor.map(
+                    self._validate_sub_batch,
+                    sub_batches,
+                    range(1, total_batches + 1),
+                    [total_batches] * total_batches,
+                    [on_result] * total_batches,
+                ):
+                    results.extend(batch_results)
+        results = self._restore_order(clinics, results)
 
-        results: list[dict] = []
-        total_batches = (len(clinics) + self.batch_size - 1) // self.batch_size
+        total_elapsed = time.time() - start_time
+        valid_count = sum(1 for r in results if r.get("is_valid", False))
+        logger.info("[CLAUDE] 検証完了: %s件中 %s件有効 (%.1f秒)", len(results), valid_count, total_elapsed)
 
-        # バッチに分割して処理
-        for batch_num, i in enumerate(range(0, len(clinics), self.batch_size), 1):
-            batch = clinics[i : i + self.batch_size]
-            batch_start_index = i
+        return results
 
-            logger.info(f"[CLAUDE] バッチ {batch_num}/{total_batches} 処理中 ({len(batch)}件)...")
+    def validate_batch_via_batch_api(self, clinics: list["InternalClinic"]) -> list[dict]:
+        """
+        Message Batches APIで複数クリニックを一括検証
 
-            try:
-                batch_start = time.time()
-                batch_results = self._validate_batch_internal(batch, batch_start_index)
-                batch_elapsed = time.time() - batch_start
-                logger.info(f"[CLAUDE] バッチ {batch_num}/{total_batches} 完了: {batch_elapsed:.1f}秒")
-                results.extend(batch_results)
-            except Exception as e:
-                logger.error(f"[CLAUDE] バッチ {batch_num} 検証失敗: {type(e).__name__}: {e}")
-                # エラー時は元のデータを返す（手動確認用）
-                for clinic in batch:
-                    results.append(
-                        {
-                            **clinic.model_dump(),
-                            "is_valid": True,
-                            "validation_reason": f"API error: {e}",
-                        }
-                    )
+        全サブバッチを1回のリクエストで送信し、処理完了までポーリングする（完了までブロックする）。
+        batch_max_wait_seconds以内に完了しなければバッチをキャンセルし、同期APIで検証する。
+
+        Args:
+            clinics: クリニック情報のリスト
+
+        Returns:
+            検証結果を含むクリニック情報のリスト（dict形式）
+        """
+        if not self.client or not clinics:
+            return self.validate_batch(clinics)
+
+        start_time = time.time()
+        prefiltered, clinics_for_llm = self._prefilter(clinics)
+        if not clinics_for_llm:
+            return prefiltered
+
+        sub_batches = {
+            f"batch-{batch_num}": sub_batch
+            for batch_num, sub_batch in enumerate(self._split_batches(clinics_for_llm), 1)
+        }
+        requests = [
+            Request(
+                custom_id=custom_id,
+                params=MessageCreateParamsNonStreaming(
+                    model=model,
+                    max_tokens=4096,
+                    system=self.SYSTEM_BLOCKS,
+                    messages=[{"role": "user", "content": self._build_prompt(batch)}],
+                ),
+            )
+            for custom_id, (model, batch) in sub_batches.items()
+        ]
+
+        try:
+            message_batch = self.client.messages.batches.create(requests=requests)
+        except anthropic.APIError as e:
+            logger.error("[CLAUDE] Message Batches送信失敗、同期APIで検証: %s: %s", type(e).__name__, e)
+            return self.validate_batch(clinics)
+
+        logger.info("[CLAUDE] Message Batches送信: id=%s, %s件, %sバッチ", message_batch.id, len(clinics_for_llm), len(sub_batches))
+
+        results_by_id: dict[str, list[dict]] = {}
+        try:
+            deadline = time.monotonic() + self.batch_max_wait_seconds
+            while message_batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{self.batch_max_wait_seconds}秒以内に完了しませんでした")
+                time.sleep(self.batch_poll_seconds)
+                message_batch = self.client.messages.batches.retrieve(message_batch.id)
+
+            for entry in self.client.messages.batches.results(message_batch.id):
+                sub_batch = sub_batches.get(entry.custom_id)
+                if sub_batch is None:
+                    continue
+                if entry.result.type != "succeeded":
+                    logger.warning("[CLAUDE] %s 失敗 (%s)、同期APIで再検証", entry.custom_id, entry.result.type)
+                    continue
+                try:
+                    validations = self._parse_validations(entry.result.message.content[0].text)
+                except json.JSONDecodeError as e:
+                    logger.warning("[CLAUDE] %s 応答のパース失敗、同期APIで再検証: %s", entry.custom_id, e)
+                    continue
+                results_by_id[entry.custom_id] = self._merge_validations(sub_batch[1], validations)
+        except Exception as e:
+            logger.error("[CLAUDE] Message Batches処理失敗: %s: %s", type(e).__name__, e)
+            if message_batch.processing_status != "ended":
+                # 待ち続けてもワーカーを塞ぐだけなのでキャンセルし、未取得のサブバッチは同期APIで検証
+                try:
+                    self.client.messages.batches.cancel(message_batch.id)
+                except anthropic.APIError as cancel_error:
+                    logger.warning("[CLAUDE] Message Batchesのキャンセル失敗: %s", cancel_error)
+
+        # 結果を元の順序で結合（失敗したサブバッチは同期APIで再検証）
+        results: list[dict] = prefiltered
+        for batch_num, (custom_id, sub_batch) in enumerate(sub_batches.items(), 1):
+            batch_results = results_by_id.get(custom_id)
+            if batch_results is None:
+                batch_results = self._validate_sub_batch(sub_batch, batch_num, len(sub_batches))
+            results.extend(batch_results)
+        results = self._restore_order(clinics, results)
 
         total_elapsed = time.time() - start_time
         valid_count = sum(1 for r in results if r.get("is_valid", False))
-        logger.info(f"[CLAUDE] 検証完了: {len(results)}件中 {valid_count}件有効 ({total_elapsed:.1f}秒)")
+        logger.info("[CLAUDE] Message Batches検証完了: %s件中 %s件有効 (%.1f秒)", len(results), valid_count, total_elapsed)
 
         return results
 
+    def _prefilter(
+        self, clinics: list["InternalClinic"]
+    ) -> tuple[list[dict], list["InternalClinic"]]:
+        """
+        Claudeに送るまでもなく判定できるクリニックを先に振り分ける
+
+        Returns:
+            (判定済みの結果, Claudeでの検証が必要なクリニック)
+        """
+        prefiltered: list["InternalClinic"] = []
+        clinics_for_llm: list["InternalClinic"] = []
+        for clinic in clinics:
+            if clinic.url and self._host_matches(clinic.url, self.portal_domains):
+                prefiltered.append(clinic)
+            else:
+                clinics_for_llm.append(clinic)
+
+        if prefiltered:
+            logger.info("[CLAUDE] ポータルサイトのURLを検証対象外: %s件", len(prefiltered))
+        results = [
+            {
+                **clinic_dict,
+                "is_official_site": False,
+                "is_major_chain": False,
+                "normalized_name": clinic_dict["name"],
+                "validation_reason": "ポータルサイトのURL",
+                "is_valid": False,
+            }
+            for clinic_dict in CLINIC_LIST_ADAPTER.dump_python(prefiltered)
+        ]
+        return results, clinics_for_llm
+
+    def _split_batches(self, clinics: list["InternalClinic"]) -> list[SubBatch]:
+        """
+        判定の難易度でモデルを振り分け、batch_size件ごとのサブバッチに分割
+
+        URLなし・大手チェーンのドメインは判定が容易なためeasy_modelで検証し、
+        それ以外はself.modelで検証する。
+        """
+        hard: list["InternalClinic"] = []
+        easy: list["InternalClinic"] = []
+        for clinic in clinics:
+            (easy if self.easy_model and self._is_easy(clinic) else hard).append(clinic)
+
+        return [
+            (model, group[i : i + self.batch_size])
+            for model, group in ((self.model, hard), (self.easy_model, easy))
+            for i in range(0, len(group), self.batch_size)
+        ]
+
+    def _is_easy(self, clinic: "InternalClinic") -> bool:
+        """軽量モデルで判定できるクリニックかどうか（URLなし or 大手チェーンのドメイン）"""
+        if not clinic.url:
+            return True
+        return self._host_matches(clinic.url, self.major_chain_domains)
+
+    @staticmethod
+    def _host_matches(url: str, domains: tuple[str, ...]) -> bool:
+        """URLのホストがいずれかのドメイン（またはそのサブドメイン）かどうか"""
+        host = urlsplit(url).hostname or ""
+        return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+    @staticmethod
+    def _restore_order(
+        clinics: list["InternalClinic"], results: list[dict]
+    ) -> list[dict]:
+        """モデル振り分けで入れ替わった結果を入力順に戻す"""
+        order: dict[tuple[str | None, str | None], int] = {
+            (clinic.name, clinic.url): n for n, clinic in enumerate(clinics)
+        }
+        return sorted(
+            results, key=lambda r: order.get((r.get("name"), r.get("url")), len(order))
+        )
+
+    def _validate_sub_batch(
+        self,
+        sub_batch: SubBatch,
+        batch_num: int,
+        total_batches: int,
+        on_result: ValidationCallback | None = None,
+    ) -> list[dict]:
+        """サブバッチを同期APIで検証（失敗時は未検証のまま返す）"""
+        model, batch = sub_batch
+        logger.info("[CLAUDE] バッチ %s/%s 処理中 (%s件, モデル=%s)...", batch_num, total_batches, len(batch), model)
+        try:
+            batch_start = time.time()
+            batch_results = self._validate_batch_internal(batch, model, on_result)
+            batch_elapsed = time.time() - batch_start
+            logger.info("[CLAUDE] バッチ %s/%s 完了: %.1f秒", batch_num, total_batches, batch_elapsed)
+            return batch_results
+        except Exception as e:
+            logger.error("[CLAUDE] バッチ %s 検証失敗: %s: %s", batch_num, type(e).__name__, e)
+            # エラー時は元のデータを返す（手動確認用）
+            return self._unvalidated_results(batch, f"API error: {e}")
+
+    @staticmethod
+    def _unvalidated_results(
+        clinics: list["InternalClinic"], reason: str
+    ) -> list[dict]:
+        """検証できなかったクリニックを有効扱いで返す"""
+        return [
+            {**clinic_dict, "is_valid": True, "validation_reason": reason}
+            for clinic_dict in CLINIC_LIST_ADAPTER.dump_python(clinics)
+        ]
+
+    def _validate_batch_internal(
+        self,
+        clinics: list["InternalClinic"],
+        model: str | None = None,
+        on_result: ValidationCallback | None = None,
+    ) -> list[dict]:
+        """バッチ検証の内部実装"""
+        logger.debug("Validating batch of %s clinics", len(clinics))
+
+        # 通知済みのindex（リトライ間で共有し、再送信した試行では未通知の要素だけ通知する）
+        notified: set[int] = set()
+        validations = self._request_validations(clinics, model, on_result, notified)
+        return self._merge_validations(clinics, validations)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type((json.JSONDecodeError, anthropic.APIError)),
         reraise=True,
     )
-    def _validate_batch_internal(
-        self, clinics: list["Clinic"], start_index: int
+    def _request_validations(
+        self,
+        clinics: list["InternalClinic"],
+        model: str | None,
+        on_result: ValidationCallback | None,
+        notified: set[int],
     ) -> list[dict]:
-        """バッチ検証の内部実装"""
+        """検証リクエストを送信し、応答の検証結果を返す（APIエラー・JSONの解析失敗時はリトライ）"""
+        client = self.client
+        if client is None:
+            raise ValidationError("ANTHROPIC_API_KEY is not set")
+        params: dict[str, Any] = {
+            "model": model or self.model,
+            "max_tokens": 4096,
+            "system": self.SYSTEM_BLOCKS,
+            "messages": [{"role": "user", "content": self._build_prompt(clinics)}],
+        }
+        if on_result is None:
+            response = client.messages.create(**params)
+        else:
+            # ストリーミングで受信し、配列の要素が閉じるごとにコールバックへ通知
+            parser = _StreamingArrayParser()
+            with client.messages.stream(**params) as stream:
+                for text in stream.text_stream:
+                    for validation in parser.feed(text):
+                        idx = validation.get("index", 0)
+                        if isinstance(idx, int) and 0 <= idx < len(clinics) and idx not in notified:
+                            notified.add(idx)
+                            on_result(clinics[idx], self._is_valid(validation))
+                response = stream.get_final_message()
+        logger.debug(
+            "Prompt cache: read=%s, created=%s",
+            getattr(response.usage, "cache_read_input_tokens", None),
+            getattr(response.usage, "cache_creation_input_tokens", None),
+        )
+        return self._parse_validations(response.content[0].text)
 
+    def _build_prompt(self, clinics: list["InternalClinic"]) -> str:
+        """検証対象のクリニック情報（ユーザーメッセージ）を作成"""
         # クリニック情報をJSON形式で整形
         clinics_data = [
             {
@@ -155,48 +484,36 @@ JSON配列形式で回答してください（コードブロック不要）：
             }
             for i, clinic in enumerate(clinics)
         ]
-        clinics_json = json.dumps(clinics_data, ensure_ascii=False, indent=2)
+        return json.dumps(clinics_data, ensure_ascii=False, indent=2)
 
-        prompt = self.VALIDATION_PROMPT.format(clinics_json=clinics_json)
-
-        logger.debug(f"Validating batch of {len(clinics)} clinics")
-
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        # レスポンスをパース
-        response_text = response.content[0].text.strip()
+    @staticmethod
+    def _parse_validations(response_text: str) -> list[dict]:
+        """レスポンス本文から検証結果のJSON配列を取り出す"""
+        response_text = response_text.strip()
 
         # JSONブロックを抽出（コードブロックで囲まれている場合に対応）
-        if response_text.startswith("```"):
-            lines = response_text.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.startswith("```") and not in_json:
-                    in_json = True
-                    continue
-                if line.startswith("```") and in_json:
-                    break
-                if in_json:
-                    json_lines.append(line)
-            response_text = "\n".join(json_lines)
+        match = _CODE_FENCE_RE.match(response_text)
+        if match:
+            response_text = match.group(1)
 
         validations = json.loads(response_text)
 
         # デバッグ: Claude APIのレスポンスをログ出力
-        logger.info(f"Claude API response: {json.dumps(validations, ensure_ascii=False)}")
+        logger.info("Claude API response: %s", json.dumps(validations, ensure_ascii=False))
+        return validations
 
-        # 検証結果をクリニック情報にマージ
+    @staticmethod
+    def _merge_validations(
+        clinics: list["InternalClinic"], validations: list[dict]
+    ) -> list[dict]:
+        """検証結果をクリニック情報にマージ"""
+        clinic_dicts = CLINIC_LIST_ADAPTER.dump_python(clinics)
         results: list[dict] = []
         for validation in validations:
             idx = validation.get("index", 0)
             if idx < len(clinics):
                 clinic = clinics[idx]
-                clinic_dict = clinic.model_dump()
+                clinic_dict = dict(clinic_dicts[idx])
 
                 clinic_dict["is_official_site"] = validation.get("is_official_site")
                 clinic_dict["is_major_chain"] = validation.get("is_major_chain", False)
@@ -205,18 +522,22 @@ JSON配列形式で回答してください（コードブロック不要）：
                 )
                 clinic_dict["validation_reason"] = validation.get("reason", "")
 
-                # 有効判定: 公式サイトかつ大手チェーンでない
-                clinic_dict["is_valid"] = (
-                    validation.get("is_official_site") is not False
-                    and validation.get("is_major_chain") is False
-                )
+                clinic_dict["is_valid"] = ClaudeValidator._is_valid(validation)
 
                 results.append(clinic_dict)
 
-        logger.info(f"Validated {len(results)} clinics")
+        logger.info("Validated %s clinics", len(results))
         return results
 
-    def validate_single(self, clinic: "Clinic") -> dict:
+    @staticmethod
+    def _is_valid(validation: dict) -> bool:
+        """有効判定: 公式サイトかつ大手チェーンでない"""
+        return (
+            validation.get("is_official_site") is not False
+            and validation.get("is_major_chain") is False
+        )
+
+    def validate_single(self, clinic: "InternalClinic") -> dict:
         """
         単一クリニックを検証
 
@@ -227,4 +548,6 @@ JSON配列形式で回答してください（コードブロック不要）：
             検証結果を含むクリニック情報（dict形式）
         """
         results = self.validate_batch([clinic])
-        return results[0] if results else {**clinic.model_dump(), "is_valid": True}
+        if results:
+            return results[0]
+        return {**CLINIC_LIST_ADAPTER.dump_python([clinic])[0], "is_valid": True}
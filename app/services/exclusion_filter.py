@@ -1,12 +1,19 @@
 """除外キーワードによるフィルタリング"""
 
 import logging
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Callable
 
 from app.config import config
 
+# Aho-Corasickオートマトン（未インストール環境では正規表現の選択パターンにフォールバック）
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick未インストール環境
+    ahocorasick = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from app.models.clinic import Clinic
+    from app.models.clinic import InternalClinic
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +27,16 @@ class ExclusionFilter:
             keywords: 除外キーワードリスト（指定なしで設定ファイルから読み込み）
         """
         self._keywords = keywords if keywords is not None else config.exclusion_keywords
+        # 小文字化したキーワードと照合器（初回判定時に構築、キーワード変更時に破棄）
+        self._keywords_lower: list[str] = []
+        self._matcher: Callable[[str], bool] | None = None
 
     @property
     def keywords(self) -> list[str]:
         """除外キーワード一覧"""
         return self._keywords.copy()
 
-    def filter(self, clinics: list["Clinic"]) -> list["Clinic"]:
+    def filter(self, clinics: list["InternalClinic"]) -> list["InternalClinic"]:
         """
         除外キーワードに該当するクリニックを除外
 
@@ -36,17 +46,18 @@ class ExclusionFilter:
         Returns:
             フィルタリング後のリスト
         """
-        filtered = []
-        excluded_count = 0
+        matcher = self._get_matcher()
+
+        filtered = [clinic for clinic in clinics if not matcher(clinic.name.lower())]
+        excluded_count = len(clinics) - len(filtered)
 
-        for clinic in clinics:
-            if self.should_exclude(clinic.name):
-                excluded_count += 1
-                logger.debug(f"Excluded: {clinic.name}")
-            else:
-                filtered.append(clinic)
+        if excluded_count and logger.isEnabledFor(logging.DEBUG):
+            kept = {id(clinic) for clinic in filtered}
+            for clinic in clinics:
+                if id(clinic) not in kept:
+                    logger.debug("Excluded: %s", clinic.name)
 
-        logger.info(f"Filtered {excluded_count} clinics by exclusion keywords")
+        logger.info("Filtered %s clinics by exclusion keywords", excluded_count)
         return filtered
 
     def should_exclude(self, name: str) -> bool:
@@ -59,24 +70,47 @@ class ExclusionFilter:
         Returns:
             除外すべき場合True
         """
-        name_lower = name.lower()
-        for keyword in self._keywords:
-            if keyword.lower() in name_lower:
-                return True
-        return False
+        return self._get_matcher()(name.lower())
+
+    def _get_matcher(self) -> Callable[[str], bool]:
+        """照合器を取得（未構築なら構築）"""
+        if self._matcher is None:
+            self._matcher = self._build_matcher()
+        return self._matcher
+
+    def _build_matcher(self) -> Callable[[str], bool]:
+        """小文字化したキーワードから照合器を構築（1回の走査で全キーワードを判定）"""
+        self._keywords_lower = [kw.lower() for kw in self._keywords if kw]
+
+        if not self._keywords_lower:
+            return lambda name_lower: False
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._keywords_lower:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            return lambda name_lower: next(automaton.iter(name_lower), None) is not None
+        pattern = re.compile("|".join(map(re.escape, self._keywords_lower)))
+        return lambda name_lower: pattern.search(name_lower) is not None
+
+    def _invalidate_matcher(self) -> None:
+        """キーワード変更時に照合器を破棄"""
+        self._matcher = None
 
     def add_keyword(self, keyword: str) -> None:
         """除外キーワードを追加"""
         keyword = keyword.strip()
         if keyword and keyword not in self._keywords:
             self._keywords.append(keyword)
-            logger.info(f"Added exclusion keyword: {keyword}")
+            self._invalidate_matcher()
+            logger.info("Added exclusion keyword: %s", keyword)
 
     def remove_keyword(self, keyword: str) -> None:
         """除外キーワードを削除"""
         if keyword in self._keywords:
             self._keywords.remove(keyword)
-            logger.info(f"Removed exclusion keyword: {keyword}")
+            self._invalidate_matcher()
+            logger.info("Removed exclusion keyword: %s", keyword)
 
     def save(self) -> None:
         """現在のキーワードを設定ファイルに保存"""
@@ -1,42 +1,509 @@
 """Google Mapsスクレイピングサービス（Async版）"""
 
 import asyncio
+import atexit
+import hashlib
+import json
 import logging
 import os
 import re
+import tempfile
+import threading
 import time
-import traceback
+import unicodedata
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Any
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator, Any, Coroutine, TypeVar
+from urllib.parse import parse_qs, quote_plus, urlencode, urlsplit
 
-from playwright.async_api import async_playwright, Browser, Page, Playwright, TimeoutError as PlaywrightTimeout
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Request, Route, TimeoutError as PlaywrightTimeout
 
-from app.config import config
+from app.config import Config, config
 from app.exceptions import ScrapingError
-from app.models.clinic import Clinic
+from app.memory import get_memory_mb
+from app.models.clinic import InternalClinic
+
+if TYPE_CHECKING:
+    from playwright._impl._api_structures import SetCookieParam
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 検索結果キャッシュの最大件数（古いものから破棄）
+SEARCH_CACHE_MAX_ENTRIES = 256
+
+# 検索結果キャッシュ（(クエリ, 最大件数) → (取得時刻, 結果)）。地域の検索はスレッドで並列実行されるためロックで保護
+_search_cache: OrderedDict[tuple[str, int], tuple[float, list[InternalClinic]]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+# 検索結果のディスクキャッシュ（プロセスの再起動後も有効期限内なら再利用）
+SEARCH_CACHE_DIR = Config.CACHE_DIR / "search"
 
-def _get_memory_usage_mb() -> float:
-    """現在のメモリ使用量をMB単位で取得"""
+
+def _log_memory(context: str) -> None:
+    """メモリ使用量をログ出力（INFOが無効ならメモリを取得しない）"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[MEMORY] %s: %.1f MB", context, get_memory_mb())
+
+
+# Chromiumの起動引数（メモリ使用量を削減）
+# --single-processは複数タブの描画が1スレッドに直列化されるため使わず、レンダラーのプロセス数を制限する
+BROWSER_LAUNCH_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--renderer-process-limit=2",
+    "--disable-setuid-sandbox",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-first-run",
+    "--no-zygote",
+    # 複数の検索が同じChromiumを使うため、裏側のタブも間引かずに実行させる
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-ipc-flooding-protection",
+    # --disable-featuresは最後の指定のみ有効なため1つにまとめる
+    "--disable-features=site-per-process,AudioServiceOutOfProcess,TranslateUI",
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+    "--hide-scrollbars",
+    "--disable-blink-features=AutomationControlled",
+]
+
+
+# 検索に使うブラウザコンテキストの設定
+CONTEXT_OPTIONS: dict[str, Any] = {
+    "locale": "ja-JP",
+    "viewport": {"width": 1280, "height": 720},
+    "user_agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+# ブラウザ終了時にコンテキストのCookie等を保存し、次回起動時に読み込むファイル
+STORAGE_STATE_PATH = Config.CACHE_DIR / "browser_storage_state.json"
+
+# Googleのクッキー同意済みを示すCookie（同意ダイアログを表示させない）
+CONSENT_COOKIES: list["SetCookieParam"] = [
+    {
+        "name": "CONSENT",
+        "value": "YES+cb.20210328-17-p0.ja+FX",
+        "domain": ".google.com",
+        "path": "/",
+    }
+]
+
+# 抽出に使わないリソース（地図タイル・写真・フォント・字幕・マニフェスト・計測・広告タグ）は読み込まずに中断
+# CSSは結果一覧のスクロール領域やクリック判定（表示状態）に必要なため読み込む
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack", "manifest"})
+BLOCKED_URL_PATTERNS = ("googletagmanager", "google-analytics", "doubleclick", "googlesyndication")
+
+
+# 名前の比較時に除去する半角・全角スペース
+_SPACE_TABLE = str.maketrans("", "", " 　")
+
+
+def _normalize_panel_name(name: str) -> str:
+    """名前の比較用に半角・全角スペースを除去して小文字化"""
+    return name.translate(_SPACE_TABLE).lower()
+
+
+async def _block_unneeded_requests(route: Route) -> None:
+    """不要なリソースへのリクエストを中断"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        pattern in request.url for pattern in BLOCKED_URL_PATTERNS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# パネルの表示テキストから値を取り出すパターン
+_PHONE_RE = re.compile(r"[\d\-]+")
+_RATING_RE = re.compile(r"([\d.]+)")
+_REVIEWS_RE = re.compile(r"([\d,]+)")
+
+# 検索結果の追加読み込みでGoogle Mapsが呼ぶXHR（/search?tbm=map&pb=...）。
+# pbパラメータ（表示範囲などの検索条件）をブラウザでの検索時に記録し、HTTPでの直接取得に再利用する
+SEARCH_XHR_URL = "https://www.google.com/search"
+PB_TEMPLATE_PATH = Config.CACHE_DIR / "gmaps_pb.txt"
+_XSSI_PREFIX = ")]}'"
+_pb_template: str | None = None
+
+
+def _load_pb_template() -> str | None:
+    """記録済みのpbパラメータを取得（初回はファイルから読み込む）"""
+    global _pb_template
+    if _pb_template is None:
+        try:
+            _pb_template = PB_TEMPLATE_PATH.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+    return _pb_template
+
+
+def _record_pb_template(request: Request) -> None:
+    """検索結果XHRのpbパラメータを記録（変わったときだけファイルに書き込む）"""
+    global _pb_template
+    url = urlsplit(request.url)
+    if url.path != "/search":
+        return
+    params = parse_qs(url.query)
+    if params.get("tbm") != ["map"] or not params.get("pb"):
+        return
+    pb = params["pb"][0]
+    if pb == _pb_template:
+        return
+    _pb_template = pb
     try:
-        import resource
-        rusage = resource.getrusage(resource.RUSAGE_SELF)
-        # macOSはbytes、Linuxはkilobytes
-        if os.uname().sysname == "Darwin":
-            return rusage.ru_maxrss / (1024 * 1024)
+        PB_TEMPLATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PB_TEMPLATE_PATH.write_text(pb, encoding="utf-8")
+        logger.info("[SEARCH] 検索XHRのパラメータを記録")
+    except OSError as e:
+        logger.debug("Failed to write pb template %s: %s", PB_TEMPLATE_PATH, e)
+
+
+def _nth(data: Any, *indexes: int) -> Any:
+    """入れ子の配列から要素を取得（途中で配列でない・範囲外ならNone）"""
+    for index in indexes:
+        if not isinstance(data, list) or index >= len(data):
+            return None
+        data = data[index]
+    return data
+
+
+def _parse_search_response(text: str) -> list[dict[str, Any]]:
+    """
+    検索結果XHRのレスポンスからクリニック情報を取り出す
+
+    レスポンスは先頭にXSSI対策の )]}' が付いた入れ子の配列で、各検索結果の
+    場所の情報は [0][1][i][14] にある。構造が想定と異なる場合はValueError。
+    """
+    body = text.strip()
+    if body.endswith('/*""*/'):
+        body = body[:-len('/*""*/')]
+    if body.startswith("{"):
+        body = json.loads(body).get("d", "")
+    if body.startswith(_XSSI_PREFIX):
+        body = body[len(_XSSI_PREFIX):]
+    entries = _nth(json.loads(body), 0, 1)
+    if not isinstance(entries, list):
+        raise ValueError("検索結果の配列が見つかりません")
+
+    rows: list[dict[str, Any]] = []
+    for entry in entries:
+        place = _nth(entry, 14)
+        name = _nth(place, 11)
+        if not isinstance(name, str) or not name:
+            continue
+        url = _nth(place, 7, 0)
+        address = _nth(place, 39)
+        phone_text = _nth(place, 178, 0, 0)
+        rating = _nth(place, 4, 7)
+        reviews = _nth(place, 4, 8)
+        phone_match = _PHONE_RE.search(phone_text) if isinstance(phone_text, str) else None
+        rows.append({
+            "name": name,
+            "url": url if isinstance(url, str) and url else None,
+            "address": address if isinstance(address, str) and address else None,
+            "phone": phone_match.group() if phone_match else None,
+            "rating": float(rating) if isinstance(rating, (int, float)) else None,
+            "reviews": int(reviews) if isinstance(reviews, (int, float)) else None,
+        })
+    return rows
+
+# 詳細パネルの各項目を1回のCDP呼び出しで取得するスクリプト（評価・口コミ数はaria-labelのまま返す）
+PANEL_FIELDS_JS = """() => {
+    const q = (selector) => document.querySelector(selector);
+    const text = (el) => (el ? el.innerText.trim() : null);
+    const attr = (el, name) => (el ? el.getAttribute(name) : null);
+    return {
+        url: attr(q('[data-item-id="authority"]'), "href")
+            || attr(q('a[data-value="ウェブサイト"]'), "href"),
+        address: text(q('[data-item-id="address"] .fontBodyMedium'))
+            || text(q('button[data-item-id="address"]')),
+        phone: text(q('[data-item-id^="phone"]')),
+        rating: attr(q('[role="img"][aria-label*="つ星"]'), "aria-label"),
+        reviews: attr(q('[aria-label*="件のクチコミ"]'), "aria-label"),
+    };
+}"""
+
+
+# 検索結果ページの種類の判定用（結果一覧の有無, 最初のh1のテキスト）
+RESULTS_PAGE_JS = """() => {
+    const h1 = document.querySelector("h1");
+    return [document.querySelector('[role="feed"]') !== null, h1 ? h1.innerText : ""];
+}"""
+
+# 結果一覧を最下部までスクロールして追加読み込みを繰り返し、読み込んだ件数を返す（結果一覧がなければ-1）
+# 最大件数に達するか、スクロールしても1秒以内に件数が増えないことが3回続いたら終了
+SCROLL_RESULTS_JS = """async (maxResults) => {
+    const feed = document.querySelector('[role="feed"]');
+    if (!feed) return -1;
+    const count = () => document.querySelectorAll('a[href*="/maps/place/"]').length;
+    const grew = (prev) => new Promise((resolve) => {
+        const deadline = performance.now() + 1000;
+        const check = () => {
+            if (count() > prev) resolve(true);
+            else if (performance.now() >= deadline) resolve(false);
+            else setTimeout(check, 100);
+        };
+        check();
+    });
+    let stale = 0;
+    while (stale < 3) {
+        const current = count();
+        if (current >= maxResults) break;
+        feed.scrollTop = feed.scrollHeight;
+        stale = (await grew(current)) ? 0 : stale + 1;
+    }
+    return count();
+}"""
+
+# 詳細パネルのh1が期待するクリニック名と一致したらtrue（DOMの更新ごとに評価される）
+# 空白除去・小文字化した名前の一方が他方を含めば一致（_names_matchと同じ判定）
+PANEL_NAME_MATCH_JS = """(expected) => {
+    const h1 = document.querySelector("h1.DUwDvf");
+    if (!h1) return false;
+    const actual = h1.innerText.replace(/[ 　]/g, "").toLowerCase();
+    return actual !== "" && (actual.includes(expected) || expected.includes(actual));
+}"""
+
+
+class _BrowserPool:
+    """
+    検索間で共有するChromiumとブラウザコンテキスト（参照カウント付き）
+
+    Playwrightのオブジェクトは作成したイベントループでしか使えないため、
+    専用スレッドで常駐するイベントループ上でブラウザを起動・操作する。
+    検索ごとに作成するのはページのみで、Cookie等のコンテキストの状態は
+    ブラウザ終了時にファイルへ保存し、次回起動時に引き継ぐ。
+    使用中の検索がないままアイドル時間が経過したらブラウザを終了する。
+    長時間の稼働でChromiumのメモリが増え続けないよう、一定回数使用したら次の取得時に再起動する。
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
+        # 以下はイベントループのスレッドからのみ操作する
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
+        self._refcount = 0
+        # 起動してからの取得回数（使用回数の上限に達したら使用中の検索がないときに再起動）
+        self._uses = 0
+        self._launch_lock: asyncio.Lock | None = None
+        self._idle_handle: asyncio.TimerHandle | None = None
+        # 終了処理中のページ（完了前にタスクが破棄されないよう参照を保持）
+        self._closing: set[asyncio.Task] = set()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """コルーチンをブラウザ用のイベントループで実行し、完了を待つ"""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """ブラウザ用のイベントループ（初回呼び出し時に専用スレッドで開始）"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="browser-pool", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    async def acquire(self, headless: bool = True) -> BrowserContext:
+        """起動済みのブラウザのコンテキストを取得（未起動・切断済みなら起動、同時の起動要求は1回にまとめる）"""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._idle_handle is not None:
+                self._idle_handle.cancel()
+                self._idle_handle = None
+            if self._browser is None or not self._browser.is_connected():
+                await self._shutdown()
+                await self._launch(headless)
+            elif self._refcount == 0 and 0 < config.browser_max_uses <= self._uses:
+                logger.info("[BROWSER] 使用回数の上限(%s回)に達したため再起動", self._uses)
+                await self._shutdown()
+                await self._launch(headless)
+            context = self._context
+            if context is None:
+                raise ScrapingError("Browser context is not available")
+            self._refcount += 1
+            self._uses += 1
+            return context
+
+    def release_page(self, page: Page | None) -> None:
+        """検索で使ったページをバックグラウンドで閉じ、閉じ終えたらブラウザの使用を終了"""
+        task = asyncio.ensure_future(self._close_page(page))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_page(self, page: Page | None) -> None:
+        """ページを閉じる（短いタイムアウトでメモリ解放を優先）"""
+        try:
+            if page:
+                await asyncio.wait_for(page.close(), timeout=2.0)
+                logger.info("[BROWSER] ページ終了完了")
+        except asyncio.TimeoutError:
+            logger.warning("[BROWSER] ページ終了タイムアウト(2秒)")
+        except Exception as e:
+            logger.warning("[BROWSER] ページ終了エラー: %s", e)
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """ブラウザの使用を終了（使用中の検索がなくなればアイドルタイマーを開始）"""
+        self._refcount -= 1
+        if self._refcount > 0:
+            return
+        idle_timeout = max(0, config.browser_idle_timeout_seconds)
+        self._idle_handle = asyncio.get_running_loop().call_later(
+            idle_timeout, lambda: asyncio.ensure_future(self._close_if_idle())
+        )
+
+    async def _launch(self, headless: bool) -> None:
+        """PlaywrightとChromiumを起動（CDPエンドポイント設定時は起動済みのChromiumに接続）"""
+        _log_memory("ブラウザ起動前")
+        self._uses = 0
+        logger.info("[BROWSER] Playwright開始...")
+        self._playwright = await async_playwright().start()
+
+        # 複数プロセス（gunicornワーカー等）で1つのChromiumを共有する場合
+        cdp_endpoint = config.browser_cdp_endpoint
+        if cdp_endpoint:
+            logger.info("[BROWSER] Chromiumに接続中: %s", cdp_endpoint)
+            self._browser = await self._playwright.chromium.connect_over_cdp(cdp_endpoint)
         else:
-            return rusage.ru_maxrss / 1024
-    except Exception:
-        return 0.0
+            logger.info("[BROWSER] Chromium起動中...")
+            self._browser = await self._playwright.chromium.launch(
+                headless=headless, args=BROWSER_LAUNCH_ARGS
+            )
+            _log_memory("Chromium起動後")
 
+        logger.info("[BROWSER] コンテキスト作成中...")
+        try:
+            self._context = await self._new_context(self._browser)
+        except BaseException:
+            # 起動途中の状態で残すと次のacquireがコンテキストなしで返るため、終了して未起動に戻す
+            await self._shutdown()
+            raise
 
-def _log_memory(context: str) -> None:
-    """メモリ使用量をログ出力"""
-    mem_mb = _get_memory_usage_mb()
-    logger.info(f"[MEMORY] {context}: {mem_mb:.1f} MB")
+    @staticmethod
+    async def _new_context(browser: Browser) -> BrowserContext:
+        """コンテキストを作成（保存済みの状態を読み込めなければ破棄し、状態なしで作り直す）"""
+        storage_state = STORAGE_STATE_PATH if STORAGE_STATE_PATH.exists() else None
+        try:
+            context = await browser.new_context(**CONTEXT_OPTIONS, storage_state=storage_state)
+        except Exception as e:
+            if storage_state is None:
+                raise
+            logger.warning("[BROWSER] 保存済みの状態を読み込めないため破棄: %s: %s", type(e).__name__, e)
+            STORAGE_STATE_PATH.unlink(missing_ok=True)
+            context = await browser.new_context(**CONTEXT_OPTIONS)
+        # 同意済みのCookieを設定し、同意ダイアログの表示を避ける
+        await context.add_cookies(CONSENT_COOKIES)
+        await context.route("**/*", _block_unneeded_requests)
+        return context
+
+    async def _close_if_idle(self) -> None:
+        """アイドルタイマー満了時、使用中の検索がなければブラウザを終了"""
+        lock = self._launch_lock
+        if lock is None:
+            return
+        async with lock:
+            self._idle_handle = None
+            if self._refcount == 0:
+                await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        """
+        ChromiumとPlaywrightを終了（短いタイムアウトでメモリ解放を優先）
+
+        CDPで接続したChromiumは切断のみで、Chromium自体は終了しない。
+        """
+        if self._browser is None and self._playwright is None:
+            return
+        logger.info("[BROWSER] ブラウザ終了開始...")
+        cleanup_start = time.time()
+
+        context, self._context = self._context, None
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        if context:
+            # Cookie等を次回起動時に引き継ぐ
+            try:
+                STORAGE_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                await asyncio.wait_for(context.storage_state(path=STORAGE_STATE_PATH), timeout=2.0)
+            except Exception as e:
+                logger.warning("[BROWSER] コンテキストの状態保存失敗: %s: %s", type(e).__name__, e)
+
+        if browser:
+            try:
+                await asyncio.wait_for(browser.close(), timeout=2.0)
+                logger.info("[BROWSER] ブラウザ終了完了")
+            except asyncio.TimeoutError:
+                logger.warning("[BROWSER] ブラウザ終了タイムアウト(2秒)")
+            except Exception as e:
+                logger.warning("[BROWSER] ブラウザ終了エラー: %s", e)
+
+        if playwright:
+            try:
+                await asyncio.wait_for(playwright.stop(), timeout=2.0)
+                logger.info("[BROWSER] Playwright停止完了")
+            except asyncio.TimeoutError:
+                logger.warning("[BROWSER] Playwright停止タイムアウト(2秒)")
+            except Exception as e:
+                logger.warning("[BROWSER] Playwright停止エラー: %s", e)
+
+        cleanup_elapsed = time.time() - cleanup_start
+        logger.info("[BROWSER] ブラウザ終了完了 (%.1f秒)", cleanup_elapsed)
+        _log_memory("ブラウザ終了後")
+
+    def close(self) -> None:
+        """
+        ブラウザとイベントループを終了（何度呼んでもよい）
+
+        終了後に再び使われた場合は、新しいイベントループでブラウザを起動し直す。
+        """
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+            if loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5.0)
+            except Exception as e:
+                logger.warning("[BROWSER] 終了時のクリーンアップ失敗: %s: %s", type(e).__name__, e)
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5.0)
+            if thread is None or not thread.is_alive():
+                loop.close()
+
+            # イベントループに紐づく状態を破棄
+            self._refcount = 0
+            self._launch_lock = None
+            self._idle_handle = None
+            self._closing.clear()
+
+
+_browser_pool = _BrowserPool()
+# プロセス終了時にChromiumを残さない
+atexit.register(_browser_pool.close)
 
 
 class GoogleMapsScraper:
@@ -51,53 +518,35 @@ class GoogleMapsScraper:
         """
         self.headless = headless
         self.max_results = config.max_results_per_query
+        self.cache_ttl = config.search_cache_ttl_seconds
+        self.extract_tabs = config.extract_tabs
+        self.http_fast_path = config.http_fast_path
+        self._closed = False
 
-    @asynccontextmanager
-    async def _browser_context(self) -> AsyncGenerator[Page, None]:
-        """ブラウザコンテキストマネージャー（Async版）"""
-        _log_memory("ブラウザ起動前")
-        logger.info("[BROWSER] Playwright開始...")
+    def __enter__(self) -> "GoogleMapsScraper":
+        return self
 
-        playwright = None
-        browser = None
-        context = None
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
-        try:
-            playwright = await async_playwright().start()
-            logger.info("[BROWSER] Chromium起動中...")
+    def close(self) -> None:
+        """
+        共有ブラウザを終了（CLI・ワーカーの終了時用、何度呼んでもよい）
 
-            # メモリ使用量を削減するブラウザ引数
-            browser = await playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--no-sandbox",
-                    "--single-process",
-                    "--disable-setuid-sandbox",
-                    "--disable-extensions",
-                    "--disable-background-networking",
-                    "--disable-default-apps",
-                    "--disable-sync",
-                    "--disable-translate",
-                    "--no-first-run",
-                    "--disable-features=site-per-process",
-                    "--js-flags=--max-old-space-size=256",
-                ],
-            )
+        ブラウザは全スクレイパーで共有しているため、他の検索が使用中でないときに呼ぶこと。
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _browser_pool.close()
 
-            _log_memory("Chromium起動後")
-            logger.info("[BROWSER] コンテキスト作成中...")
-
-            context = await browser.new_context(
-                locale="ja-JP",
-                viewport={"width": 1280, "height": 720},
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-            )
+    @asynccontextmanager
+    async def _browser_context(self) -> AsyncGenerator[Page, None]:
+        """ブラウザコンテキストマネージャー（共有のコンテキストに検索ごとのページを作成）"""
+        context = await _browser_pool.acquire(self.headless)
+        page = None
+
+        try:
             page = await context.new_page()
             logger.info("[BROWSER] ページ作成完了")
             _log_memory("ページ作成後")
@@ -105,169 +554,300 @@ class GoogleMapsScraper:
             yield page
 
         except Exception as e:
-            logger.error(f"[BROWSER] ブラウザ初期化エラー: {type(e).__name__}: {e}")
-            logger.error(f"[BROWSER] スタックトレース:\n{traceback.format_exc()}")
+            logger.error("[BROWSER] ブラウザ初期化エラー: %s: %s", type(e).__name__, e, exc_info=True)
             raise
         finally:
-            logger.info("[BROWSER] クリーンアップ開始...")
-            cleanup_start = time.time()
+            # ページの終了は待たずに検索結果を返す（ブラウザはアイドル時間経過後にプールが終了する）
+            _browser_pool.release_page(page)
 
-            # Async版のクリーンアップ（短いタイムアウトでメモリ解放を優先）
-            # タイムアウト: 各2秒（合計最大6秒）
-            try:
-                if context:
-                    try:
-                        await asyncio.wait_for(context.close(), timeout=2.0)
-                        logger.info("[BROWSER] コンテキスト終了完了")
-                    except asyncio.TimeoutError:
-                        logger.warning("[BROWSER] コンテキスト終了タイムアウト(2秒)")
-                    except Exception as e:
-                        logger.warning(f"[BROWSER] コンテキスト終了エラー: {e}")
-
-                if browser:
-                    try:
-                        await asyncio.wait_for(browser.close(), timeout=2.0)
-                        logger.info("[BROWSER] ブラウザ終了完了")
-                    except asyncio.TimeoutError:
-                        logger.warning("[BROWSER] ブラウザ終了タイムアウト(2秒)")
-                    except Exception as e:
-                        logger.warning(f"[BROWSER] ブラウザ終了エラー: {e}")
-
-                if playwright:
-                    try:
-                        await asyncio.wait_for(playwright.stop(), timeout=2.0)
-                        logger.info("[BROWSER] Playwright停止完了")
-                    except asyncio.TimeoutError:
-                        logger.warning("[BROWSER] Playwright停止タイムアウト(2秒)")
-                    except Exception as e:
-                        logger.warning(f"[BROWSER] Playwright停止エラー: {e}")
-            except Exception as e:
-                logger.error(f"[BROWSER] クリーンアップ中のエラー: {e}")
-
-            cleanup_elapsed = time.time() - cleanup_start
-            logger.info(f"[BROWSER] クリーンアップ完了 ({cleanup_elapsed:.1f}秒)")
-            _log_memory("ブラウザ終了後")
-
-    def search(self, query: str, max_results: int | None = None) -> list[Clinic]:
+    def search(
+        self, query: str, max_results: int | None = None, force_refresh: bool = False
+    ) -> list[InternalClinic]:
         """
         検索クエリでGoogle Mapsを検索し、クリニック情報を取得
-        （同期インターフェース - 内部でasyncio.runを使用）
+        （同期インターフェース - 共有ブラウザのイベントループで実行）
 
         Args:
             query: 検索クエリ（例: "新宿 AGA"）
             max_results: 最大取得件数（指定なしでデフォルト値使用）
+            force_refresh: キャッシュを使わずに再検索するか
 
         Returns:
             クリニック情報のリスト
         """
-        return asyncio.run(self._search_async(query, max_results))
+        query = self._normalize_query(query)
+        key = (query, max_results or self.max_results)
+        if not force_refresh:
+            cached = self._get_cached(key)
+            if cached is not None:
+                logger.info("[SEARCH] キャッシュ使用: '%s' (%s件)", query, len(cached))
+                return cached
+
+        clinics = _browser_pool.run(self._search_async(query, max_results))
+
+        # 0件は一時的な失敗の可能性があるためキャッシュしない
+        if clinics and self.cache_ttl > 0:
+            fetched_at = time.time()
+            self._remember(key, fetched_at, clinics)
+            self._write_disk_cache(key, fetched_at, clinics)
+        return list(clinics)
+
+    def is_cached(self, query: str, max_results: int | None = None) -> bool:
+        """検索結果がキャッシュ済み（有効期限内）かどうか"""
+        return self._get_cached((self._normalize_query(query), max_results or self.max_results)) is not None
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """検索クエリを正規化（全角スペース・英数字を半角にそろえ、同じ検索が同じキャッシュを使うようにする）"""
+        return " ".join(unicodedata.normalize("NFKC", query).split())
+
+    def _get_cached(self, key: tuple[str, int]) -> list[InternalClinic] | None:
+        """有効期限内のキャッシュ済み検索結果を取得（呼び出し側で変更できるようコピーを返す）"""
+        if self.cache_ttl <= 0:
+            return None
+        with _search_cache_lock:
+            entry = _search_cache.get(key)
+            if entry is not None:
+                fetched_at, clinics = entry
+                if time.time() - fetched_at <= self.cache_ttl:
+                    return list(clinics)
+                del _search_cache[key]
+
+        # メモリになければディスクを確認し、有効なら以降はメモリから返す
+        entry = self._read_disk_cache(key)
+        if entry is None:
+            return None
+        fetched_at, clinics = entry
+        self._remember(key, fetched_at, clinics)
+        return list(clinics)
+
+    @staticmethod
+    def _remember(key: tuple[str, int], fetched_at: float, clinics: list[InternalClinic]) -> None:
+        """検索結果をメモリのキャッシュに追加（上限を超えたら古いものから破棄）"""
+        with _search_cache_lock:
+            _search_cache[key] = (fetched_at, clinics)
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                _search_cache.popitem(last=False)
+
+    @staticmethod
+    def _disk_cache_path(key: tuple[str, int]) -> Path:
+        """検索結果のディスクキャッシュのパス（クエリをハッシュ化したファイル名）"""
+        query, max_results = key
+        digest = hashlib.blake2b(f"{query}|{max_results}".encode("utf-8"), digest_size=16).hexdigest()
+        return SEARCH_CACHE_DIR / f"{digest}.json"
+
+    def _read_disk_cache(self, key: tuple[str, int]) -> tuple[float, list[InternalClinic]] | None:
+        """有効期限内のディスクキャッシュを読み込む（期限切れ・破損したファイルは削除）"""
+        path = self._disk_cache_path(key)
+        try:
+            data = orjson.loads(path.read_bytes())
+            cached_key = tuple(data["key"])
+            fetched_at = float(data["fetched_at"])
+            clinics = [InternalClinic(**row) for row in data["clinics"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError):
+            # orjson.JSONDecodeErrorはValueErrorのサブクラス。不正なファイルはキャッシュミスとして扱う
+            cached_key, fetched_at, clinics = None, 0.0, []
+
+        if cached_key == key and time.time() - fetched_at <= self.cache_ttl:
+            return fetched_at, clinics
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
 
-    async def _search_async(self, query: str, max_results: int | None = None) -> list[Clinic]:
+    def _write_disk_cache(
+        self, key: tuple[str, int], fetched_at: float, clinics: list[InternalClinic]
+    ) -> None:
+        """検索結果をディスクにアトミックに書き込む（失敗しても無視）"""
+        path = self._disk_cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps({
+                        "key": list(key),
+                        "fetched_at": fetched_at,
+                        "clinics": [asdict(clinic) for clinic in clinics],
+                    }))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Failed to write search cache %s: %s", path, e)
+
+    async def _search_async(self, query: str, max_results: int | None = None) -> list[InternalClinic]:
         """検索の非同期実装"""
         max_results = max_results or self.max_results
-        clinics: list[Clinic] = []
         start_time = time.time()
 
-        logger.info(f"[SEARCH] 検索開始: '{query}' (最大: {max_results}件)")
+        logger.info("[SEARCH] 検索開始: '%s' (最大: %s件)", query, max_results)
         _log_memory("検索開始")
 
+        # HTTPで取得できなければブラウザで検索（InternalClinicの生成は最後にまとめて行う）
+        rows = await self._search_via_http(query, max_results) if self.http_fast_path else None
+        if not rows:
+            rows = await self._search_in_browser(query, max_results, start_time)
+
+        clinics = self._build_clinics(rows)
+        elapsed = time.time() - start_time
+        logger.info("[SEARCH] 検索完了: %s件抽出 (%.1f秒)", len(clinics), elapsed)
+        _log_memory("検索完了")
+        return clinics
+
+    async def _search_via_http(self, query: str, max_results: int) -> list[dict[str, Any]] | None:
+        """記録済みの検索XHRのパラメータでHTTPから直接検索（取得・解析できなければNone）"""
+        pb = _load_pb_template()
+        if pb is None:
+            logger.debug("[SEARCH] 検索XHRのパラメータが未記録のためブラウザで検索")
+            return None
+
+        url = f"{SEARCH_XHR_URL}?{urlencode({'tbm': 'map', 'hl': 'ja', 'gl': 'jp', 'q': query, 'pb': pb})}"
+        # ブラウザのコンテキストのCookie（同意状態など）を引き継いでリクエスト
+        context = await _browser_pool.acquire(self.headless)
+        try:
+            response = await context.request.get(url, timeout=15000)
+            if not response.ok:
+                logger.warning("[SEARCH] 検索XHRの取得失敗 (HTTP %s)、ブラウザで検索", response.status)
+                return None
+            rows = _parse_search_response(await response.text())
+        except Exception as e:
+            logger.warning("[SEARCH] 検索XHRの取得・解析失敗、ブラウザで検索: %s: %s", type(e).__name__, e)
+            return None
+        finally:
+            _browser_pool.release()
+
+        rows = rows[:max_results]
+        for row in rows:
+            row["area"] = self._extract_area(row["address"])
+        logger.info("[SEARCH] HTTPで検索結果を取得: %s件", len(rows))
+        return rows
+
+    async def _search_in_browser(
+        self, query: str, max_results: int, start_time: float
+    ) -> list[dict[str, Any]]:
+        """ブラウザでGoogle Mapsを検索し、検索結果の生の抽出結果を返す"""
+        rows: list[dict[str, Any]] = []
+
         async with self._browser_context() as page:
+            if self.http_fast_path:
+                page.on("request", _record_pb_template)
             try:
                 # Google Maps検索
-                search_url = f"{self.BASE_URL}{query.replace(' ', '+')}"
-                logger.info(f"[SEARCH] URL: {search_url}")
+                search_url = f"{self.BASE_URL}{quote_plus(query)}"
+                logger.info("[SEARCH] URL: %s", search_url)
                 logger.info("[SEARCH] ページ読み込み中...")
 
                 try:
                     await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
                     logger.info("[SEARCH] ページ読み込み完了 (domcontentloaded)")
                 except PlaywrightTimeout as e:
-                    logger.error(f"[SEARCH] ページ読み込みタイムアウト (60秒): {e}")
+                    logger.error("[SEARCH] ページ読み込みタイムアウト (60秒): %s", e)
                     raise ScrapingError(f"ページ読み込みタイムアウト: {query}")
                 except Exception as e:
-                    logger.error(f"[SEARCH] ページ読み込みエラー: {type(e).__name__}: {e}")
-                    logger.error(f"[SEARCH] スタックトレース:\n{traceback.format_exc()}")
+                    logger.error("[SEARCH] ページ読み込みエラー: %s: %s", type(e).__name__, e, exc_info=True)
                     raise
 
-                # ページが完全に読み込まれるまで待機
-                logger.info("[SEARCH] 追加待機 (3秒)...")
-                await asyncio.sleep(3)
-                _log_memory("ページ読み込み後")
-
-                # クッキー同意ダイアログがあれば閉じる
+                # クッキー同意ダイアログがあれば閉じ、検索結果が表示されるまで待機
                 await self._handle_consent_dialog(page)
+                await self._wait_for_results(page)
+                _log_memory("ページ読み込み後")
 
                 # 単一結果ページかどうかをチェック
-                feed = await page.query_selector('[role="feed"]')
-                h1_el = await page.query_selector("h1")
-                h1_text = await h1_el.inner_text() if h1_el else ""
-                logger.info(f"[SEARCH] ページ解析: feed={feed is not None}, h1='{h1_text}'")
+                feed, h1_text = await self._inspect_results_page(page)
+                logger.info("[SEARCH] ページ解析: feed=%s, h1='%s'", feed, h1_text)
 
                 # 単一結果ページの場合、クエリを修正してリトライ
                 if not feed and h1_text and h1_text != "結果":
-                    logger.warning(f"[SEARCH] 単一結果ページ検出: {h1_text}")
+                    logger.warning("[SEARCH] 単一結果ページ検出: %s", h1_text)
 
                     retry_keywords = ["クリニック", "病院", "医院"]
                     should_retry = not any(kw in query for kw in retry_keywords)
 
                     if should_retry:
                         modified_query = f"{query} クリニック"
-                        logger.info(f"[SEARCH] クエリを修正してリトライ: '{modified_query}'")
+                        logger.info("[SEARCH] クエリを修正してリトライ: '%s'", modified_query)
 
-                        retry_url = f"{self.BASE_URL}{modified_query.replace(' ', '+')}"
+                        retry_url = f"{self.BASE_URL}{quote_plus(modified_query)}"
                         try:
+                            # 同意ダイアログは初回の読み込みで処理済み（同意状態はコンテキスト内で引き継がれる）
                             await page.goto(retry_url, wait_until="domcontentloaded", timeout=60000)
-                            await asyncio.sleep(3)
-                            await self._handle_consent_dialog(page)
+                            await self._wait_for_results(page)
 
-                            feed = await page.query_selector('[role="feed"]')
-                            h1_el = await page.query_selector("h1")
-                            h1_text = await h1_el.inner_text() if h1_el else ""
-                            logger.info(f"[SEARCH] リトライ後ページ解析: feed={feed is not None}, h1='{h1_text}'")
+                            feed, h1_text = await self._inspect_results_page(page)
+                            logger.info("[SEARCH] リトライ後ページ解析: feed=%s, h1='%s'", feed, h1_text)
                         except Exception as e:
-                            logger.warning(f"[SEARCH] リトライ失敗: {e}")
+                            logger.warning("[SEARCH] リトライ失敗: %s", e)
 
                 # 最終的なページタイプに基づいて処理
                 if not feed and h1_text and h1_text != "結果":
-                    logger.info(f"[SEARCH] 単一結果として抽出: {h1_text}")
-                    clinic = await self._extract_single_result(page, h1_text)
-                    if clinic:
-                        clinics.append(clinic)
-                        logger.info(f"[SEARCH] 単一結果を抽出: {clinic.name}")
+                    logger.info("[SEARCH] 単一結果として抽出: %s", h1_text)
+                    row = await self._extract_single_result(page, h1_text)
+                    if row:
+                        rows.append(row)
+                        logger.info("[SEARCH] 単一結果を抽出: %s", row["name"])
                 else:
                     logger.info("[SEARCH] 複数結果ページ - スクロール開始...")
                     await self._scroll_results(page, max_results)
                     _log_memory("スクロール後")
 
-                    results = await page.query_selector_all('a[href*="/maps/place/"]')
-                    logger.info(f"[SEARCH] 検索結果: {len(results)}件発見")
-
-                    for i, result in enumerate(results[:max_results]):
-                        try:
-                            if i > 0 and i % 10 == 0:
-                                _log_memory(f"抽出中 ({i}件目)")
-
-                            clinic = await self._extract_clinic_info(result, page, i)
-                            if clinic:
-                                clinics.append(clinic)
-                        except Exception as e:
-                            logger.warning(f"[SEARCH] クリニック {i} 抽出エラー: {type(e).__name__}: {e}")
-                            continue
+                    if self.extract_tabs > 1:
+                        rows.extend(await self._extract_in_tabs(page, max_results))
+                    else:
+                        results = await page.query_selector_all('a[href*="/maps/place/"]')
+                        logger.info("[SEARCH] 検索結果: %s件発見", len(results))
+
+                        for i, result in enumerate(results[:max_results]):
+                            try:
+                                row = await self._extract_clinic_info(result, page, i)
+                                if row:
+                                    rows.append(row)
+                            except Exception as e:
+                                logger.warning("[SEARCH] クリニック %s 抽出エラー: %s: %s", i, type(e).__name__, e)
+                                continue
 
             except ScrapingError:
                 raise
             except Exception as e:
                 elapsed = time.time() - start_time
-                logger.error(f"[SEARCH] 検索エラー ({elapsed:.1f}秒経過): {type(e).__name__}: {e}")
-                logger.error(f"[SEARCH] スタックトレース:\n{traceback.format_exc()}")
+                logger.error(
+                    "[SEARCH] 検索エラー (%.1f秒経過): %s: %s", elapsed, type(e).__name__, e, exc_info=True
+                )
                 _log_memory("エラー発生時")
                 raise ScrapingError(f"Google Maps検索中にエラーが発生しました: {type(e).__name__}: {e}")
 
-        elapsed = time.time() - start_time
-        logger.info(f"[SEARCH] 検索完了: {len(clinics)}件抽出 ({elapsed:.1f}秒)")
-        _log_memory("検索完了")
+        return rows
+
+    @staticmethod
+    def _build_clinics(rows: list[dict[str, Any]]) -> list[InternalClinic]:
+        """抽出結果をまとめてInternalClinicに変換（正規化・検証で弾かれた行は除外）"""
+        clinics: list[InternalClinic] = []
+        for row in rows:
+            try:
+                clinics.append(InternalClinic(**row))
+            except (TypeError, ValueError) as e:
+                logger.warning("[SEARCH] Clinicオブジェクト作成失敗: name='%s': %s", row.get("name"), e)
         return clinics
 
+    async def _wait_for_results(self, page: Page) -> None:
+        """検索結果の一覧または単一結果の詳細パネルが表示されるまで待機（固定時間は待たない）"""
+        try:
+            await page.wait_for_selector(
+                '[role="feed"], h1.DUwDvf', state="attached", timeout=15000
+            )
+        except PlaywrightTimeout:
+            logger.warning("[SEARCH] 検索結果の表示待ちタイムアウト(15秒)")
+
+    async def _inspect_results_page(self, page: Page) -> tuple[bool, str]:
+        """結果一覧の有無と最初のh1のテキストを1回のevaluateで取得"""
+        has_feed, h1_text = await page.evaluate(RESULTS_PAGE_JS)
+        return has_feed, h1_text
+
     async def _handle_consent_dialog(self, page: Page) -> None:
         """クッキー同意ダイアログを処理"""
         try:
@@ -279,261 +859,202 @@ class GoogleMapsScraper:
         except Exception:
             pass
 
-    async def _extract_single_result(self, page: Page, name: str) -> Clinic | None:
+    async def _extract_single_result(self, page: Page, name: str) -> dict[str, Any] | None:
         """単一結果ページからクリニック情報を抽出"""
-        logger.debug(f"Extracting single result: {name}")
+        logger.debug("Extracting single result: %s", name)
 
-        url = await self._get_website_url(page)
+        fields = await self._get_panel_fields(page)
+        area = self._extract_area(fields["address"])
 
-        if not url:
-            website_link = await page.query_selector('a[data-item-id="authority"]')
-            if website_link:
-                url = await website_link.get_attribute("href")
+        logger.info("Extracted single result: name=%s, url=%s, area=%s", name, fields["url"], area)
 
-        address = await self._get_text(page, '[data-item-id="address"] .fontBodyMedium')
-        if not address:
-            address_el = await page.query_selector('button[data-item-id="address"]')
-            if address_el:
-                address = await address_el.inner_text()
-
-        phone = await self._get_phone(page)
-        rating = await self._get_rating(page)
-        reviews = await self._get_reviews(page)
-        area = self._extract_area(address)
-
-        logger.info(f"Extracted single result: name={name}, url={url}, area={area}")
-
-        try:
-            clinic = Clinic(
-                name=name,
-                url=url,
-                address=address,
-                phone=phone,
-                rating=rating,
-                reviews=reviews,
-                area=area,
-            )
-            return clinic
-        except Exception as e:
-            logger.warning(f"Failed to create Clinic object for single result: {e}")
-            return None
+        return {"name": name, **fields, "area": area}
 
     async def _scroll_results(self, page: Page, max_results: int) -> None:
-        """検索結果をスクロールして全件読み込み"""
-        results_container = await page.query_selector('[role="feed"]')
-        if not results_container:
+        """検索結果をスクロールして全件読み込み（スクロールと件数の確認はページ内で完結させる）"""
+        total = await page.evaluate(SCROLL_RESULTS_JS, max_results)
+        if total < 0:
             logger.warning("Results container not found")
             return
 
-        prev_count = 0
-        scroll_attempts = 0
-        max_attempts = 30
-
-        while scroll_attempts < max_attempts:
-            results = await page.query_selector_all('a[href*="/maps/place/"]')
-            current_count = len(results)
-
-            if current_count >= max_results:
-                logger.debug(f"Reached max results: {current_count}")
-                break
-
-            if current_count == prev_count:
-                scroll_attempts += 1
-                if scroll_attempts >= 3:
-                    logger.debug("No more results to load")
-                    break
-            else:
-                scroll_attempts = 0
-
-            prev_count = current_count
-
-            await results_container.evaluate("el => el.scrollTop = el.scrollHeight")
-            await asyncio.sleep(1)
-
-        logger.debug(f"Scroll completed, total results: {prev_count}")
+        logger.debug("Scroll completed, total results: %s", total)
 
     async def _extract_clinic_info(
         self, element: Any, page: Page, index: int
-    ) -> Clinic | None:
+    ) -> dict[str, Any] | None:
         """検索結果要素からクリニック情報を抽出"""
         extract_start = time.time()
 
         name = await element.get_attribute("aria-label")
         if not name:
-            logger.debug(f"[EXTRACT][{index}] aria-labelなし、スキップ")
+            logger.debug("[EXTRACT][%s] aria-labelなし、スキップ", index)
             return None
 
-        logger.info(f"[EXTRACT][{index}] 開始: '{name}'")
-
-        prev_h1 = await self._get_text(page, "h1.DUwDvf")
-        logger.debug(f"[EXTRACT][{index}] クリック前 h1.DUwDvf='{prev_h1}'")
+        logger.info("[EXTRACT][%s] 開始: '%s'", index, name)
 
-        click_success = await self._click_element_robust(element, page, index, name)
+        click_success = await self._click_element_robust(element, index, name)
         if not click_success:
             return None
 
-        # パネル更新待機
-        max_wait_attempts = 15
-        panel_ready = False
-
-        for attempt in range(max_wait_attempts):
-            current_h1 = await self._get_text(page, "h1.DUwDvf")
-
-            if current_h1 and self._names_match(current_h1, name):
-                logger.debug(f"[EXTRACT][{index}] パネル更新確認 (attempt={attempt+1}): h1='{current_h1}'")
-                panel_ready = True
-                break
-
-            if current_h1 and current_h1 != prev_h1:
-                logger.debug(f"[EXTRACT][{index}] h1変更検出 (attempt={attempt+1}): '{prev_h1}' -> '{current_h1}'")
-                await asyncio.sleep(0.2)
-                final_h1 = await self._get_text(page, "h1.DUwDvf")
-                if final_h1 and self._names_match(final_h1, name):
-                    logger.debug(f"[EXTRACT][{index}] 最終確認OK: h1='{final_h1}'")
-                    panel_ready = True
-                    break
-
-            await asyncio.sleep(0.2)
+        # パネル更新待機（h1がクリックしたクリニック名になった時点で完了）
+        panel_ready = await self._wait_for_panel(page, name, timeout=3000)
+        if panel_ready:
+            logger.debug("[EXTRACT][%s] パネル更新確認", index)
 
         if not panel_ready:
             final_h1 = await self._get_text(page, "h1.DUwDvf")
-            logger.warning(f"[EXTRACT][{index}] パネル更新タイムアウト: 期待='{name}', 実際h1='{final_h1}'")
+            logger.warning("[EXTRACT][%s] パネル更新タイムアウト: 期待='%s', 実際h1='%s'", index, name, final_h1)
 
             if not final_h1:
-                logger.info(f"[EXTRACT][{index}] JavaScriptクリックで再試行...")
+                logger.info("[EXTRACT][%s] JavaScriptクリックで再試行...", index)
                 try:
                     await element.evaluate("el => el.click()")
-                    await asyncio.sleep(1.0)
-                    final_h1 = await self._get_text(page, "h1.DUwDvf")
-                    if final_h1 and self._names_match(final_h1, name):
-                        logger.info(f"[EXTRACT][{index}] 再クリック成功: h1='{final_h1}'")
+                    if await self._wait_for_panel(page, name, timeout=1000):
+                        logger.info("[EXTRACT][%s] 再クリック成功", index)
                         panel_ready = True
                 except Exception as e:
-                    logger.debug(f"[EXTRACT][{index}] 再クリック失敗: {e}")
+                    logger.debug("[EXTRACT][%s] 再クリック失敗: %s", index, e)
 
             if not panel_ready:
                 final_h1 = await self._get_text(page, "h1.DUwDvf")
                 if final_h1 and not self._names_match(final_h1, name):
-                    logger.warning(f"[EXTRACT][{index}] 名前不一致のためスキップ: h1='{final_h1}'")
+                    logger.warning("[EXTRACT][%s] 名前不一致のためスキップ: h1='%s'", index, final_h1)
                     return None
-                logger.info(f"[EXTRACT][{index}] パネル未確認だがデータ収集を試行")
+                logger.info("[EXTRACT][%s] パネル未確認だがデータ収集を試行", index)
                 await asyncio.sleep(0.5)
 
         await asyncio.sleep(0.3)
 
-        url = await self._get_website_url(page)
-        logger.debug(f"[EXTRACT][{index}] URL取得: {url}")
+        fields = await self._get_panel_fields(page)
+        logger.debug("[EXTRACT][%s] パネル情報取得: %s", index, fields)
+        area = self._extract_area(fields["address"])
 
-        address = await self._get_text(page, '[data-item-id="address"] .fontBodyMedium')
-        logger.debug(f"[EXTRACT][{index}] 住所取得: {address}")
+        extract_elapsed = time.time() - extract_start
+        logger.info(
+            "[EXTRACT][%s] 完了 (%.2f秒): name='%s', url=%s, area=%s",
+            index, extract_elapsed, name, fields["url"], area,
+        )
 
-        phone = await self._get_phone(page)
-        logger.debug(f"[EXTRACT][{index}] 電話番号取得: {phone}")
+        return {"name": name, **fields, "area": area}
 
-        rating = await self._get_rating(page)
-        reviews = await self._get_reviews(page)
-        area = self._extract_area(address)
+    async def _extract_in_tabs(self, page: Page, max_results: int) -> list[dict[str, Any]]:
+        """
+        検索結果の詳細ページを複数タブで並列に開いてクリニック情報を抽出
 
-        extract_elapsed = time.time() - extract_start
-        logger.info(f"[EXTRACT][{index}] 完了 ({extract_elapsed:.2f}秒): name='{name}', url={url}, area={area}")
+        結果一覧のリンクは各クリニックの詳細ページを直接指すため、
+        一覧をクリックする代わりに同じコンテキストのタブでリンク先を開く。
+        """
+        links: list[tuple[str | None, str]] = await page.eval_on_selector_all(
+            'a[href*="/maps/place/"]',
+            "els => els.map(el => [el.getAttribute('aria-label'), el.href])",
+        )
+        links = links[:max_results]
+        logger.info("[SEARCH] 検索結果: %s件発見 (%sタブで抽出)", len(links), self.extract_tabs)
+
+        pending = iter(enumerate(links))
+        rows_by_index: dict[int, dict[str, Any]] = {}
+
+        async def worker() -> None:
+            tab = await page.context.new_page()
+            try:
+                # 各タブが共有のイテレーターから次のリンクを取り出して処理
+                for index, (name, href) in pending:
+                    if not name:
+                        logger.debug("[EXTRACT][%s] aria-labelなし、スキップ", index)
+                        continue
+                    try:
+                        row = await self._extract_place_page(tab, index, name, href)
+                    except Exception as e:
+                        logger.warning("[SEARCH] クリニック %s 抽出エラー: %s: %s", index, type(e).__name__, e)
+                        continue
+                    if row:
+                        rows_by_index[index] = row
+            finally:
+                await tab.close()
+
+        await asyncio.gather(*(worker() for _ in range(min(self.extract_tabs, len(links)))))
+        _log_memory("抽出完了")
+
+        # 結果一覧の順序で返す
+        return [rows_by_index[index] for index in sorted(rows_by_index)]
+
+    async def _extract_place_page(
+        self, tab: Page, index: int, name: str, href: str
+    ) -> dict[str, Any] | None:
+        """詳細ページを開いてクリニック情報を抽出"""
+        extract_start = time.time()
+        logger.info("[EXTRACT][%s] 開始: '%s'", index, name)
 
-        try:
-            clinic = Clinic(
-                name=name,
-                url=url,
-                address=address,
-                phone=phone,
-                rating=rating,
-                reviews=reviews,
-                area=area,
-            )
-            return clinic
-        except Exception as e:
-            logger.warning(f"[EXTRACT][{index}] Clinicオブジェクト作成失敗: {e}")
+        await tab.goto(href, wait_until="domcontentloaded", timeout=30000)
+        if not await self._wait_for_panel(tab, name, timeout=10000):
+            logger.warning("[EXTRACT][%s] 詳細ページの読み込みタイムアウト、スキップ: '%s'", index, name)
             return None
+        await asyncio.sleep(0.3)
+
+        fields = await self._get_panel_fields(tab)
+        area = self._extract_area(fields["address"])
+
+        extract_elapsed = time.time() - extract_start
+        logger.info(
+            "[EXTRACT][%s] 完了 (%.2f秒): name='%s', url=%s, area=%s",
+            index, extract_elapsed, name, fields["url"], area,
+        )
+
+        return {"name": name, **fields, "area": area}
 
     async def _click_element_robust(
-        self, element: Any, page: Page, index: int, name: str
+        self, element: Any, index: int, name: str
     ) -> bool:
-        """要素を確実にクリックする（複数の方法を試行）"""
+        """要素をクリックする（強制クリック → JSクリックの順に試行）"""
         try:
-            await element.scroll_into_view_if_needed()
-            await asyncio.sleep(0.2)
-            logger.debug(f"[EXTRACT][{index}] スクロール完了")
+            await element.scroll_into_view_if_needed(timeout=1500)
         except Exception as e:
-            logger.debug(f"[EXTRACT][{index}] スクロール失敗: {e}")
+            logger.debug("[EXTRACT][%s] スクロール失敗: %s", index, e)
 
         try:
-            await element.click(timeout=5000)
-            logger.debug(f"[EXTRACT][{index}] 通常クリック成功")
+            await element.click(force=True, timeout=2000)
+            logger.debug("[EXTRACT][%s] 強制クリック成功", index)
             return True
         except Exception as e:
-            logger.debug(f"[EXTRACT][{index}] 通常クリック失敗: {type(e).__name__}: {e}")
-
-        try:
-            await element.click(force=True, timeout=5000)
-            logger.debug(f"[EXTRACT][{index}] 強制クリック成功")
-            return True
-        except Exception as e:
-            logger.debug(f"[EXTRACT][{index}] 強制クリック失敗: {type(e).__name__}: {e}")
+            logger.debug("[EXTRACT][%s] 強制クリック失敗: %s: %s", index, type(e).__name__, e)
 
         try:
             await element.evaluate("el => el.click()")
-            logger.debug(f"[EXTRACT][{index}] JSクリック成功")
+            logger.debug("[EXTRACT][%s] JSクリック成功", index)
             return True
         except Exception as e:
-            logger.debug(f"[EXTRACT][{index}] JSクリック失敗: {type(e).__name__}: {e}")
+            logger.debug("[EXTRACT][%s] JSクリック失敗: %s: %s", index, type(e).__name__, e)
 
-        try:
-            await element.evaluate("""el => {
-                const event = new MouseEvent('click', {
-                    bubbles: true,
-                    cancelable: true,
-                    view: window
-                });
-                el.dispatchEvent(event);
-            }""")
-            logger.debug(f"[EXTRACT][{index}] イベント発火成功")
-            return True
-        except Exception as e:
-            logger.debug(f"[EXTRACT][{index}] イベント発火失敗: {type(e).__name__}: {e}")
+        logger.warning("[EXTRACT][%s] クリック失敗: '%s'", index, name)
+        return False
 
+    async def _wait_for_panel(self, page: Page, name: str, timeout: float) -> bool:
+        """詳細パネルのh1が指定の名前（_names_matchと同じ判定）になるまで待機"""
+        expected = _normalize_panel_name(name)
+        if not expected:
+            return False
         try:
-            box = await element.bounding_box()
-            if box:
-                x = box["x"] + box["width"] / 2
-                y = box["y"] + box["height"] / 2
-                await page.mouse.click(x, y)
-                logger.debug(f"[EXTRACT][{index}] 座標クリック成功: ({x}, {y})")
-                return True
-        except Exception as e:
-            logger.debug(f"[EXTRACT][{index}] 座標クリック失敗: {type(e).__name__}: {e}")
-
-        logger.warning(f"[EXTRACT][{index}] 全クリック方法失敗: '{name}'")
-        return False
+            await page.wait_for_function(PANEL_NAME_MATCH_JS, arg=expected, timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            return False
 
     def _names_match(self, h1_name: str, aria_label_name: str) -> bool:
-        """h1のクリニック名とaria-labelの名前が一致するか判定"""
+        """h1のクリニック名とaria-labelの名前が一致するか判定（PANEL_NAME_MATCH_JSと同じ判定）"""
         if not h1_name or not aria_label_name:
             return False
-
         if h1_name == aria_label_name:
             return True
 
-        h1_normalized = h1_name.replace(" ", "").replace("　", "").lower()
-        aria_normalized = aria_label_name.replace(" ", "").replace("　", "").lower()
-
-        if h1_normalized == aria_normalized:
-            return True
-
-        if h1_normalized in aria_normalized or aria_normalized in h1_normalized:
-            return True
-
-        min_len = min(len(h1_normalized), len(aria_normalized))
-        if min_len >= 5 and h1_normalized[:min_len] == aria_normalized[:min_len]:
-            return True
+        h1_normalized = _normalize_panel_name(h1_name)
+        aria_normalized = _normalize_panel_name(aria_label_name)
+        if not h1_normalized or not aria_normalized:
+            return False
 
-        return False
+        # 短い方が長い方に含まれれば一致（前方一致・完全一致もこれに含まれる）
+        if len(h1_normalized) > len(aria_normalized):
+            return aria_normalized in h1_normalized
+        return h1_normalized in aria_normalized
 
     async def _get_text(self, page: Page, selector: str) -> str | None:
         """セレクタからテキストを取得"""
@@ -545,76 +1066,56 @@ class GoogleMapsScraper:
             pass
         return None
 
-    async def _get_website_url(self, page: Page) -> str | None:
-        """公式サイトURLを取得"""
-        try:
-            website_button = await page.query_selector('[data-item-id="authority"]')
-            if website_button:
-                href = await website_button.get_attribute("href")
-                if href:
-                    return href
-
-            website_link = await page.query_selector('a[data-value="ウェブサイト"]')
-            if website_link:
-                href = await website_link.get_attribute("href")
-                if href:
-                    return href
-        except Exception:
-            pass
-        return None
-
-    async def _get_phone(self, page: Page) -> str | None:
-        """電話番号を取得"""
-        try:
-            phone_el = await page.query_selector('[data-item-id^="phone"]')
-            if phone_el:
-                text = await phone_el.inner_text()
-                match = re.search(r"[\d\-]+", text)
-                if match:
-                    return match.group()
-        except Exception:
-            pass
-        return None
-
-    async def _get_rating(self, page: Page) -> float | None:
-        """評価を取得"""
+    async def _get_panel_fields(self, page: Page) -> dict[str, Any]:
+        """詳細パネルのURL・住所・電話番号・評価・口コミ数を1回のevaluateでまとめて取得"""
         try:
-            rating_el = await page.query_selector('[role="img"][aria-label*="つ星"]')
-            if rating_el:
-                label = await rating_el.get_attribute("aria-label")
-                if label:
-                    match = re.search(r"([\d.]+)", label)
-                    if match:
-                        return float(match.group(1))
-        except Exception:
-            pass
-        return None
-
-    async def _get_reviews(self, page: Page) -> int | None:
-        """口コミ数を取得"""
-        try:
-            reviews_el = await page.query_selector('[aria-label*="件のクチコミ"]')
-            if reviews_el:
-                label = await reviews_el.get_attribute("aria-label")
-                if label:
-                    match = re.search(r"([\d,]+)", label)
-                    if match:
-                        return int(match.group(1).replace(",", ""))
-        except Exception:
-            pass
-        return None
+            raw = await page.evaluate(PANEL_FIELDS_JS)
+        except Exception as e:
+            logger.debug("パネル情報の取得失敗: %s", e)
+            raw = {}
+
+        phone = rating = reviews = None
+        if raw.get("phone"):
+            match = _PHONE_RE.search(raw["phone"])
+            if match:
+                phone = match.group()
+        if raw.get("rating"):
+            match = _RATING_RE.search(raw["rating"])
+            if match:
+                try:
+                    rating = float(match.group(1))
+                except ValueError:
+                    pass
+        if raw.get("reviews"):
+            match = _REVIEWS_RE.search(raw["reviews"])
+            if match:
+                try:
+                    reviews = int(match.group(1).replace(",", ""))
+                except ValueError:
+                    pass
+
+        return {
+            "url": raw.get("url") or None,
+            "address": raw.get("address") or None,
+            "phone": phone,
+            "rating": rating,
+            "reviews": reviews,
+        }
 
     def _extract_area(self, address: str | None) -> str:
-        """住所から区名を抽出"""
+        """住所から区名を抽出（区がなければ市名。正規表現を使わず文字列検索で切り出す）"""
         if not address:
             return ""
 
-        match = re.search(r"([^\s]+区)", address)
-        if match:
-            return match.group(1)
-
-        match = re.search(r"([^\s]+市)", address)
-        if match:
-            return match.group(1)
+        for suffix in ("区", "市"):
+            end = address.find(suffix)
+            while end >= 0:
+                # 区・市の直前から空白までさかのぼった範囲が地域名
+                start = end
+                while start > 0 and not address[start - 1].isspace():
+                    start -= 1
+                if start < end:
+                    return address[start:end + 1]
+                end = address.find(suffix, end + 1)
 
         return ""
@@ -2,9 +2,11 @@
 
 import json
 import logging
+import threading
 from typing import Any
 
 import gspread
+from gspread.utils import InsertDataOption, ValueInputOption
 from google.oauth2.service_account import Credentials
 from tenacity import (
     retry,
@@ -18,6 +20,13 @@ from app.exceptions import SheetsError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# 認証済みクライアント（認証情報JSON → クライアント）。OAuthトークン交換をリクエスト間で使い回す
+_client_cache: dict[str, gspread.Client] = {}
+_client_cache_lock = threading.Lock()
+
+# 既存データの判定に使う列（No., クリニック名, 公式サイトURL）。他の列は読み込まない
+EXISTING_DATA_RANGE = "A:C"
+
 
 class SheetsWriter:
     """Google Sheetsへの書き込み"""
@@ -31,6 +40,12 @@ class SheetsWriter:
         self._client: gspread.Client | None = None
         self._spreadsheet_id = config.google_sheets_id
         self._sheet_name = config.google_sheets_name
+        # append_batchedで溜めた書き込み待ちのクリニック
+        self._pending: list[dict] = []
+        # 初回append時に読み込むシートの状態（以降は書き込み内容から更新し、再読み込みしない）
+        self._sheet: gspread.Worksheet | None = None
+        self._existing_urls: set[str] | None = None
+        self._next_no = 1
 
     def _get_client(self) -> gspread.Client:
         """認証済みクライアントを取得"""
@@ -44,12 +59,22 @@ class SheetsWriter:
                 details={"hint": "Set the environment variable with service account JSON"},
             )
 
+        with _client_cache_lock:
+            cached = _client_cache.get(creds_json)
+        if cached is not None:
+            self._client = cached
+            return cached
+
         try:
             creds_dict = json.loads(creds_json)
             credentials = Credentials.from_service_account_info(
                 creds_dict, scopes=self.SCOPES
             )
             self._client = gspread.authorize(credentials)
+            with _client_cache_lock:
+                # 認証情報が変わった場合に古いクライアントが残らないよう1件のみ保持
+                _client_cache.clear()
+                _client_cache[creds_json] = self._client
             return self._client
         except json.JSONDecodeError as e:
             raise ConfigurationError(
@@ -80,7 +105,7 @@ class SheetsWriter:
         """
         import time
         start_time = time.time()
-        logger.info(f"[SHEETS] 書き込み開始: {len(clinics)}件")
+        logger.info("[SHEETS] 書き込み開始: %s件", len(clinics))
 
         if not self._spreadsheet_id:
             raise ConfigurationError(
@@ -88,59 +113,15 @@ class SheetsWriter:
                 details={"hint": "Set the spreadsheet ID from the URL"},
             )
 
-        logger.debug("[SHEETS] Google Sheets API接続中...")
-        client = self._get_client()
-        spreadsheet = client.open_by_key(self._spreadsheet_id)
-        logger.debug(f"[SHEETS] スプレッドシート接続完了: {spreadsheet.title}")
-
-        try:
-            sheet = spreadsheet.worksheet(self._sheet_name)
-            logger.debug(f"[SHEETS] ワークシート取得: {self._sheet_name}")
-        except gspread.exceptions.WorksheetNotFound:
-            # シートがなければ作成
-            logger.info(f"[SHEETS] ワークシート '{self._sheet_name}' が見つかりません。新規作成します。")
-            sheet = spreadsheet.add_worksheet(
-                title=self._sheet_name, rows=1000, cols=20
-            )
-            # ヘッダー行を追加
-            headers = config.output_columns
-            if headers:
-                sheet.append_row(headers)
-            logger.info(f"[SHEETS] 新規ワークシート作成完了: {self._sheet_name}")
-
-        # 既存データ取得（空行を除く）
-        logger.debug("[SHEETS] 既存データ取得中...")
-        all_values = sheet.get_all_values()
-        logger.debug(f"[SHEETS] 全行数: {len(all_values)}")
-
-        # ヘッダー行をスキップして、実際のデータがある行を取得
-        existing_urls: set[str] = set()
-        last_data_row = 1  # ヘッダー行（デフォルト）
-        data_count = 0  # 実際のデータ件数
-
-        for i, row in enumerate(all_values[1:], start=2):  # 2行目から（1行目はヘッダー）
-            # 有効なデータ行の判定:
-            # - No.（1列目）が数値または空でない
-            # - クリニック名（2列目）が空でない
-            # - URL（3列目）が空でないまたはクリニック名が有効
-            has_no = len(row) > 0 and row[0].strip()
-            has_name = len(row) > 1 and row[1].strip()
-            has_url = len(row) > 2 and row[2].strip()
-
-            # クリニック名とURLの両方がある場合のみ有効データとみなす
-            if has_name and has_url:
-                last_data_row = i
-                data_count += 1
-                existing_urls.add(row[2].strip())
-            # クリニック名だけある場合も有効データとみなす（URLがない場合）
-            elif has_name and has_no:
-                last_data_row = i
-                data_count += 1
-
-        logger.info(f"[SHEETS] 既存データ: {data_count}件, 最終行: {last_data_row}, 既存URL数: {len(existing_urls)}")
+        sheet = self._get_worksheet()
+        existing_urls = self._existing_urls
+        if existing_urls is None:
+            existing_urls = self._load_existing(sheet)
+        # このバッチで追加するURL（書き込みに成功するまで保存済みURLには加えない）
+        new_urls: set[str] = set()
 
         # 次のNo.を計算
-        next_no = data_count + 1  # 1から始まる連番
+        next_no = self._next_no
 
         # 新規クリニックのみ抽出
         new_rows: list[list[Any]] = []
@@ -152,14 +133,14 @@ class SheetsWriter:
             name = clinic.get("name", "")
 
             # URLのみで重複チェック（同じクリニック名でも別の院は許可）
-            if url and url in existing_urls:
-                logger.debug(f"[SHEETS] 重複URL: {name} ({url})")
+            if url and (url in existing_urls or url in new_urls):
+                logger.debug("[SHEETS] 重複URL: %s (%s)", name, url)
                 duplicate_count += 1
                 continue
 
             # URLがない場合はスキップ（重複チェックできないため）
             if not url:
-                logger.debug(f"[SHEETS] URL無し: {name}")
+                logger.debug("[SHEETS] URL無し: %s", name)
                 no_url_count += 1
                 continue
 
@@ -184,29 +165,142 @@ class SheetsWriter:
                 "",  # 備考
             ]
             new_rows.append(row)
-            logger.debug(f"[SHEETS] 新規追加: No.{next_no} {name}")
+            logger.debug("[SHEETS] 新規追加: No.%s %s", next_no, name)
 
-            # 追加したURLを記録（同バッチ内の重複防止）
-            existing_urls.add(url)
+            # 追加したURLを記録（同バッチ内での重複防止）
+            new_urls.add(url)
 
             next_no += 1
 
-        logger.info(f"[SHEETS] フィルタ結果: 新規={len(new_rows)}件, 重複={duplicate_count}件, URL無し={no_url_count}件")
+        logger.info("[SHEETS] フィルタ結果: 新規=%s件, 重複=%s件, URL無し=%s件", len(new_rows), duplicate_count, no_url_count)
 
-        # 一括追加（最後のデータ行の次に挿入）
+        # 一括追加（挿入位置はSheets API側で表の末尾に決める。他のセッションが追加した行を上書きしない）
         if new_rows:
-            # 挿入位置を指定して追加
-            start_row = last_data_row + 1
-            logger.info(f"[SHEETS] API書き込み中: {len(new_rows)}件 → 行{start_row}から")
-            sheet.update(f"A{start_row}", new_rows, value_input_option="USER_ENTERED")
+            logger.info("[SHEETS] API書き込み中: %s件", len(new_rows))
+            try:
+                sheet.append_rows(
+                    new_rows,
+                    value_input_option=ValueInputOption.user_entered,
+                    insert_data_option=InsertDataOption.insert_rows,
+                    table_range="A1",
+                )
+            except Exception:
+                # 書き込み結果が不明なため、次回はシートを読み直す
+                self._existing_urls = None
+                raise
+            # 以降の書き込みでの重複防止（load_existing_urlsで返したsetにも反映される）
+            existing_urls.update(new_urls)
+            self._next_no = next_no
             elapsed = time.time() - start_time
-            logger.info(f"[SHEETS] 書き込み完了: {len(new_rows)}件追加 ({elapsed:.1f}秒)")
+            logger.info("[SHEETS] 書き込み完了: %s件追加 (%.1f秒)", len(new_rows), elapsed)
         else:
             elapsed = time.time() - start_time
-            logger.info(f"[SHEETS] 書き込み完了: 新規データなし ({elapsed:.1f}秒)")
+            logger.info("[SHEETS] 書き込み完了: 新規データなし (%.1f秒)", elapsed)
 
         return len(new_rows)
 
+    def _get_worksheet(self) -> gspread.Worksheet:
+        """書き込み先のワークシートを取得（なければ作成）"""
+        if self._sheet is not None:
+            return self._sheet
+
+        logger.debug("[SHEETS] Google Sheets API接続中...")
+        client = self._get_client()
+        spreadsheet = client.open_by_key(self._spreadsheet_id)
+        logger.debug("[SHEETS] スプレッドシート接続完了: %s", spreadsheet.title)
+
+        try:
+            sheet = spreadsheet.worksheet(self._sheet_name)
+            logger.debug("[SHEETS] ワークシート取得: %s", self._sheet_name)
+        except gspread.exceptions.WorksheetNotFound:
+            # シートがなければ作成
+            logger.info("[SHEETS] ワークシート '%s' が見つかりません。新規作成します。", self._sheet_name)
+            sheet = spreadsheet.add_worksheet(
+                title=self._sheet_name, rows=1000, cols=20
+            )
+            # ヘッダー行を追加
+            headers = config.output_columns
+            if headers:
+                sheet.append_row(headers)
+            logger.info("[SHEETS] 新規ワークシート作成完了: %s", self._sheet_name)
+
+        self._sheet = sheet
+        return sheet
+
+    def _load_existing(self, sheet: gspread.Worksheet) -> set[str]:
+        """既存データを読み込み、既存URL・次のNo.を記録（既存URLのsetを返す）"""
+        # 既存データ取得（判定に使う列のみ）
+        logger.debug("[SHEETS] 既存データ取得中...")
+        all_values = sheet.get_values(EXISTING_DATA_RANGE)
+        logger.debug("[SHEETS] 全行数: %s", len(all_values))
+
+        # ヘッダー行をスキップして、実際のデータがある行を取得
+        existing_urls: set[str] = set()
+        last_data_row = 1  # ヘッダー行（デフォルト）
+        data_count = 0  # 実際のデータ件数
+
+        for i, row in enumerate(all_values[1:], start=2):  # 2行目から（1行目はヘッダー）
+            # 有効なデータ行の判定:
+            # - No.（1列目）が数値または空でない
+            # - クリニック名（2列目）が空でない
+            # - URL（3列目）が空でないまたはクリニック名が有効
+            has_no = len(row) > 0 and row[0].strip()
+            has_name = len(row) > 1 and row[1].strip()
+            has_url = len(row) > 2 and row[2].strip()
+
+            # クリニック名とURLの両方がある場合のみ有効データとみなす
+            if has_name and has_url:
+                last_data_row = i
+                data_count += 1
+                existing_urls.add(row[2].strip())
+            # クリニック名だけある場合も有効データとみなす（URLがない場合）
+            elif has_name and has_no:
+                last_data_row = i
+                data_count += 1
+
+        logger.info("[SHEETS] 既存データ: %s件, 最終行: %s, 既存URL数: %s", data_count, last_data_row, len(existing_urls))
+
+        self._existing_urls = existing_urls
+        self._next_no = data_count + 1  # 1から始まる連番
+        return existing_urls
+
+    def load_existing_urls(self) -> set[str]:
+        """
+        シートに保存済みのURLを取得（初回のみシートを読み込む）
+
+        返すsetは以降のappendで追加したURLも反映される。
+
+        Returns:
+            保存済みURLのset
+        """
+        if not self._spreadsheet_id:
+            raise ConfigurationError(
+                "GOOGLE_SHEETS_ID is not set",
+                details={"hint": "Set the spreadsheet ID from the URL"},
+            )
+        if self._existing_urls is None:
+            return self._load_existing(self._get_worksheet())
+        return self._existing_urls
+
+    def append_batched(self, clinics: list[dict]) -> int:
+        """
+        クリニック情報を書き込み待ちに追加（take_pending()で取り出してまとめて書き込む）
+
+        Args:
+            clinics: クリニック情報のリスト
+
+        Returns:
+            書き込み待ちの合計件数
+        """
+        self._pending.extend(clinics)
+        return len(self._pending)
+
+    def take_pending(self) -> list[dict]:
+        """書き込み待ちのクリニックを取り出す（書き込みは呼び出し側でappendする）"""
+        clinics = self._pending
+        self._pending = []
+        return clinics
+
     def test_connection(self) -> dict[str, Any]:
         """
         接続テスト
@@ -249,7 +343,9 @@ class SheetsWriter:
             }
 
     def get_existing_count(self) -> int:
-        """既存レコード数を取得"""
+        """既存レコード数を取得（読み込み済みのシートの状態があればAPIを呼ばない）"""
+        if self._existing_urls is not None:
+            return self._next_no - 1
         try:
             client = self._get_client()
             spreadsheet = client.open_by_key(self._spreadsheet_id)
@@ -57,10 +57,10 @@ def sample_clinic_data():
 @pytest.fixture
 def sample_clinics():
     """複数のサンプルクリニック"""
-    from app.models.clinic import Clinic
+    from app.models.clinic import InternalClinic
 
     return [
-        Clinic(
+        InternalClinic(
             name="テストAGAクリニック新宿院",
             url="https://test-clinic.com",
             address="東京都新宿区西新宿1-1-1",
@@ -69,7 +69,7 @@ def sample_clinics():
             reviews=100,
             area="新宿区",
         ),
-        Clinic(
+        InternalClinic(
             name="AGAスキンクリニック渋谷院",  # 除外対象
             url="https://aga-skin.com",
             address="東京都渋谷区渋谷1-1-1",
@@ -78,7 +78,7 @@ def sample_clinics():
             reviews=200,
             area="渋谷区",
         ),
-        Clinic(
+        InternalClinic(
             name="ローカルAGAクリニック",
             url="https://local-aga.com",
             address="東京都港区六本木1-1-1",
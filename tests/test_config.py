@@ -0,0 +1,81 @@
+"""設定管理のテスト"""
+
+import pytest
+
+from app.config import Config
+
+
+class TestConfig:
+    """Configのテスト"""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path):
+        """テスト用設定ディレクトリ"""
+        (tmp_path / "default.yaml").write_text(
+            'project_name: "テストプロジェクト"\nsearch_suffix: "AGA"\n',
+            encoding="utf-8",
+        )
+        (tmp_path / "exclusion_keywords.yaml").write_text(
+            "exclusion_keywords:\n  - キーワード1\n", encoding="utf-8"
+        )
+        return tmp_path
+
+    @pytest.fixture
+    def config_cls(self, config_dir):
+        """設定ディレクトリを差し替えたConfigクラス"""
+
+        class _TestConfig(Config):
+            CONFIG_DIR = config_dir
+            CACHE_DIR = config_dir / ".cache"
+
+        return _TestConfig
+
+    def test_load_yaml_writes_cache(self, config_cls, config_dir):
+        """YAML読み込み時にキャッシュが作成される"""
+        cfg = config_cls()
+
+        assert cfg.project_name == "テストプロジェクト"
+        assert (config_dir / ".cache" / "default.pkl").exists()
+        assert (config_dir / ".cache" / "exclusion_keywords.pkl").exists()
+
+    def test_load_yaml_cache_revalidated_on_change(self, config_cls, config_dir):
+        """元ファイル変更時はキャッシュを使わず再パース"""
+        config_cls()
+        (config_dir / "default.yaml").write_text(
+            'project_name: "変更後のプロジェクト名"\n', encoding="utf-8"
+        )
+
+        cfg = config_cls()
+
+        assert cfg.project_name == "変更後のプロジェクト名"
+
+    def test_update_exclusion_keywords_persists(self, config_cls):
+        """除外キーワード更新が次回読み込みに反映される"""
+        cfg = config_cls()
+        cfg.update_exclusion_keywords(["新キーワード"])
+
+        assert config_cls().exclusion_keywords == ["新キーワード"]
+
+    def test_env_properties_cached_until_refresh(self, config_cls, monkeypatch):
+        """環境変数はキャッシュされ、refresh()で再読み込みされる"""
+        monkeypatch.setenv("GOOGLE_SHEETS_ID", "sheet-a")
+        cfg = config_cls()
+        assert cfg.google_sheets_id == "sheet-a"
+
+        monkeypatch.setenv("GOOGLE_SHEETS_ID", "sheet-b")
+        assert cfg.google_sheets_id == "sheet-a"
+
+        cfg.refresh()
+        assert cfg.google_sheets_id == "sheet-b"
+
+    def test_update_default_config_refreshes_properties(self, config_cls, monkeypatch):
+        """デフォルト設定更新がプロパティに即時反映される"""
+        monkeypatch.delenv("GOOGLE_SHEETS_NAME", raising=False)
+        cfg = config_cls()
+        assert cfg.google_sheets_name == "営業リスト"
+
+        cfg.update_default_config(search_suffix="美容", sheet_name="新シート")
+
+        assert cfg.search_suffix == "美容"
+        assert cfg.project_name == "テストプロジェクト"
+        assert cfg.google_sheets_name == "新シート"
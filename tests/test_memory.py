@@ -0,0 +1,29 @@
+"""メモリ使用量取得のテスト"""
+
+from unittest.mock import patch
+
+from app import memory
+
+
+class TestMemory:
+    """メモリ使用量取得のテスト"""
+
+    def test_reads_current_rss_from_statm(self, tmp_path):
+        """statmの2列目（RSSのページ数）×ページサイズをMBで返す"""
+        statm = tmp_path / "statm"
+        statm.write_text("5000 2560 300 10 0 900 0\n")
+
+        with patch.object(memory, "IS_LINUX", True), \
+                patch.object(memory, "_STATM_PATH", str(statm)), \
+                patch.object(memory, "_PAGE_SIZE", 4096):
+            assert memory.read_rss_mb() == 10.0
+            assert memory.get_memory_mb() == 10.0
+
+    def test_falls_back_to_max_rss(self, tmp_path):
+        """statmを読めなければgetrusageの最大RSSを返す"""
+        with patch.object(memory, "IS_LINUX", True), \
+                patch.object(memory, "_STATM_PATH", str(tmp_path / "missing")), \
+                patch.object(memory.resource, "getrusage") as mock_getrusage:
+            mock_getrusage.return_value.ru_maxrss = 20 * memory.MAXRSS_DIVISOR
+            assert memory.read_rss_mb() is None
+            assert memory.get_memory_mb() == 20.0
@@ -0,0 +1 @@
+"""モデルテスト"""
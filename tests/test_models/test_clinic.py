@@ -0,0 +1,63 @@
+"""クリニックモデルのテスト"""
+
+import pytest
+
+from app.models.clinic import Clinic, InternalClinic, ScrapeResponse, ValidatedClinic
+
+
+class TestClinicNormalization:
+    """Clinic/InternalClinicの正規化テスト"""
+
+    @pytest.mark.parametrize("model", [Clinic, InternalClinic])
+    @pytest.mark.parametrize(
+        "phone, expected",
+        [
+            ("03-1234-5678", "03-1234-5678"),
+            ("TEL: (03) 1234-5678", "031234-5678"),
+            ("０３-１２３４-５６７８", "０３-１２３４-５６７８"),
+            ("電話 03-1234", "03-1234"),
+            ("なし", None),
+        ],
+    )
+    def test_normalize_phone(self, model, phone, expected):
+        """電話番号は数字とハイフンのみ残す"""
+        assert model(name="テスト", phone=phone).phone == expected
+
+    @pytest.mark.parametrize("model", [Clinic, InternalClinic])
+    def test_normalize_name_and_url(self, model):
+        """名前のトリムとhttp(s)以外のURLの破棄"""
+        clinic = model(name="  テストクリニック ", url="ftp://example.com")
+
+        assert clinic.name == "テストクリニック"
+        assert clinic.url is None
+
+    def test_internal_clinic_rejects_empty_name(self):
+        """空のクリニック名はエラー"""
+        with pytest.raises(ValueError):
+            InternalClinic(name="  ")
+
+    def test_internal_clinic_rejects_invalid_rating(self):
+        """評価が範囲外ならエラー"""
+        with pytest.raises(ValueError):
+            InternalClinic(name="テスト", rating=5.5)
+
+
+class TestScrapeResponse:
+    """スクレイピング結果モデルのテスト"""
+
+    def test_clinics_validated_from_dicts(self):
+        """辞書のクリニックはValidatedClinicとして検証される"""
+        response = ScrapeResponse(
+            success=True, clinics=[{"name": " テスト ", "is_valid": True}]
+        )
+
+        assert isinstance(response.clinics[0], ValidatedClinic)
+        assert response.clinics[0].name == "テスト"
+
+    def test_model_construct_skips_revalidation(self):
+        """検証済みデータはmodel_constructでそのまま保持しシリアライズできる"""
+        clinic = ValidatedClinic(name="テスト", url="https://test.com")
+        response = ScrapeResponse.model_construct(success=True, clinics=[clinic])
+
+        assert response.clinics[0] is clinic
+        assert response.model_dump()["clinics"][0]["url"] == "https://test.com"
@@ -21,3 +21,28 @@ class TestHealthRoutes:
         assert response.status_code == 200
         data = response.get_json()
         assert data["status"] == "ready"
+
+    def test_debug_info(self, client):
+        """デバッグ情報応答"""
+        response = client.get("/debug")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["status"] == "ok"
+        assert data["timestamp"].endswith("Z")
+        assert set(data["memory"]) == {"max_rss_mb", "rss_mb", "user_time_sec", "system_time_sec"}
+        assert data["system"]["pid"] > 0
+
+    def test_memory_info_linux_skips_getrusage(self):
+        """Linuxではstatmとos.times()から取得し、getrusageは呼ばない"""
+        from unittest.mock import patch
+        from app.routes import health
+
+        with patch.object(health, "IS_LINUX", True), \
+                patch.object(health, "read_rss_mb", return_value=10.0), \
+                patch("resource.getrusage") as mock_getrusage:
+            memory = health._get_memory_info()
+
+        mock_getrusage.assert_not_called()
+        assert memory["rss_mb"] == 10.0
+        assert memory["max_rss_mb"] is None
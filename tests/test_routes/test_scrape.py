@@ -0,0 +1,310 @@
+"""スクレイピングルートのテスト"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.models.clinic import InternalClinic
+
+
+def _parse_sse(body: bytes) -> list[dict]:
+    """SSEレスポンスをメッセージのリストに変換"""
+    messages = []
+    for block in body.decode("utf-8").split("\n\n"):
+        if block.startswith("data: "):
+            messages.append(json.loads(block[len("data: "):]))
+    return messages
+
+
+class TestScrapeRoutes:
+    """スクレイピングAPIエンドポイントのテスト"""
+
+    @pytest.fixture
+    def clinics(self):
+        """検索結果のクリニック"""
+        return [
+            InternalClinic(name="テストクリニック", url="https://test.com", area="新宿区"),
+            InternalClinic(name="AGAスキンクリニック新宿院", url="https://aga-skin.com"),
+        ]
+
+    @pytest.fixture
+    def mock_services(self, clinics):
+        """サービス層のモック"""
+        from app.services import get_scraper, get_validator
+
+        # 共有インスタンスがモックを保持したまま他のテストに残らないようにする
+        get_scraper.cache_clear()
+        get_validator.cache_clear()
+        with patch("app.services.google_maps.GoogleMapsScraper") as MockScraper, \
+                patch("app.services.claude_validator.ClaudeValidator") as MockValidator, \
+                patch("app.services.sheets_writer.SheetsWriter") as MockWriter, \
+                patch("app.services.exclusion_filter.config") as mock_filter_config:
+            mock_filter_config.exclusion_keywords = ["AGAスキンクリニック"]
+            MockScraper.return_value.search.return_value = clinics
+            MockScraper.return_value.is_cached.return_value = False
+            MockValidator.return_value.validate_batch.side_effect = lambda cs, **kwargs: [
+                {**asdict(c), "is_valid": True} for c in cs
+            ]
+            writer = MockWriter.return_value
+            pending = []
+            writer.load_existing_urls.return_value = set()
+            writer.append_batched.side_effect = lambda cs: pending.extend(cs) or len(pending)
+
+            def take_pending():
+                rows = pending[:]
+                pending.clear()
+                return rows
+
+            writer.take_pending.side_effect = take_pending
+            writer.append.side_effect = lambda cs: len(cs)
+            yield MagicMock(
+                scraper=MockScraper.return_value,
+                validator=MockValidator.return_value,
+                writer=MockWriter.return_value,
+            )
+        get_scraper.cache_clear()
+        get_validator.cache_clear()
+
+    def test_scrape_no_data(self, client):
+        """データなしでのスクレイピング"""
+        response = client.post(
+            "/api/scrape", data="", content_type="application/json"
+        )
+
+        assert response.status_code == 400
+
+    def test_scrape_too_many_regions(self, client):
+        """地域数上限超過"""
+        with patch("app.routes.scrape.MAX_REGIONS_PER_BATCH", 2):
+            response = client.post(
+                "/api/scrape", json={"regions": ["新宿", "渋谷", "池袋"]}
+            )
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["max_regions"] == 2
+        assert data["requested_regions"] == 3
+
+    def test_scrape_stream(self, client, mock_services):
+        """SSEでの結果送信"""
+        response = client.post(
+            "/api/scrape", json={"regions": ["新宿"], "include_results": True}
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+
+        messages = _parse_sse(response.get_data())
+        complete = messages[-1]
+        assert complete["type"] == "complete"
+        assert complete["total_found"] == 2
+        assert complete["excluded_count"] == 1
+        assert complete["valid_count"] == 1
+        assert complete["new_count"] == 1
+        chunks = [m for m in messages if m["type"] == "chunk"]
+        assert [c["name"] for m in chunks for c in m["clinics"]] == ["テストクリニック"]
+        assert "clinics" not in complete
+        mock_services.writer.append.assert_called_once()
+
+    def test_scrape_multiple_regions_with_error(self, client, mock_services, clinics):
+        """並列検索で一部地域がエラーでも他の地域は処理される"""
+        from app.exceptions import ScrapingError
+
+        def search(query):
+            if query.startswith("渋谷"):
+                raise ScrapingError("timeout")
+            return clinics
+
+        mock_services.scraper.search.side_effect = search
+
+        response = client.post("/api/scrape", json={"regions": ["新宿", "渋谷"]})
+
+        messages = _parse_sse(response.get_data())
+        assert any("検索エラー" in m.get("message", "") for m in messages)
+        complete = messages[-1]
+        assert complete["type"] == "complete"
+        assert complete["total_found"] == 2
+        assert mock_services.scraper.search.call_count == 2
+
+    def test_scrape_validates_regions_together(self, client, mock_services):
+        """複数地域の検証は1回のバッチにまとめられる"""
+        mock_services.scraper.search.side_effect = lambda query: [
+            InternalClinic(name=f"{query}クリニック", url="https://test.com")
+        ]
+
+        response = client.post("/api/scrape", json={"regions": ["新宿", "渋谷"]})
+
+        messages = _parse_sse(response.get_data())
+        assert messages[-1]["type"] == "complete"
+        mock_services.validator.validate_batch.assert_called_once()
+        (batch,), _ = mock_services.validator.validate_batch.call_args
+        assert len(batch) == 2
+
+    def test_scrape_dedupes_across_regions(self, client, mock_services):
+        """同じクリニックが複数地域で見つかっても検証は1回"""
+        mock_services.scraper.search.side_effect = None
+        mock_services.scraper.search.return_value = [
+            InternalClinic(name="テストクリニック", url="https://test.com", phone="03-1234-5678")
+        ]
+
+        response = client.post("/api/scrape", json={"regions": ["新宿", "渋谷"]})
+
+        complete = _parse_sse(response.get_data())[-1]
+        assert complete["total_found"] == 2
+        assert complete["duplicate_count"] == 1
+        assert complete["validated_count"] == 1
+        assert complete["valid_count"] == 1
+        (batch,), _ = mock_services.validator.validate_batch.call_args
+        assert len(batch) == 1
+
+    def test_scrape_skips_clinics_already_in_sheet(self, client, mock_services):
+        """シートに保存済みのURLのクリニックは検証しない"""
+        mock_services.writer.load_existing_urls.return_value = {"https://test.com"}
+        mock_services.scraper.search.return_value = [
+            InternalClinic(name="保存済みクリニック", url="https://test.com"),
+            InternalClinic(name="新規クリニック", url="https://new.com"),
+        ]
+
+        response = client.post("/api/scrape", json={"regions": ["新宿"]})
+
+        complete = _parse_sse(response.get_data())[-1]
+        assert complete["existing_count"] == 1
+        assert complete["duplicate_count"] == 0
+        assert complete["validated_count"] == 1
+        (batch,), _ = mock_services.validator.validate_batch.call_args
+        assert [c.name for c in batch] == ["新規クリニック"]
+
+    def test_scrape_sheets_error_does_not_stop_session(self, client, mock_services):
+        """Sheets書き込みエラーは警告として送信し、セッションは完了する"""
+        from app.exceptions import SheetsError
+
+        mock_services.writer.append.side_effect = SheetsError("quota exceeded")
+
+        response = client.post("/api/scrape", json={"regions": ["新宿"]})
+
+        messages = _parse_sse(response.get_data())
+        assert any("Sheets書き込みエラー: quota exceeded" in m.get("message", "") for m in messages)
+        complete = messages[-1]
+        assert complete["type"] == "complete"
+        assert complete["new_count"] == 0
+        assert not any(m["type"] == "chunk" for m in messages)
+
+    def test_scrape_streams_results_in_chunks(self, client, mock_services):
+        """結果のクリニックは件数ごとに分割したchunkで送信"""
+        mock_services.scraper.search.return_value = [
+            InternalClinic(name=f"クリニック{n}", url=f"https://clinic{n}.com") for n in range(5)
+        ]
+
+        with patch("app.routes.scrape.SSE_RESULT_CHUNK_SIZE", 2):
+            response = client.post(
+                "/api/scrape", json={"regions": ["新宿"], "include_results": True}
+            )
+            messages = _parse_sse(response.get_data())
+
+        chunks = [m["clinics"] for m in messages if m["type"] == "chunk"]
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert messages[-1]["type"] == "complete"
+        assert messages[-1]["valid_count"] == 5
+
+    def test_scrape_sends_results_by_default(self, client, mock_services):
+        """include_results指定なしでも保存したクリニックをchunkで送信"""
+        response = client.post("/api/scrape", json={"regions": ["新宿"]})
+
+        messages = _parse_sse(response.get_data())
+        assert sum(len(m["clinics"]) for m in messages if m["type"] == "chunk") == 1
+        assert messages[-1]["valid_count"] == 1
+
+    def test_scrape_omits_results_when_disabled(self, client, mock_services):
+        """include_results=falseでは件数のみ送信"""
+        response = client.post("/api/scrape", json={"regions": ["新宿"], "include_results": False})
+
+        messages = _parse_sse(response.get_data())
+        assert not any(m["type"] == "chunk" for m in messages)
+        assert messages[-1]["valid_count"] == 1
+
+    def test_scrape_keepalive_during_validation(self, client, mock_services):
+        """検証の完了待ちの間もキープアライブを送信"""
+        import time
+
+        def slow_validate(cs, **kwargs):
+            time.sleep(0.2)
+            return [{**asdict(c), "is_valid": True} for c in cs]
+
+        mock_services.validator.validate_batch.side_effect = slow_validate
+
+        with patch("app.routes.scrape.KEEPALIVE_INTERVAL_SECONDS", 0.05):
+            response = client.post("/api/scrape", json={"regions": ["新宿"]})
+            body = response.get_data()
+
+        assert b": keepalive\n\n" in body
+        assert _parse_sse(body)[-1]["type"] == "complete"
+
+    def test_scrape_streams_validation_progress(self, client, mock_services):
+        """1件ごとの検証結果は検証の完了を待たずにlogとして送信"""
+        def validate(cs, on_result=None):
+            for c in cs:
+                on_result(c, True)
+            return [{**asdict(c), "is_valid": True} for c in cs]
+
+        mock_services.validator.validate_batch.side_effect = validate
+
+        response = client.post("/api/scrape", json={"regions": ["新宿"]})
+
+        messages = [m.get("message", "") for m in _parse_sse(response.get_data())]
+        assert "  テストクリニック: 有効" in messages
+        assert messages.index("  テストクリニック: 有効") < messages.index("検証完了: 有効 1件")
+
+    def test_scrape_preview(self, client, mock_services):
+        """プレビュー（Sheets書き込みなし）"""
+        response = client.post("/api/scrape/preview", json={"regions": ["新宿"]})
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["success"] is True
+        assert data["total"] == 1
+        assert data["valid"] == 1
+        mock_services.writer.append.assert_not_called()
+
+    def test_scrape_preview_multiple_regions(self, client, mock_services):
+        """プレビューも全地域を検索し、まとめて除外・検証する"""
+        mock_services.scraper.search.side_effect = lambda query: [
+            InternalClinic(name=f"{query}クリニック", url="https://test.com"),
+            InternalClinic(name="AGAスキンクリニック", url="https://aga-skin.com"),
+        ]
+
+        response = client.post("/api/scrape/preview", json={"regions": ["新宿", "渋谷"]})
+
+        data = response.get_json()
+        assert data["total"] == 2
+        assert mock_services.scraper.search.call_count == 2
+        mock_services.validator.validate_batch.assert_called_once()
+
+    def test_scrape_preview_dedupes_across_regions(self, client, mock_services):
+        """プレビューでも複数地域で見つかった同じクリニックは1回だけ検証"""
+        mock_services.scraper.search.side_effect = None
+        mock_services.scraper.search.return_value = [
+            InternalClinic(name="テストクリニック", url="https://test.com", phone="03-1234-5678")
+        ]
+
+        response = client.post("/api/scrape/preview", json={"regions": ["新宿", "渋谷"]})
+
+        assert response.get_json()["total"] == 1
+        (batch,), _ = mock_services.validator.validate_batch.call_args
+        assert len(batch) == 1
+
+
+class TestSseMessages:
+    """SSEメッセージ生成のテスト"""
+
+    def test_specialized_messages_match_generic(self):
+        """専用ヘルパーの出力が汎用ヘルパーと同じJSONになる"""
+        from app.routes.scrape import _create_sse_message, _sse_complete, _sse_log
+
+        assert _parse_sse(_sse_log("検索中 \"新宿\"")) == _parse_sse(
+            _create_sse_message("log", message="検索中 \"新宿\"")
+        )
+        assert _parse_sse(_sse_complete(clinics=[], total_found=3)) == [
+            {"type": "complete", "clinics": [], "total_found": 3}
+        ]
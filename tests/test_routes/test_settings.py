@@ -72,7 +72,7 @@ class TestSettingsRoutes:
 
     def test_add_exclusion_keyword(self, client):
         """除外キーワード追加"""
-        with patch("app.routes.settings.ExclusionFilter") as MockFilter:
+        with patch("app.services.exclusion_filter.ExclusionFilter") as MockFilter:
             mock_instance = MagicMock()
             mock_instance.keywords = ["既存", "新規"]
             MockFilter.return_value = mock_instance
@@ -99,7 +99,7 @@ class TestSettingsRoutes:
 
     def test_remove_exclusion_keyword(self, client):
         """除外キーワード削除"""
-        with patch("app.routes.settings.ExclusionFilter") as MockFilter:
+        with patch("app.services.exclusion_filter.ExclusionFilter") as MockFilter:
             mock_instance = MagicMock()
             mock_instance.keywords = ["残す"]
             MockFilter.return_value = mock_instance
@@ -116,7 +116,7 @@ class TestSettingsRoutes:
 
     def test_test_sheets_connection(self, client):
         """Sheets接続テスト"""
-        with patch("app.routes.settings.SheetsWriter") as MockWriter:
+        with patch("app.services.sheets_writer.SheetsWriter") as MockWriter:
             mock_instance = MagicMock()
             mock_instance.test_connection.return_value = {
                 "success": True,
@@ -4,7 +4,7 @@ import json
 import pytest
 from unittest.mock import patch, MagicMock
 
-from app.models.clinic import Clinic
+from app.models.clinic import InternalClinic
 from app.services.claude_validator import ClaudeValidator
 
 
@@ -17,13 +17,19 @@ class TestClaudeValidator:
         with patch("app.services.claude_validator.config") as mock_config:
             mock_config.anthropic_api_key = "test-key"
             mock_config.claude_model = "claude-sonnet-4-20250514"
+            mock_config.claude_easy_model = "claude-3-5-haiku-latest"
+            mock_config.claude_major_chain_domains = ["s-b-c.net"]
+            mock_config.claude_portal_domains = ["epark.jp", "beauty.hotpepper.jp"]
             mock_config.claude_batch_size = 10
+            mock_config.claude_concurrency = 4
+            mock_config.claude_batch_poll_seconds = 0
+            mock_config.claude_batch_max_wait_seconds = 60
             return ClaudeValidator()
 
     @pytest.fixture
     def sample_clinic(self):
         """サンプルクリニック"""
-        return Clinic(
+        return InternalClinic(
             name="テストAGAクリニック",
             url="https://test-clinic.com",
             address="東京都新宿区",
@@ -37,10 +43,11 @@ class TestClaudeValidator:
         """APIクライアントなしでの検証"""
         with patch("app.services.claude_validator.config") as mock_config:
             mock_config.anthropic_api_key = ""  # 空のAPIキー
+            mock_config.claude_portal_domains = []
 
             validator = ClaudeValidator()
             clinics = [
-                Clinic(name="テスト", url="https://test.com", address="東京", area="新宿区")
+                InternalClinic(name="テスト", url="https://test.com", address="東京", area="新宿区")
             ]
 
             results = validator.validate_batch(clinics)
@@ -49,6 +56,17 @@ class TestClaudeValidator:
             assert results[0]["is_valid"] is True
             assert "API未設定" in results[0]["validation_reason"]
 
+    def test_validators_share_http_client(self, validator):
+        """HTTPクライアントはバリデーター間で共有し、SDKのリトライは無効"""
+        with patch("app.services.claude_validator.config") as mock_config:
+            mock_config.anthropic_api_key = "test-key"
+            mock_config.claude_major_chain_domains = []
+            mock_config.claude_portal_domains = []
+            other = ClaudeValidator()
+
+        assert other.client._client is validator.client._client
+        assert other.client.max_retries == 0
+
     def test_validate_batch_with_mock_api(self, validator, sample_clinic):
         """モックAPIでの検証"""
         mock_response = MagicMock()
@@ -78,9 +96,25 @@ class TestClaudeValidator:
             assert results[0]["is_official_site"] is True
             assert results[0]["is_major_chain"] is False
 
+    def test_validate_batch_caches_static_prompt(self, validator, sample_clinic):
+        """固定の指示はキャッシュ指定のsystemで送り、ユーザーメッセージはクリニック情報のみ"""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text=json.dumps([{"index": 0, "is_major_chain": False}]))]
+
+        with patch.object(
+            validator.client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            validator.validate_batch([sample_clinic])
+
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["system"][0]["text"] == ClaudeValidator.VALIDATION_PROMPT
+        user_content = json.loads(kwargs["messages"][0]["content"])
+        assert user_content[0]["name"] == "テストAGAクリニック"
+
     def test_validate_batch_major_chain(self, validator):
         """大手チェーン判定"""
-        clinic = Clinic(
+        clinic = InternalClinic(
             name="AGAスキンクリニック新宿院",
             url="https://aga-skin.com",
             address="東京都新宿区",
@@ -114,10 +148,10 @@ class TestClaudeValidator:
             assert results[0]["is_major_chain"] is True
 
     def test_validate_batch_portal_site(self, validator):
-        """ポータルサイト判定"""
-        clinic = Clinic(
+        """ポータルサイト判定（設定のドメイン一覧にないポータルはClaudeが判定）"""
+        clinic = InternalClinic(
             name="テストクリニック",
-            url="https://epark.jp/clinic/test",
+            url="https://portal.example.jp/clinic/test",
             address="東京都渋谷区",
             area="渋谷区",
         )
@@ -147,6 +181,30 @@ class TestClaudeValidator:
             assert len(results) == 1
             assert results[0]["is_valid"] is False  # ポータルサイトは無効
 
+    def test_validate_batch_prefilters_portal_urls(self, validator):
+        """ポータルサイトのURLはClaudeに送らずに無効と判定し、結果は入力順"""
+        clinics = [
+            InternalClinic(name="EPARKクリニック", url="https://epark.jp/clinic/1"),
+            InternalClinic(name="個人クリニック", url="https://kojin-clinic.jp"),
+            InternalClinic(name="ホットペッパー掲載", url="https://beauty.hotpepper.jp/kr/1/"),
+        ]
+        mock_response = MagicMock()
+        mock_response.content = [
+            MagicMock(text=json.dumps([{"index": 0, "is_official_site": True, "is_major_chain": False}]))
+        ]
+
+        with patch.object(
+            validator.client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            results = validator.validate_batch(clinics)
+
+        mock_create.assert_called_once()
+        assert "個人クリニック" in mock_create.call_args.kwargs["messages"][0]["content"]
+        assert "EPARK" not in mock_create.call_args.kwargs["messages"][0]["content"]
+        assert [r["name"] for r in results] == [c.name for c in clinics]
+        assert [r["is_valid"] for r in results] == [False, True, False]
+        assert results[0]["is_official_site"] is False
+
     def test_validate_batch_api_error(self, validator, sample_clinic):
         """APIエラー時のフォールバック"""
         with patch.object(
@@ -178,6 +236,163 @@ class TestClaudeValidator:
             assert len(results) == 1
             assert results[0]["is_valid"] is True
 
+    def test_validate_batch_parallel_keeps_order(self, validator):
+        """サブバッチを並列に検証しても結果は元の順序"""
+        import time
+
+        validator.batch_size = 1
+        clinics = [InternalClinic(name=f"クリニック{i}") for i in range(3)]
+
+        def create(**kwargs):
+            content = kwargs["messages"][0]["content"]
+            # 先頭のサブバッチほど遅く返す
+            time.sleep(0.05 if "クリニック0" in content else 0)
+            return MagicMock(
+                content=[MagicMock(text=json.dumps([{"index": 0, "is_major_chain": False}]))]
+            )
+
+        with patch.object(validator.client.messages, "create", side_effect=create) as mock_create:
+            results = validator.validate_batch(clinics)
+
+        assert mock_create.call_count == 3
+        assert [r["name"] for r in results] == ["クリニック0", "クリニック1", "クリニック2"]
+
+    def test_validate_batch_routes_easy_clinics(self, validator):
+        """URLなし・大手チェーンのドメインは軽量モデルで検証し、結果は入力順"""
+        clinics = [
+            InternalClinic(name="URLなしクリニック"),
+            InternalClinic(name="個人クリニック", url="https://kojin-clinic.jp"),
+            InternalClinic(name="湘南美容クリニック新宿院", url="https://www.s-b-c.net/clinic/"),
+        ]
+
+        def create(**kwargs):
+            count = kwargs["messages"][0]["content"].count('"index"')
+            return MagicMock(
+                content=[MagicMock(text=json.dumps([{"index": i, "is_major_chain": False} for i in range(count)]))]
+            )
+
+        with patch.object(validator.client.messages, "create", side_effect=create) as mock_create:
+            results = validator.validate_batch(clinics)
+
+        models = sorted(call.kwargs["model"] for call in mock_create.call_args_list)
+        assert models == ["claude-3-5-haiku-latest", "claude-sonnet-4-20250514"]
+        assert [r["name"] for r in results] == [c.name for c in clinics]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '[{"index": 0}]',
+            '```json\n[{"index": 0}]\n```',
+            '```\n[{"index": 0}]\n```\n以上です。',
+            '```json\n[{"index": 0}]',
+        ],
+    )
+    def test_parse_validations_strips_code_fence(self, text):
+        """コードブロックの有無・閉じ忘れ・後続テキストに関わらずJSONを取り出す"""
+        assert ClaudeValidator._parse_validations(text) == [{"index": 0}]
+
+    def test_merge_validations_duplicate_index(self, sample_clinic):
+        """同じindexが重複して返っても、それぞれ別の結果として保持する"""
+        results = ClaudeValidator._merge_validations(
+            [sample_clinic],
+            [
+                {"index": 0, "is_official_site": True, "is_major_chain": False},
+                {"index": 0, "is_official_site": False, "is_major_chain": False},
+            ],
+        )
+
+        assert results[0] is not results[1]
+        assert [r["is_valid"] for r in results] == [True, False]
+
+    def _stream(self, text, chunk_size=7):
+        """ストリーミング応答のモック（要素の途中で分割された断片として受信する）"""
+        stream = MagicMock()
+        stream.text_stream = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+        stream.get_final_message.return_value = MagicMock(content=[MagicMock(text=text)])
+        stream_cm = MagicMock()
+        stream_cm.__enter__.return_value = stream
+        return stream_cm
+
+    def test_validate_batch_streams_results(self, validator):
+        """コールバック指定時は応答をストリーミングで受信し、要素ごとに通知"""
+        clinics = [
+            InternalClinic(name="個人クリニック", url="https://kojin-clinic.jp"),
+            InternalClinic(name="公式でないクリニック", url="https://other.jp"),
+        ]
+        text = json.dumps(
+            [
+                {"index": 0, "is_official_site": True, "is_major_chain": False},
+                {"index": 1, "is_official_site": False, "is_major_chain": False},
+            ]
+        )
+
+        notified = []
+        with patch.object(validator.client.messages, "stream", return_value=self._stream(text)) as mock_stream, \
+                patch.object(validator.client.messages, "create") as mock_create:
+            results = validator.validate_batch(
+                clinics, on_result=lambda c, is_valid: notified.append((c.name, is_valid))
+            )
+
+        mock_stream.assert_called_once()
+        mock_create.assert_not_called()
+        assert notified == [("個人クリニック", True), ("公式でないクリニック", False)]
+        assert [r["is_valid"] for r in results] == [True, False]
+
+    def test_validate_batch_streams_once_across_retries(self, validator):
+        """リトライで再受信した要素は通知せず、未通知の要素だけ通知する"""
+        clinics = [
+            InternalClinic(name="個人クリニック", url="https://kojin-clinic.jp"),
+            InternalClinic(name="公式でないクリニック", url="https://other.jp"),
+        ]
+        valid = json.dumps(
+            [
+                {"index": 0, "is_official_site": True, "is_major_chain": False},
+                {"index": 1, "is_official_site": False, "is_major_chain": False},
+            ]
+        )
+        # 1要素目の受信後に応答が途切れる（最終メッセージのJSONが解析できない）
+        truncated = valid[: valid.index("}") + 1]
+
+        notified = []
+        with patch.object(
+            validator.client.messages,
+            "stream",
+            side_effect=[self._stream(truncated), self._stream(truncated), self._stream(valid)],
+        ) as mock_stream, \
+                patch.object(ClaudeValidator._request_validations.retry, "sleep", lambda seconds: None):
+            results = validator.validate_batch(
+                clinics, on_result=lambda c, is_valid: notified.append((c.name, is_valid))
+            )
+
+        assert mock_stream.call_count == 3
+        assert notified == [("個人クリニック", True), ("公式でないクリニック", False)]
+        assert [r["is_valid"] for r in results] == [True, False]
+
+    def test_streaming_array_parser(self):
+        """閉じた要素だけを順に取り出す（コードブロック・文字列中の括弧を含む）"""
+        from app.services.claude_validator import _StreamingArrayParser
+
+        parser = _StreamingArrayParser()
+
+        assert parser.feed('```json\n[\n  {"index": 0, "reason": "}と]"') == []
+        assert parser.feed('},\n  {"index": 1') == [{"index": 0, "reason": "}と]"}]
+        assert parser.feed("}\n]\n```") == [{"index": 1}]
+
+    def test_validate_batch_retries_without_callback(self, validator, sample_clinic):
+        """コールバックなしでは通常のリクエストで受信し、解析に失敗したらリトライ"""
+        valid = json.dumps([{"index": 0, "is_official_site": True, "is_major_chain": False}])
+        responses = [
+            MagicMock(content=[MagicMock(text="処理できませんでした")]),
+            MagicMock(content=[MagicMock(text=valid)]),
+        ]
+
+        with patch.object(validator.client.messages, "create", side_effect=responses) as mock_create, \
+                patch.object(ClaudeValidator._request_validations.retry, "sleep", lambda seconds: None):
+            results = validator.validate_batch([sample_clinic])
+
+        assert mock_create.call_count == 2
+        assert results[0]["is_valid"] is True
+
     def test_validate_single(self, validator, sample_clinic):
         """単一クリニック検証"""
         mock_response = MagicMock()
@@ -203,3 +418,76 @@ class TestClaudeValidator:
             result = validator.validate_single(sample_clinic)
 
             assert result["is_valid"] is True
+
+    def _batch_entry(self, custom_id, validations=None):
+        """Message Batchesの結果エントリ（validationsなしはエラー扱い）"""
+        entry = MagicMock(custom_id=custom_id)
+        if validations is None:
+            entry.result.type = "errored"
+        else:
+            entry.result.type = "succeeded"
+            entry.result.message.content = [MagicMock(text=json.dumps(validations))]
+        return entry
+
+    def test_validate_batch_via_batch_api(self, validator, sample_clinic):
+        """Message Batches APIでの検証（完了までポーリング）"""
+        batches = validator.client.messages.batches = MagicMock()
+        batches.create.return_value = MagicMock(id="msgbatch_1", processing_status="in_progress")
+        batches.retrieve.return_value = MagicMock(id="msgbatch_1", processing_status="ended")
+        batches.results.return_value = [
+            self._batch_entry(
+                "batch-1",
+                [{"index": 0, "is_official_site": True, "is_major_chain": True, "reason": "大手"}],
+            )
+        ]
+
+        results = validator.validate_batch_via_batch_api([sample_clinic])
+
+        batches.retrieve.assert_called_once_with("msgbatch_1")
+        (request,) = batches.create.call_args.kwargs["requests"]
+        assert request["custom_id"] == "batch-1"
+        assert len(results) == 1
+        assert results[0]["is_valid"] is False
+        assert results[0]["is_major_chain"] is True
+
+    def test_validate_batch_via_batch_api_timeout_cancels(self, validator, sample_clinic):
+        """最大待ち時間を過ぎたらバッチをキャンセルし、同期APIで検証する"""
+        validator.batch_max_wait_seconds = 0
+        batches = validator.client.messages.batches = MagicMock()
+        batches.create.return_value = MagicMock(id="msgbatch_1", processing_status="in_progress")
+
+        mock_response = MagicMock()
+        mock_response.content = [
+            MagicMock(text=json.dumps([{"index": 0, "is_official_site": True, "is_major_chain": False}]))
+        ]
+
+        with patch.object(
+            validator.client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            results = validator.validate_batch_via_batch_api([sample_clinic])
+
+        batches.retrieve.assert_not_called()
+        batches.results.assert_not_called()
+        batches.cancel.assert_called_once_with("msgbatch_1")
+        mock_create.assert_called_once()
+        assert results[0]["is_valid"] is True
+
+    def test_validate_batch_via_batch_api_errored_falls_back(self, validator, sample_clinic):
+        """失敗したサブバッチは同期APIで再検証される"""
+        batches = validator.client.messages.batches = MagicMock()
+        batches.create.return_value = MagicMock(id="msgbatch_1", processing_status="ended")
+        batches.results.return_value = [self._batch_entry("batch-1")]
+
+        mock_response = MagicMock()
+        mock_response.content = [
+            MagicMock(text=json.dumps([{"index": 0, "is_official_site": True, "is_major_chain": False}]))
+        ]
+
+        with patch.object(
+            validator.client.messages, "create", return_value=mock_response
+        ) as mock_create:
+            results = validator.validate_batch_via_batch_api([sample_clinic])
+
+        batches.retrieve.assert_not_called()
+        mock_create.assert_called_once()
+        assert results[0]["is_valid"] is True
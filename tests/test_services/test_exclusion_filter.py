@@ -1,7 +1,9 @@
 """除外フィルターのテスト"""
 
 import pytest
-from app.models.clinic import Clinic
+from unittest.mock import patch
+
+from app.models.clinic import InternalClinic
 from app.services.exclusion_filter import ExclusionFilter
 
 
@@ -31,6 +33,27 @@ class TestExclusionFilter:
         assert filter_.should_exclude("tcb美容外科") is True
         assert filter_.should_exclude("Tcb美容外科") is True
 
+    def test_should_exclude_after_add_and_remove(self):
+        """キーワード追加・削除後の除外判定に反映される"""
+        filter_ = ExclusionFilter(keywords=["既存"])
+        assert filter_.should_exclude("新規クリニック") is False
+
+        filter_.add_keyword("新規")
+        assert filter_.should_exclude("新規クリニック") is True
+
+        filter_.remove_keyword("新規")
+        assert filter_.should_exclude("新規クリニック") is False
+
+    def test_should_exclude_without_automaton(self):
+        """pyahocorasick未インストール時も同じ判定になる"""
+        with patch("app.services.exclusion_filter.ahocorasick", None):
+            filter_ = ExclusionFilter(keywords=["AGAスキンクリニック", "TCB", "D.クリニック"])
+
+            assert filter_.should_exclude("AGAスキンクリニック新宿院") is True
+            assert filter_.should_exclude("dxクリニック") is False
+            assert filter_.should_exclude("tcb美容外科") is True
+            assert filter_.should_exclude("テストクリニック") is False
+
     def test_filter_clinics(self, sample_clinics):
         """クリニックリストのフィルタリング"""
         filter_ = ExclusionFilter(keywords=["AGAスキンクリニック"])
@@ -0,0 +1,557 @@
+"""Google Maps Scraperのテスト"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.models.clinic import InternalClinic
+from app.services import google_maps
+from app.services.google_maps import GoogleMapsScraper
+
+
+class TestSearchCache:
+    """検索結果キャッシュのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, tmp_path):
+        """テストごとにキャッシュを空にし、ディスクキャッシュは一時ディレクトリに書き込む"""
+        google_maps._search_cache.clear()
+        with patch("app.services.google_maps.SEARCH_CACHE_DIR", tmp_path / "search"):
+            yield
+        google_maps._search_cache.clear()
+
+    @pytest.fixture
+    def scraper(self):
+        """キャッシュ有効のスクレイパー"""
+        with patch("app.services.google_maps.config") as mock_config:
+            mock_config.max_results_per_query = 50
+            mock_config.search_cache_ttl_seconds = 3600
+            return GoogleMapsScraper()
+
+    def test_search_uses_cache(self, scraper):
+        """同じクエリの2回目はブラウザを起動しない"""
+        clinics = [InternalClinic(name="テストクリニック", url="https://test.com")]
+
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(return_value=clinics)
+        ) as mock_search:
+            assert scraper.is_cached("新宿 AGA") is False
+            first = scraper.search("新宿 AGA")
+            assert scraper.is_cached("新宿 AGA") is True
+            second = scraper.search("新宿 AGA")
+
+        mock_search.assert_awaited_once()
+        assert first == second == clinics
+        assert second is not first
+
+    def test_search_does_not_cache_empty_or_expired(self, scraper):
+        """0件の結果はキャッシュせず、期限切れのキャッシュは使わない"""
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(return_value=[])
+        ) as mock_search:
+            scraper.search("渋谷 AGA")
+            scraper.search("渋谷 AGA")
+        assert mock_search.await_count == 2
+
+        clinics = [InternalClinic(name="テストクリニック")]
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(return_value=clinics)
+        ) as mock_search:
+            scraper.search("池袋 AGA")
+            # 有効期限が過ぎた時点で再検索（メモリ・ディスクとも期限切れ）
+            expired = time.time() + 3601
+            with patch("app.services.google_maps.time.time", return_value=expired):
+                scraper.search("池袋 AGA")
+        assert mock_search.await_count == 2
+
+    def test_search_normalizes_query(self, scraper):
+        """全角スペースや全角英字のクエリも同じキャッシュを使う"""
+        clinics = [InternalClinic(name="テストクリニック")]
+
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(return_value=clinics)
+        ) as mock_search:
+            scraper.search("新宿 AGA")
+            assert scraper.is_cached("新宿　ＡＧＡ ") is True
+            scraper.search("新宿　ＡＧＡ ")
+
+        mock_search.assert_awaited_once_with("新宿 AGA", None)
+
+    def test_search_uses_disk_cache_after_restart(self, scraper):
+        """メモリのキャッシュが消えてもディスクのキャッシュから返す"""
+        clinics = [InternalClinic(name="テストクリニック", url="https://test.com")]
+
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(return_value=clinics)
+        ) as mock_search:
+            scraper.search("新宿 AGA")
+            google_maps._search_cache.clear()
+
+            assert scraper.is_cached("新宿 AGA") is True
+            assert scraper.search("新宿 AGA") == clinics
+        mock_search.assert_awaited_once()
+
+    def test_search_ignores_expired_disk_cache(self, scraper):
+        """期限切れのディスクキャッシュは削除して再検索"""
+        clinics = [InternalClinic(name="テストクリニック")]
+
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(return_value=clinics)
+        ) as mock_search:
+            with patch("app.services.google_maps.time.time", return_value=1000.0):
+                scraper.search("池袋 AGA")
+            google_maps._search_cache.clear()
+
+            assert scraper.is_cached("池袋 AGA") is False
+            assert not scraper._disk_cache_path(("池袋 AGA", 50)).exists()
+            scraper.search("池袋 AGA")
+        assert mock_search.await_count == 2
+
+    def test_search_ignores_corrupt_disk_cache(self, scraper):
+        """JSONとして読めないディスクキャッシュはキャッシュミスとして削除"""
+        path = scraper._disk_cache_path(("上野 AGA", 50))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"\x80\x04not json")
+        google_maps._search_cache.clear()
+
+        assert scraper.is_cached("上野 AGA") is False
+        assert not path.exists()
+
+    def test_search_force_refresh(self, scraper):
+        """force_refresh指定時はキャッシュを使わず再検索し、結果でキャッシュを更新"""
+        old = [InternalClinic(name="旧クリニック")]
+        new = [InternalClinic(name="新クリニック")]
+
+        with patch.object(
+            scraper, "_search_async", new=AsyncMock(side_effect=[old, new])
+        ) as mock_search:
+            scraper.search("渋谷 AGA")
+            assert scraper.search("渋谷 AGA", force_refresh=True) == new
+            assert scraper.search("渋谷 AGA") == new
+        assert mock_search.await_count == 2
+
+
+class TestBrowserPool:
+    """共有ブラウザプールのテスト"""
+
+    @pytest.fixture
+    def playwright(self):
+        """起動したChromiumのモック"""
+        with patch("app.services.google_maps.async_playwright") as mock_async_playwright:
+            playwright = AsyncMock()
+            browser = AsyncMock()
+            browser.is_connected = MagicMock(return_value=True)
+            playwright.chromium.launch.return_value = browser
+            playwright.chromium.connect_over_cdp.return_value = browser
+            mock_async_playwright.return_value.start = AsyncMock(return_value=playwright)
+            yield playwright
+
+    @pytest.fixture
+    def browser(self, playwright):
+        """起動されるChromium"""
+        return playwright.chromium.launch.return_value
+
+    @pytest.fixture
+    def state_path(self, tmp_path):
+        """コンテキストの状態の保存先"""
+        path = tmp_path / "browser_storage_state.json"
+        with patch("app.services.google_maps.STORAGE_STATE_PATH", path):
+            yield path
+
+    @pytest.fixture
+    def pool(self, state_path):
+        """テストごとのプール（終了時にイベントループも止める）"""
+        pool = google_maps._BrowserPool()
+        yield pool
+        pool.close()
+
+    def test_concurrent_acquire_launches_once(self, pool, playwright, browser):
+        """同時に取得しても起動は1回で、同じコンテキストを共有する"""
+        async def acquire_twice():
+            return await asyncio.gather(pool.acquire(), pool.acquire())
+
+        first, second = pool.run(acquire_twice())
+
+        assert first is second is browser.new_context.return_value
+        playwright.chromium.launch.assert_awaited_once()
+        browser.new_context.assert_awaited_once()
+
+    def test_connects_to_cdp_endpoint(self, pool, playwright):
+        """CDPエンドポイント設定時は起動せずに接続する"""
+        with patch("app.services.google_maps.config") as mock_config:
+            mock_config.browser_cdp_endpoint = "http://localhost:9222"
+            pool.run(pool.acquire())
+
+        playwright.chromium.connect_over_cdp.assert_awaited_once_with("http://localhost:9222")
+        playwright.chromium.launch.assert_not_awaited()
+
+    def test_relaunches_disconnected_browser(self, pool, playwright, browser):
+        """切断されたブラウザは再起動する"""
+        pool.run(pool.acquire())
+        browser.is_connected.return_value = False
+
+        pool.run(pool.acquire())
+
+        assert playwright.chromium.launch.await_count == 2
+
+    def test_recycles_browser_after_max_uses(self, pool, playwright, browser):
+        """使用回数の上限に達したら、使用中の検索がなくなった後の取得で再起動する"""
+        async def use(times):
+            for _ in range(times):
+                await pool.acquire()
+                pool.release()
+
+        with patch("app.services.google_maps.config") as mock_config:
+            mock_config.browser_max_uses = 2
+            mock_config.browser_idle_timeout_seconds = 600
+            mock_config.browser_cdp_endpoint = ""
+            pool.run(use(2))
+            assert playwright.chromium.launch.await_count == 1
+
+            pool.run(use(1))
+
+        assert playwright.chromium.launch.await_count == 2
+        browser.close.assert_awaited_once()
+
+    def test_closes_browser_after_idle_timeout(self, pool, playwright, browser, state_path):
+        """使用中の検索がなくなりアイドル時間が経過したら、状態を保存してブラウザを終了"""
+        async def use_once():
+            await pool.acquire()
+            pool.release()
+            await asyncio.sleep(0.05)
+
+        with patch("app.services.google_maps.config") as mock_config:
+            mock_config.browser_idle_timeout_seconds = 0
+            mock_config.browser_cdp_endpoint = ""
+            pool.run(use_once())
+
+        context = browser.new_context.return_value
+        context.storage_state.assert_awaited_once_with(path=state_path)
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+
+    def test_restores_saved_storage_state(self, pool, browser, state_path):
+        """保存済みの状態があればコンテキスト作成時に読み込む"""
+        state_path.write_text('{"cookies": [], "origins": []}', encoding="utf-8")
+
+        pool.run(pool.acquire())
+
+        assert browser.new_context.await_args.kwargs["storage_state"] == state_path
+
+    def test_ignores_corrupt_storage_state(self, pool, browser, state_path):
+        """保存済みの状態を読み込めなければ破棄し、状態なしでコンテキストを作成"""
+        state_path.write_text("{broken", encoding="utf-8")
+        context = browser.new_context.return_value
+        browser.new_context.side_effect = [ValueError("invalid JSON"), context]
+
+        assert pool.run(pool.acquire()) is context
+
+        assert "storage_state" not in browser.new_context.await_args.kwargs
+        assert not state_path.exists()
+
+    def test_failed_context_setup_resets_pool(self, pool, playwright, browser):
+        """コンテキストの準備に失敗したらブラウザを終了し、次の取得で起動し直す"""
+        context = browser.new_context.return_value
+        context.add_cookies.side_effect = [RuntimeError("boom"), None]
+
+        with pytest.raises(RuntimeError):
+            pool.run(pool.acquire())
+        browser.close.assert_awaited_once()
+
+        assert pool.run(pool.acquire()) is context
+        assert playwright.chromium.launch.await_count == 2
+
+    def test_close_is_idempotent_and_restartable(self, pool, playwright):
+        """終了は何度呼んでもよく、終了後に使えばブラウザを起動し直す"""
+        pool.run(pool.acquire())
+        pool.close()
+        pool.close()
+
+        pool.run(pool.acquire())
+
+        assert playwright.chromium.launch.await_count == 2
+
+    def test_search_does_not_wait_for_page_close(self, pool, browser):
+        """ページの終了を待たずに検索を終え、終了後にブラウザを解放する"""
+        page = AsyncMock()
+
+        async def slow_close():
+            await asyncio.sleep(0.2)
+
+        page.close.side_effect = slow_close
+        browser.new_context.return_value.new_page.return_value = page
+        scraper = GoogleMapsScraper()
+
+        async def use_page():
+            async with scraper._browser_context():
+                pass
+            in_use = pool._refcount
+            await asyncio.sleep(0.3)
+            return in_use, pool._refcount
+
+        with patch("app.services.google_maps._browser_pool", pool):
+            in_use, after_close = pool.run(use_page())
+
+        assert (in_use, after_close) == (1, 0)
+        page.close.assert_awaited_once()
+
+
+class TestBlockUnneededRequests:
+    """不要なリソースの中断のテスト"""
+
+    @pytest.mark.parametrize(
+        "resource_type, url, blocked",
+        [
+            ("image", "https://maps.gstatic.com/tile.png", True),
+            ("font", "https://fonts.gstatic.com/font.woff2", True),
+            ("manifest", "https://www.google.com/maps/_/manifest.json", True),
+            ("script", "https://www.googletagmanager.com/gtag/js", True),
+            ("script", "https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js", True),
+            ("stylesheet", "https://www.gstatic.com/maps/css/maps.css", False),
+            ("document", "https://www.google.com/maps/search/新宿+AGA", False),
+            ("script", "https://maps.google.com/maps/api/js", False),
+        ],
+    )
+    def test_block_unneeded_requests(self, resource_type, url, blocked):
+        """画像・フォント・計測タグは中断し、それ以外は通す"""
+        route = AsyncMock()
+        route.request = MagicMock(resource_type=resource_type, url=url)
+
+        asyncio.run(google_maps._block_unneeded_requests(route))
+
+        assert route.abort.await_count == int(blocked)
+        assert route.continue_.await_count == int(not blocked)
+
+
+class TestPanelFields:
+    """詳細パネルの項目取得のテスト"""
+
+    def test_get_panel_fields_parses_labels(self):
+        """1回のevaluateの結果から電話番号・評価・口コミ数を取り出す"""
+        page = AsyncMock()
+        page.evaluate.return_value = {
+            "url": "https://test-clinic.com/",
+            "address": "東京都新宿区西新宿1-1-1",
+            "phone": "\ue0b0\n03-1234-5678",
+            "rating": "4.5 つ星",
+            "reviews": "1,234 件のクチコミ",
+        }
+
+        fields = asyncio.run(GoogleMapsScraper()._get_panel_fields(page))
+
+        page.evaluate.assert_awaited_once()
+        assert fields == {
+            "url": "https://test-clinic.com/",
+            "address": "東京都新宿区西新宿1-1-1",
+            "phone": "03-1234-5678",
+            "rating": 4.5,
+            "reviews": 1234,
+        }
+
+    def test_get_panel_fields_missing(self):
+        """項目がない・取得に失敗した場合はNone"""
+        page = AsyncMock()
+        page.evaluate.side_effect = Exception("Execution context was destroyed")
+
+        fields = asyncio.run(GoogleMapsScraper()._get_panel_fields(page))
+
+        assert set(fields.values()) == {None}
+
+    def test_wait_for_panel(self):
+        """パネルのh1の一致はブラウザ側で待ち、タイムアウトならFalse"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+        scraper = GoogleMapsScraper()
+        page = AsyncMock()
+
+        assert asyncio.run(scraper._wait_for_panel(page, "テスト クリニック", timeout=3000)) is True
+        assert page.wait_for_function.await_args.kwargs["arg"] == "テストクリニック"
+
+        page.wait_for_function.side_effect = PlaywrightTimeout("timeout")
+        assert asyncio.run(scraper._wait_for_panel(page, "テストクリニック", timeout=3000)) is False
+
+    @pytest.mark.parametrize(
+        "h1_name, aria_label_name, expected",
+        [
+            ("テストクリニック", "テストクリニック", True),
+            ("テスト　クリニック", "テストクリニック", True),
+            ("テストクリニック 新宿院", "テストクリニック", True),
+            ("AGA", "aga スキンクリニック", True),
+            ("別のクリニック", "テストクリニック", False),
+            ("  ", "テストクリニック", False),
+            ("", "テストクリニック", False),
+        ],
+    )
+    def test_names_match(self, h1_name, aria_label_name, expected):
+        """空白と大文字小文字を無視し、一方が他方を含めば一致"""
+        assert GoogleMapsScraper()._names_match(h1_name, aria_label_name) is expected
+
+
+class TestExtractInTabs:
+    """複数タブでの並列抽出のテスト"""
+
+    def test_extract_in_tabs_keeps_order(self):
+        """タブ数までしか開かず、結果は検索結果一覧の順序"""
+        links = [[f"クリニック{i}", f"https://www.google.com/maps/place/{i}"] for i in range(5)]
+        links.append([None, "https://www.google.com/maps/place/none"])
+        page = AsyncMock()
+        page.eval_on_selector_all.return_value = links
+        page.context = AsyncMock()
+
+        async def extract(tab, index, name, href):
+            # 先頭ほど遅く完了させる
+            await asyncio.sleep(0.01 * (5 - index))
+            if index == 3:
+                raise Exception("navigation failed")
+            return {"name": name}
+
+        scraper = GoogleMapsScraper()
+        scraper.extract_tabs = 2
+        with patch.object(scraper, "_extract_place_page", side_effect=extract) as mock_extract:
+            rows = asyncio.run(scraper._extract_in_tabs(page, max_results=50))
+
+        assert [r["name"] for r in rows] == ["クリニック0", "クリニック1", "クリニック2", "クリニック4"]
+        assert page.context.new_page.await_count == 2
+        assert mock_extract.call_count == 5
+
+    def test_build_clinics_skips_invalid_rows(self):
+        """抽出結果はまとめてInternalClinicに変換し、不正な行は除外"""
+        rows = [
+            {"name": "クリニックA", "url": "https://a.com", "rating": 4.5, "area": "東京都新宿区"},
+            {"name": "クリニックB", "rating": 9.9},
+            {"name": "  ", "url": "https://c.com"},
+            {"name": "クリニックD", "reviews": 12},
+        ]
+
+        clinics = GoogleMapsScraper._build_clinics(rows)
+
+        assert [c.name for c in clinics] == ["クリニックA", "クリニックD"]
+        assert all(isinstance(c, InternalClinic) for c in clinics)
+
+
+class TestHttpFastPath:
+    """検索XHRをHTTPで直接取得する高速パスのテスト"""
+
+    @staticmethod
+    def _place(name, url=None, address=None, phone=None, rating=None, reviews=None):
+        """検索結果XHRの場所の配列（使う位置だけ埋める）"""
+        place = [None] * 179
+        place[4] = [None] * 7 + [rating, reviews]
+        place[7] = [url] if url else None
+        place[11] = name
+        place[39] = address
+        place[178] = [[phone]] if phone else None
+        return place
+
+    @pytest.fixture(autouse=True)
+    def pb_template(self, tmp_path):
+        """pbパラメータの保存先を一時ディレクトリにする"""
+        with patch("app.services.google_maps.PB_TEMPLATE_PATH", tmp_path / "gmaps_pb.txt"), \
+                patch("app.services.google_maps._pb_template", None):
+            yield tmp_path / "gmaps_pb.txt"
+
+    def test_parse_search_response(self):
+        """XSSIプレフィックスを除いて各結果の場所の情報を取り出す"""
+        entries = [
+            ["メタデータ"],
+            [None] * 14 + [self._place(
+                "テストクリニック", url="https://test.com", address="東京都新宿区西新宿1-1-1",
+                phone="03-1234-5678 ", rating=4.5, reviews=120,
+            )],
+            [None] * 14 + [self._place("URLなしクリニック")],
+        ]
+        text = ")]}'\n" + json.dumps([[None, entries]])
+
+        rows = google_maps._parse_search_response(text)
+
+        assert rows == [
+            {
+                "name": "テストクリニック", "url": "https://test.com",
+                "address": "東京都新宿区西新宿1-1-1", "phone": "03-1234-5678",
+                "rating": 4.5, "reviews": 120,
+            },
+            {
+                "name": "URLなしクリニック", "url": None, "address": None,
+                "phone": None, "rating": None, "reviews": None,
+            },
+        ]
+
+    def test_parse_search_response_unexpected_structure(self):
+        """想定と異なる構造はValueError"""
+        with pytest.raises(ValueError):
+            google_maps._parse_search_response(")]}'\n{}")
+        with pytest.raises(ValueError):
+            google_maps._parse_search_response("<html></html>")
+
+    def test_record_pb_template(self, pb_template):
+        """検索結果XHRのpbパラメータだけを記録"""
+        google_maps._record_pb_template(MagicMock(url="https://www.google.com/maps/vt?pb=tile"))
+        assert google_maps._load_pb_template() is None
+
+        google_maps._record_pb_template(
+            MagicMock(url="https://www.google.com/search?tbm=map&q=x&pb=!1m2!2d139")
+        )
+
+        assert pb_template.read_text(encoding="utf-8") == "!1m2!2d139"
+        assert google_maps._load_pb_template() == "!1m2!2d139"
+
+    def test_search_via_http(self, pb_template):
+        """記録済みのpbでHTTPから取得し、失敗時はNoneでブラウザに任せる"""
+        scraper = GoogleMapsScraper()
+        assert asyncio.run(scraper._search_via_http("新宿 AGA", 50)) is None
+
+        pb_template.write_text("!1m2", encoding="utf-8")
+        context = MagicMock()
+        response = AsyncMock(ok=True)
+        response.text.return_value = ")]}'\n" + json.dumps(
+            [[None, [[None] * 14 + [self._place("テストクリニック", address="東京都新宿区西新宿1-1-1")]]]]
+        )
+        context.request.get = AsyncMock(return_value=response)
+        with patch.object(google_maps._browser_pool, "acquire", new=AsyncMock(return_value=context)), \
+                patch.object(google_maps._browser_pool, "release") as mock_release:
+            rows = asyncio.run(scraper._search_via_http("新宿 AGA", 50))
+
+            assert [(r["name"], r["area"]) for r in rows] == [("テストクリニック", "東京都新宿区")]
+            assert "pb=%211m2" in context.request.get.await_args.args[0]
+
+            response.text.return_value = "<html></html>"
+            assert asyncio.run(scraper._search_via_http("新宿 AGA", 50)) is None
+        assert mock_release.call_count == 2
+
+
+class TestExtractArea:
+    """住所からの地域抽出のテスト"""
+
+    @pytest.mark.parametrize(
+        "address, area",
+        [
+            ("東京都新宿区西新宿1-1-1", "東京都新宿区"),
+            ("東京都新宿区市谷本村町5-1", "東京都新宿区"),
+            ("東京都八王子市旭町1-1", "東京都八王子市"),
+            ("日本、〒160-0023 東京都新宿区西新宿1-1-1", "東京都新宿区"),
+            ("神奈川県横浜市中区本町1-1", "神奈川県横浜市中区"),
+            ("北海道虻田郡ニセコ町1-1", ""),
+            (None, ""),
+        ],
+    )
+    def test_extract_area(self, address, area):
+        """区名を優先し、なければ市名を返す"""
+        assert GoogleMapsScraper()._extract_area(address) == area
+
+
+class TestScrollResults:
+    """検索結果のスクロールのテスト"""
+
+    def test_scroll_results_in_single_evaluate(self):
+        """スクロールと件数の確認は1回のevaluateで行う"""
+        page = AsyncMock()
+        page.evaluate.return_value = 20
+
+        asyncio.run(GoogleMapsScraper()._scroll_results(page, max_results=50))
+
+        page.evaluate.assert_awaited_once_with(google_maps.SCROLL_RESULTS_JS, 50)
+        page.query_selector_all.assert_not_awaited()
+        page.wait_for_function.assert_not_awaited()
@@ -69,7 +69,7 @@ class TestSheetsWriter:
         mock_sheet = MagicMock()
 
         # 既存データなし（ヘッダー行のみ）
-        mock_sheet.get_all_values.return_value = [
+        mock_sheet.get_values.return_value = [
             ["No.", "クリニック名", "公式サイトURL"]
         ]
         mock_sheet.row_count = 1
@@ -92,7 +92,7 @@ class TestSheetsWriter:
             count = writer.append(clinics)
 
             assert count == 1
-            mock_sheet.update.assert_called_once()
+            mock_sheet.append_rows.assert_called_once()
 
     def test_append_duplicate_url(self, writer, mock_config):
         """URL重複時の追記"""
@@ -100,8 +100,8 @@ class TestSheetsWriter:
         mock_spreadsheet = MagicMock()
         mock_sheet = MagicMock()
 
-        # 既存データにURLあり（get_all_valuesはリストのリストを返す）
-        mock_sheet.get_all_values.return_value = [
+        # 既存データにURLあり（get_valuesはリストのリストを返す）
+        mock_sheet.get_values.return_value = [
             ["No.", "クリニック名", "公式サイトURL"],  # ヘッダー行
             ["1", "既存クリニック", "https://existing.com"],  # データ行
         ]
@@ -127,7 +127,7 @@ class TestSheetsWriter:
             count = writer.append(clinics)
 
             assert count == 1  # 重複を除いた1件のみ追加
-            mock_sheet.update.assert_called_once()
+            mock_sheet.append_rows.assert_called_once()
 
     def test_append_skip_no_url(self, writer, mock_config):
         """URLがないクリニックはスキップ"""
@@ -135,7 +135,7 @@ class TestSheetsWriter:
         mock_spreadsheet = MagicMock()
         mock_sheet = MagicMock()
 
-        mock_sheet.get_all_values.return_value = [
+        mock_sheet.get_values.return_value = [
             ["No.", "クリニック名", "公式サイトURL"],  # ヘッダー行のみ
         ]
         mock_sheet.row_count = 1
@@ -160,7 +160,112 @@ class TestSheetsWriter:
             count = writer.append(clinics)
 
             assert count == 1  # URLありの1件のみ追加
-            mock_sheet.update.assert_called_once()
+            mock_sheet.append_rows.assert_called_once()
+
+    def test_append_reads_sheet_once(self, writer, mock_config):
+        """2回目以降の追記はシートを読み直さず、挿入位置はSheets APIに任せて追記する"""
+        mock_client = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.get_values.return_value = [
+            ["No.", "クリニック名", "公式サイトURL"],
+            ["1", "既存クリニック", "https://existing.com"],
+        ]
+        mock_client.open_by_key.return_value.worksheet.return_value = mock_sheet
+
+        with patch.object(writer, "_get_client", return_value=mock_client):
+            assert writer.append([{"name": "A", "url": "https://a.com"}]) == 1
+            assert writer.append([
+                {"name": "A", "url": "https://a.com"},
+                {"name": "B", "url": "https://b.com"},
+            ]) == 1
+
+        mock_sheet.get_values.assert_called_once_with("A:C")
+        mock_client.open_by_key.assert_called_once()
+        mock_sheet.update.assert_not_called()
+        first, second = mock_sheet.append_rows.call_args_list
+        assert first.args[0][0][:2] == [2, "A"]
+        assert second.args[0][0][:2] == [3, "B"]
+        assert second.kwargs == {
+            "value_input_option": "USER_ENTERED",
+            "insert_data_option": "INSERT_ROWS",
+            "table_range": "A1",
+        }
+
+    def test_load_existing_urls_shared_with_append(self, writer, mock_config):
+        """保存済みURLの読み込み結果はappendと共有され、追記分も反映される"""
+        mock_client = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.get_values.return_value = [
+            ["No.", "クリニック名", "公式サイトURL"],
+            ["1", "既存クリニック", "https://existing.com"],
+        ]
+        mock_client.open_by_key.return_value.worksheet.return_value = mock_sheet
+
+        with patch.object(writer, "_get_client", return_value=mock_client):
+            existing = writer.load_existing_urls()
+            assert existing == {"https://existing.com"}
+
+            writer.append([{"name": "A", "url": "https://a.com"}])
+
+        mock_sheet.get_values.assert_called_once()
+        assert "https://a.com" in existing
+
+    def test_failed_append_does_not_mark_urls_saved(self, writer, mock_config):
+        """書き込みに失敗したURLは、load_existing_urlsで返したsetに加えない"""
+        mock_client = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.get_values.return_value = [
+            ["No.", "クリニック名", "公式サイトURL"],
+            ["1", "既存クリニック", "https://existing.com"],
+        ]
+        mock_sheet.append_rows.side_effect = RuntimeError("write failed")
+        mock_client.open_by_key.return_value.worksheet.return_value = mock_sheet
+
+        with patch.object(writer, "_get_client", return_value=mock_client):
+            existing = writer.load_existing_urls()
+            with pytest.raises(RuntimeError):
+                writer.append([{"name": "A", "url": "https://a.com"}])
+
+        assert existing == {"https://existing.com"}
+
+    def test_take_pending_empties_queue(self, writer):
+        """append_batchedで溜めた分はtake_pending()でまとめて取り出す"""
+        assert writer.append_batched([{"name": "A", "url": "https://a.com"}]) == 1
+        assert writer.append_batched([{"name": "B", "url": "https://b.com"}]) == 2
+
+        assert [r["name"] for r in writer.take_pending()] == ["A", "B"]
+        assert writer.take_pending() == []
+
+    def test_client_shared_between_writers(self, mock_config):
+        """認証済みクライアントはライター間で共有され、認証は1回のみ"""
+        from app.services import sheets_writer
+
+        sheets_writer._client_cache.clear()
+        with patch("app.services.sheets_writer.Credentials"), \
+                patch("app.services.sheets_writer.gspread.authorize") as mock_authorize:
+            first = SheetsWriter()._get_client()
+            second = SheetsWriter()._get_client()
+
+        mock_authorize.assert_called_once()
+        assert first is second
+        sheets_writer._client_cache.clear()
+
+    def test_get_existing_count_uses_loaded_state(self, writer, mock_config):
+        """シートの状態を読み込み済みなら、追記分を含めた件数をAPIを呼ばずに返す"""
+        mock_client = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.get_values.return_value = [
+            ["No.", "クリニック名", "公式サイトURL"],
+            ["1", "既存クリニック", "https://existing.com"],
+        ]
+        mock_client.open_by_key.return_value.worksheet.return_value = mock_sheet
+
+        with patch.object(writer, "_get_client", return_value=mock_client):
+            writer.append([{"name": "A", "url": "https://a.com"}])
+            assert writer.get_existing_count() == 2
+
+        mock_sheet.get_all_records.assert_not_called()
+        mock_client.open_by_key.assert_called_once()
 
     def test_get_existing_count(self, writer, mock_config):
         """既存レコード数取得"""